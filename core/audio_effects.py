@@ -10,12 +10,68 @@ from pedalboard import (
     Pedalboard, Reverb, Delay, Chorus, Compressor,
     HighpassFilter, LowpassFilter, PeakFilter
 )
+from pedalboard.io import AudioFile
 from pathlib import Path
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Akış blok boyutu: 8192 stereo float32 örnek = 64 KB (cache'te kalır)
+CHAIN_BLOCK_SIZE = 8192
+
+
+class FusedEffectChain:
+    """
+    Efekt zincirini tek Pedalboard'da birleştirir ve blok blok işler
+    Her blok tüm efektlerden geçtikten sonra sıradakine geçilir; reverb kuyruğu,
+    delay hattı ve filtre durumları bloklar arasında korunur (reset=False)
+    """
+
+    ORDER = ('compressor', 'eq', 'chorus', 'echo', 'reverb')
+
+    def __init__(self, effects_config: dict, sample_rate: int):
+        self.sample_rate = sample_rate
+        plugins = []
+        for name in self.ORDER:
+            if name in effects_config:
+                plugins.extend(getattr(self, f"_{name}")(**effects_config[name]))
+        self.board = Pedalboard(plugins)
+
+    @staticmethod
+    def _compressor(threshold_db: float = -18, ratio: float = 3.5,
+                    attack_ms: float = 3.0, release_ms: float = 100.0) -> list:
+        return [Compressor(threshold_db=threshold_db, ratio=ratio,
+                           attack_ms=attack_ms, release_ms=release_ms)]
+
+    @staticmethod
+    def _eq(bass_gain: float = 0, mid_gain: float = 0, treble_gain: float = 0) -> list:
+        bands = ((100, bass_gain, 0.7), (1000, mid_gain, 1.0), (8000, treble_gain, 0.7))
+        return [PeakFilter(cutoff_frequency_hz=hz, gain_db=gain, q=q)
+                for hz, gain, q in bands if gain != 0]
+
+    @staticmethod
+    def _chorus(rate_hz: float = 1.0, depth: float = 0.25, mix: float = 0.5) -> list:
+        return [Chorus(rate_hz=rate_hz, depth=depth, centre_delay_ms=7.0,
+                       feedback=0.0, mix=mix)]
+
+    @staticmethod
+    def _echo(delay_seconds: float = 0.5, feedback: float = 0.4, mix: float = 0.5) -> list:
+        return [Delay(delay_seconds=delay_seconds, feedback=feedback, mix=mix)]
+
+    @staticmethod
+    def _reverb(room_size: float = 0.7, damping: float = 0.4, wet_level: float = 0.4) -> list:
+        return [Reverb(room_size=room_size, damping=damping, wet_level=wet_level,
+                       dry_level=1.0 - wet_level, width=1.0, freeze_mode=0.0)]
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """(kanal, örnek) bloğunu zincirden geçir - mono blok stereo'ya açılır"""
+        if block.ndim == 1:
+            block = np.stack([block, block], axis=0)
+        elif block.shape[0] == 1:
+            block = np.repeat(block, 2, axis=0)
+        return self.board(block, self.sample_rate, reset=False)
+
 
 class AudioEffects:
     """Profesyonel ses efektleri işleyicisi"""
@@ -40,16 +96,7 @@ class AudioEffects:
         try:
             logger.info(f"🎛️ Reverb uygulanıyor (STUDIO QUALITY)... (room={room_size}, wet={wet_level})")
 
-            board = Pedalboard([
-                Reverb(
-                    room_size=room_size,
-                    damping=damping,
-                    wet_level=wet_level,
-                    dry_level=1.0 - wet_level,
-                    width=1.0,  # Full stereo width
-                    freeze_mode=0.0  # Normal reverb (1.0 = infinite)
-                )
-            ])
+            board = Pedalboard(FusedEffectChain._reverb(room_size, damping, wet_level))
 
             # Stereo'ya çevir (gerekirse)
             if audio.ndim == 1:
@@ -75,13 +122,7 @@ class AudioEffects:
         try:
             logger.info(f"🎛️ Echo uygulanıyor... (delay={delay_seconds}s, feedback={feedback})")
 
-            board = Pedalboard([
-                Delay(
-                    delay_seconds=delay_seconds,
-                    feedback=feedback,
-                    mix=mix
-                )
-            ])
+            board = Pedalboard(FusedEffectChain._echo(delay_seconds, feedback, mix))
 
             if audio.ndim == 1:
                 audio = np.stack([audio, audio], axis=0)
@@ -106,15 +147,7 @@ class AudioEffects:
         try:
             logger.info(f"🎛️ Chorus uygulanıyor... (rate={rate_hz}Hz)")
 
-            board = Pedalboard([
-                Chorus(
-                    rate_hz=rate_hz,
-                    depth=depth,
-                    centre_delay_ms=7.0,
-                    feedback=0.0,
-                    mix=mix
-                )
-            ])
+            board = Pedalboard(FusedEffectChain._chorus(rate_hz, depth, mix))
 
             if audio.ndim == 1:
                 audio = np.stack([audio, audio], axis=0)
@@ -141,14 +174,7 @@ class AudioEffects:
         try:
             logger.info(f"🎛️ Compressor uygulanıyor (VOKAL OPTIMIZED)... (threshold={threshold_db}dB, ratio={ratio}:1)")
 
-            board = Pedalboard([
-                Compressor(
-                    threshold_db=threshold_db,
-                    ratio=ratio,
-                    attack_ms=attack_ms,
-                    release_ms=release_ms
-                )
-            ])
+            board = Pedalboard(FusedEffectChain._compressor(threshold_db, ratio, attack_ms, release_ms))
 
             if audio.ndim == 1:
                 audio = np.stack([audio, audio], axis=0)
@@ -173,25 +199,7 @@ class AudioEffects:
         try:
             logger.info(f"🎛️ EQ uygulanıyor... (bass={bass_gain:+.1f}, mid={mid_gain:+.1f}, treble={treble_gain:+.1f})")
 
-            filters = []
-
-            # Bass (100 Hz low shelf)
-            if bass_gain != 0:
-                filters.append(
-                    PeakFilter(cutoff_frequency_hz=100, gain_db=bass_gain, q=0.7)
-                )
-
-            # Mid (1000 Hz peak)
-            if mid_gain != 0:
-                filters.append(
-                    PeakFilter(cutoff_frequency_hz=1000, gain_db=mid_gain, q=1.0)
-                )
-
-            # Treble (8000 Hz high shelf)
-            if treble_gain != 0:
-                filters.append(
-                    PeakFilter(cutoff_frequency_hz=8000, gain_db=treble_gain, q=0.7)
-                )
+            filters = FusedEffectChain._eq(bass_gain, mid_gain, treble_gain)
 
             if not filters:
                 logger.info("EQ değişikliği yok")
@@ -326,32 +334,24 @@ class AudioEffects:
             effects_config: {'reverb': {...}, 'eq': {...}, ...}
         """
         try:
-            # Audio yükle
-            audio, sr = librosa.load(audio_path, sr=self.sample_rate, mono=False)
-
             logger.info(f"🎛️ Efekt zinciri uygulanıyor: {list(effects_config.keys())}")
-
-            # Efektleri uygula
-            if 'compressor' in effects_config:
-                audio = self.apply_compressor(audio, **effects_config['compressor'])
-
-            if 'eq' in effects_config:
-                audio = self.apply_eq(audio, **effects_config['eq'])
-
-            if 'chorus' in effects_config:
-                audio = self.apply_chorus(audio, **effects_config['chorus'])
-
-            if 'echo' in effects_config:
-                audio = self.apply_echo(audio, **effects_config['echo'])
-
-            if 'reverb' in effects_config:
-                audio = self.apply_reverb(audio, **effects_config['reverb'])
+            chain = FusedEffectChain(effects_config, self.sample_rate)
 
             if 'noise_reduction' in effects_config:
+                # Spektral gating tüm sinyali ister - zincir yine tek geçişte uygulanır
+                audio, sr = librosa.load(audio_path, sr=self.sample_rate, mono=False)
+                audio = chain.process(audio)
                 audio = self.apply_noise_reduction(audio, **effects_config['noise_reduction'])
+                sf.write(output_path, audio.T if audio.ndim > 1 else audio, self.sample_rate)
+            else:
+                # Dosyayı blok blok oku -> işle -> yaz (tüm şarkı belleğe alınmaz)
+                # Çıkış kanal sayısı kaynağı izler; mono kaynak process() içinde stereo'ya açılır
+                with AudioFile(audio_path).resampled_to(self.sample_rate) as src, \
+                        sf.SoundFile(output_path, 'w', samplerate=self.sample_rate,
+                                     channels=max(src.num_channels, 2)) as dst:
+                    while src.tell() < src.frames:
+                        dst.write(chain.process(src.read(CHAIN_BLOCK_SIZE)).T)
 
-            # Kaydet
-            sf.write(output_path, audio.T if audio.ndim > 1 else audio, self.sample_rate)
             logger.info(f"✓ Efektli ses kaydedildi: {output_path}")
             return True
 
@@ -6,7 +6,8 @@ import numpy as np
 import librosa
 import soundfile as sf
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -50,12 +51,20 @@ class Track:
         except Exception as e:
             logger.error(f"Track yükleme hatası: {e}")
 
-    def get_audio(self, target_length: int = None) -> np.ndarray:
-        """İşlenmiş audio'yu al"""
-        if self.audio is None or self.mute:
-            return np.zeros((2, target_length or 1))
+    def channel_gains(self) -> np.ndarray:
+        """(sol, sağ) kanal kazançları - volume ve pan birlikte"""
+        left_gain = right_gain = self.volume
+
+        # Pan (stereo positioning)
+        if self.pan != 0:
+            left_gain *= 1.0 - max(0, self.pan)
+            right_gain *= 1.0 - max(0, -self.pan)
+
+        return np.array([left_gain, right_gain], dtype=np.float32)
 
-        audio = self.audio.copy()
+    def get_source(self, target_length: int = None) -> np.ndarray:
+        """Pitch uygulanmış, uzunluğu eşitlenmiş audio (volume/pan uygulanmaz)"""
+        audio = self.audio
 
         # Pitch shift
         if self.pitch_shift != 0:
@@ -65,16 +74,6 @@ class Track:
                 n_steps=self.pitch_shift
             )
 
-        # Volume
-        audio = audio * self.volume
-
-        # Pan (stereo positioning)
-        if self.pan != 0:
-            left_gain = 1.0 - max(0, self.pan)
-            right_gain = 1.0 - max(0, -self.pan)
-            audio[0] *= left_gain
-            audio[1] *= right_gain
-
         # Length matching
         if target_length:
             if audio.shape[1] < target_length:
@@ -87,6 +86,13 @@ class Track:
 
         return audio
 
+    def get_audio(self, target_length: int = None) -> np.ndarray:
+        """İşlenmiş audio'yu al"""
+        if self.audio is None or self.mute:
+            return np.zeros((2, target_length or 1))
+
+        return self.get_source(target_length) * self.channel_gains()[:, None]
+
 
 class AudioMixer:
     """Multi-track audio mixer"""
@@ -113,6 +119,31 @@ class AudioMixer:
         self.tracks = []
         logger.info("Tüm track'ler temizlendi")
 
+    def _map_tracks(self, fn, tracks: list) -> list:
+        """fn'i track'ler üzerinde paralel çalıştır (librosa/numpy FFT'leri GIL'i bırakır)"""
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(tracks)))) as executor:
+            return list(executor.map(fn, tracks))
+
+    def stack(self, length: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Çalınacak track'leri tek dizide topla
+        Returns: (S, gains) - S: (track, kanal, örnek), gains: (track, kanal)
+        """
+        # Mute/solo filtresi
+        has_solo = any(t.solo for t in self.tracks)
+        active = [t for t in self.tracks
+                  if t.audio is not None and not t.mute and (t.solo or not has_solo)]
+
+        S = np.zeros((len(active), 2, length), dtype=np.float32)
+        gains = np.zeros((len(active), 2), dtype=np.float32)
+
+        # Pitch shift'li track'ler paralel hazırlanır (librosa/numpy GIL'i bırakır)
+        for i, source in enumerate(self._map_tracks(lambda t: t.get_source(length), active)):
+            S[i] = source
+            gains[i] = active[i].channel_gains()
+
+        return S, gains
+
     def mix_tracks(self, output_path: str, normalize: bool = True) -> bool:
         """Track'leri karıştır ve kaydet"""
         try:
@@ -125,21 +156,9 @@ class AudioMixer:
             # En uzun track'i bul
             max_length = max(t.audio.shape[1] for t in self.tracks if t.audio is not None)
 
-            # Solo kontrolü
-            has_solo = any(t.solo for t in self.tracks)
-
-            # Mix
-            mixed = np.zeros((2, max_length))
-
-            for track in self.tracks:
-                if has_solo and not track.solo:
-                    continue  # Solo olmayan track'leri atla
-
-                track_audio = track.get_audio(max_length)
-                mixed += track_audio
-
-            # Master volume
-            mixed *= self.master_volume
+            # Mix: tüm track'ler tek vektörize toplamda (track başına Python geçişi yok)
+            S, gains = self.stack(max_length)
+            mixed = np.einsum('tc,tcn->cn', gains * self.master_volume, S)
 
             # Normalize (clipping prevention)
             if normalize:
@@ -170,21 +189,26 @@ class AudioMixer:
             if len(self.tracks) < 2:
                 return
 
-            ref_track = self.tracks[0]
-            ref_tempo, _ = librosa.beat.beat_track(y=ref_track.audio[0], sr=ref_track.sr)
+            # Tüm track'lerin temposu paralel analiz edilir, ilk track referans
+            tempos = self._map_tracks(
+                lambda t: librosa.beat.beat_track(y=t.audio[0], sr=t.sr)[0], self.tracks)
+            ref_tempo = tempos[0]
 
             logger.info(f"  Referans tempo: {ref_tempo:.1f} BPM")
 
             # Diğer track'leri time-stretch ile eşitle
-            for i, track in enumerate(self.tracks[1:], 1):
-                track_tempo, _ = librosa.beat.beat_track(y=track.audio[0], sr=track.sr)
-
+            jobs = []
+            for i, (track, track_tempo) in enumerate(zip(self.tracks[1:], tempos[1:]), 1):
                 if abs(track_tempo - ref_tempo) > 5:  # 5 BPM fark varsa
                     rate = track_tempo / ref_tempo
                     logger.info(f"  Track {i}: {track_tempo:.1f} -> {ref_tempo:.1f} BPM (rate={rate:.3f})")
+                    jobs.append((track, rate))
 
-                    # Time stretch
-                    track.audio = librosa.effects.time_stretch(track.audio, rate=rate)
+            # Time stretch (paralel)
+            stretched = self._map_tracks(
+                lambda job: librosa.effects.time_stretch(job[0].audio, rate=job[1]), jobs)
+            for (track, _), audio in zip(jobs, stretched):
+                track.audio = audio
 
             logger.info("✓ Tempo sync tamamlandı")
 
@@ -203,16 +227,21 @@ class AudioMixer:
             from core.music_analyzer import MusicAnalyzer
             analyzer = MusicAnalyzer()
 
-            # Referans track
-            ref_key = analyzer.detect_key(self.tracks[0].audio[0], self.tracks[0].sr)
+            # Tüm track'lerin anahtarı paralel tespit edilir, ilk track referans
+            keys = self._map_tracks(lambda t: analyzer.detect_key(t.audio[0], t.sr), self.tracks)
+            ref_key = keys[0]
             logger.info(f"  Referans key: {ref_key['key']} {ref_key['scale']}")
 
             # Diğer track'leri eşitle
-            key_map = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
+            key_map = analyzer.key_map
+            if ref_key['key'] not in key_map:
+                logger.warning("  Referans key tespit edilemedi")
+                return
             ref_idx = key_map.index(ref_key['key'])
 
-            for i, track in enumerate(self.tracks[1:], 1):
-                track_key = analyzer.detect_key(track.audio[0], track.sr)
+            for i, (track, track_key) in enumerate(zip(self.tracks[1:], keys[1:]), 1):
+                if track_key['key'] not in key_map:
+                    continue  # Tespit edilemedi - dokunma
                 track_idx = key_map.index(track_key['key'])
 
                 # Pitch shift hesapla
@@ -6,7 +6,8 @@ import sounddevice as sd
 import soundfile as sf
 import numpy as np
 import threading
-import queue
+import math
+from collections import deque
 from pathlib import Path
 from typing import Optional, Callable
 import logging
@@ -29,9 +30,12 @@ class AudioRecorder:
         self.channels = channels
         self.is_recording = False
         self.is_monitoring = False
-        self.audio_queue = queue.Queue()
+        # Seviye göstergesi için son bloklar: deque.append kilit almaz, dolunca eskiler düşer
+        self.audio_queue = deque(maxlen=32)
         self.recorded_frames = []
         self.stream = None
+        self.monitor_stream = None
+        self.monitor_thread = None
 
         # Real-time processing
         self.pitch_shift_semitones = 0
@@ -62,9 +66,10 @@ class AudioRecorder:
                 if status:
                     logger.warning(f"Kayıt hatası: {status}")
 
-                # Veriyi kuyruğa ekle
-                self.audio_queue.put(indata.copy())
-                self.recorded_frames.append(indata.copy())
+                # Tek kopya hem kayda hem seviye kuyruğuna (callback'te kilit yok)
+                block = indata.copy()
+                self.recorded_frames.append(block)
+                self.audio_queue.append(block)
 
                 # Real-time pitch shift (eğer aktifse)
                 if self.apply_realtime_pitch and self.pitch_shift_semitones != 0:
@@ -131,16 +136,120 @@ class AudioRecorder:
             logger.error(f"Kayıt durdurma hatası: {e}")
             return None
 
-    def start_monitoring(self, pitch_semitones: float = 0):
-        """Real-time monitoring başlat (kendi sesini duy)"""
-        self.is_monitoring = True
-        self.pitch_shift_semitones = pitch_semitones
-        self.apply_realtime_pitch = True
-        logger.info(f"🎧 Monitoring aktif (Pitch: {pitch_semitones:+.1f})")
+    def start_monitoring(self, pitch_semitones: float = 0,
+                         input_device: Optional[int] = None,
+                         output_device: Optional[int] = None,
+                         sample_rate: int = 48000,
+                         blocksize: int = 128,
+                         blocking: bool = False) -> bool:
+        """
+        Real-time monitoring başlat (kendi sesini duy)
+        Tek bir duplex stream: mikrofon (mono) -> hoparlör (stereo), ~3ms blok
+        blocking=True: callback yok, worker thread read()/write() yapar -
+        audio thread'inde Python çalışmaz (daha büyük buffer, takılmaya dayanıklı)
+        """
+        if self.monitor_stream is not None:
+            self.pitch_shift_semitones = pitch_semitones
+            return True
+
+        try:
+            self.pitch_shift_semitones = pitch_semitones
+
+            if blocking:
+                self.monitor_stream = sd.Stream(
+                    device=(input_device, output_device),
+                    samplerate=sample_rate,
+                    channels=(1, 2),
+                    blocksize=blocksize,
+                    dtype='float32',
+                    latency='high'
+                )
+                self.monitor_stream.start()
+
+                self.is_monitoring = True
+                self.apply_realtime_pitch = True
+                self.monitor_thread = threading.Thread(
+                    target=self._monitor_writer,
+                    args=(self.monitor_stream, blocksize),
+                    daemon=True
+                )
+                self.monitor_thread.start()
+                logger.info(f"🎧 Monitoring aktif (blocking I/O, Pitch: {pitch_semitones:+.1f}, {blocksize} örnek blok)")
+                return True
+
+            def monitor_callback(indata, outdata, frames, time_info, status):
+                if status:
+                    logger.warning(f"Monitor hatası: {status}")
+
+                # Pitch 0 ise direkt geçir (mono -> stereo broadcast, ek bellek yok)
+                if self.pitch_shift_semitones != 0:
+                    outdata[:] = self._realtime_pitch_shift(indata)
+                else:
+                    outdata[:] = indata
+
+            self.monitor_stream = sd.Stream(
+                device=(input_device, output_device),
+                samplerate=sample_rate,
+                channels=(1, 2),
+                callback=monitor_callback,
+                blocksize=blocksize,
+                dtype='float32',
+                latency='low'
+            )
+            self.monitor_stream.start()
+
+            self.is_monitoring = True
+            self.apply_realtime_pitch = True
+            latency_ms = blocksize / sample_rate * 1000
+            logger.info(f"🎧 Monitoring aktif (Pitch: {pitch_semitones:+.1f}, ~{latency_ms:.1f}ms blok)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Monitoring başlatma hatası: {e}")
+            self.monitor_stream = None
+            return False
+
+    def _monitor_writer(self, stream, blocksize: int):
+        """Blocking monitor döngüsü: mikrofon bloğunu oku, işle, hoparlöre yaz"""
+        try:
+            while self.is_monitoring:
+                block, _ = stream.read(blocksize)
+                if self.pitch_shift_semitones != 0:
+                    block = self._realtime_pitch_shift(block)
+                # Mono -> stereo (write C-contiguous buffer ister)
+                stream.write(np.repeat(block, 2, axis=1))
+        except sd.PortAudioError:
+            pass  # stop_monitoring içindeki abort() bekleyen read/write'ı keser
 
     def stop_monitoring(self):
         """Monitoring durdur"""
         self.is_monitoring = False
+
+        stream = self.monitor_stream
+        if stream is not None:
+            try:
+                # abort: bekleyen blocking read/write'ı hemen serbest bırakır
+                stream.abort()
+            except Exception as e:
+                logger.error(f"Monitoring durdurma hatası: {e}")
+
+        # close() writer thread çıktıktan sonra: canlı read/write altında PortAudio stream'i serbest bırakılmaz
+        writer_alive = False
+        if self.monitor_thread is not None:
+            self.monitor_thread.join(timeout=1.0)
+            writer_alive = self.monitor_thread.is_alive()
+            self.monitor_thread = None
+
+        if stream is not None:
+            if writer_alive:
+                logger.warning("Monitor thread'i durmadı, stream kapatılmadan bırakıldı")
+            else:
+                try:
+                    stream.close()
+                except Exception as e:
+                    logger.error(f"Monitoring durdurma hatası: {e}")
+            self.monitor_stream = None
+
         self.apply_realtime_pitch = False
         logger.info("🎧 Monitoring durduruldu")
 
@@ -159,16 +268,12 @@ class AudioRecorder:
             num_samples = int(len(audio_chunk) / shift_factor)
             shifted = signal.resample(audio_chunk, num_samples)
 
-            # Orijinal uzunluğa getir (padding/cropping)
+            # Orijinal uzunluğa getir: kısa kalırsa sonu sessiz (np.pad ara dizisi yok), uzunsa kırp
             if len(shifted) < len(audio_chunk):
-                # Pad
-                padding = len(audio_chunk) - len(shifted)
-                shifted = np.pad(shifted, ((0, padding), (0, 0)), mode='constant')
-            else:
-                # Crop
-                shifted = shifted[:len(audio_chunk)]
-
-            return shifted
+                out = np.zeros(audio_chunk.shape, dtype=audio_chunk.dtype)
+                out[:len(shifted)] = shifted
+                return out
+            return shifted[:len(audio_chunk)]
 
         except Exception as e:
             logger.error(f"Real-time pitch shift hatası: {e}")
@@ -177,9 +282,10 @@ class AudioRecorder:
     def get_input_volume(self) -> float:
         """Giriş seviyesini al (VU meter için)"""
         try:
-            if not self.audio_queue.empty():
-                chunk = self.audio_queue.get_nowait()
-                rms = np.sqrt(np.mean(chunk ** 2))
+            if self.audio_queue:
+                chunk = self.audio_queue.popleft().ravel()
+                # Nokta çarpımı: chunk**2 ara dizisi olmadan tek SIMD geçişi
+                rms = math.sqrt(float(chunk @ chunk) / chunk.size)
                 db = 20 * np.log10(rms + 1e-10)
                 # -60dB ile 0dB arası normalize et
                 normalized = (db + 60) / 60
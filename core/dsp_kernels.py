@@ -0,0 +1,65 @@
+"""
+DSP Kernels
+Blok tabanlı IIR filtre (biquad) - durum dizileri bloklar arasında taşınır
+"""
+import math
+import numpy as np
+
+# Numba (opsiyonel) - yoksa aynı döngüler saf Python olarak çalışır
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # nogil: audio/monitor thread'i çalışırken UI thread'i GIL beklemez
+    kernel = njit(cache=True, nogil=True, fastmath=True)
+else:
+    def kernel(func):
+        """Numba yoksa fonksiyonu olduğu gibi döndür"""
+        return func
+
+
+@kernel
+def biquad(x, y, s, b0, b1, b2, a1, a2):
+    """Transposed direct form II biquad - s = [z1, z2] yerinde güncellenir"""
+    z1 = s[0]
+    z2 = s[1]
+    for i in range(x.size):
+        xi = x[i]
+        yi = b0 * xi + z1
+        z1 = b1 * xi - a1 * yi + z2
+        z2 = b2 * xi - a2 * yi
+        y[i] = yi
+    s[0] = z1
+    s[1] = z2
+
+
+def peaking_coeffs(freq_hz: float, gain_db: float, q: float, sample_rate: int) -> tuple:
+    """RBJ peaking EQ katsayıları (b0, b1, b2, a1, a2) - a0'a normalize"""
+    a = 10 ** (gain_db / 40.0)
+    w0 = 2 * math.pi * freq_hz / sample_rate
+    alpha = math.sin(w0) / (2 * q)
+    cos_w0 = math.cos(w0)
+    a0 = 1 + alpha / a
+    return ((1 + alpha * a) / a0, -2 * cos_w0 / a0, (1 - alpha * a) / a0,
+            -2 * cos_w0 / a0, (1 - alpha / a) / a0)
+
+
+def highpass_coeffs(freq_hz: float, q: float, sample_rate: int) -> tuple:
+    """RBJ high-pass katsayıları (b0, b1, b2, a1, a2) - a0'a normalize"""
+    w0 = 2 * math.pi * freq_hz / sample_rate
+    alpha = math.sin(w0) / (2 * q)
+    cos_w0 = math.cos(w0)
+    a0 = 1 + alpha
+    return ((1 + cos_w0) / 2 / a0, -(1 + cos_w0) / a0, (1 + cos_w0) / 2 / a0,
+            -2 * cos_w0 / a0, (1 - alpha) / a0)
+
+
+def warmup_kernels():
+    """JIT derlemesini önceden yap (ilk ses bloğunda ~saniyelik takılma olmasın)"""
+    x = np.zeros(64, dtype=np.float32)
+    y = np.empty_like(x)
+    biquad(x, y, np.zeros(2), *peaking_coeffs(1000.0, 0.0, 1.0, 48000))
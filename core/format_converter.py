@@ -4,7 +4,8 @@ MP3, WAV, FLAC, OGG, M4A conversion + ID3 tags
 """
 from pathlib import Path
 import subprocess
-from pydub import AudioSegment
+from typing import Callable, Optional
+import mutagen
 from mutagen.easyid3 import EasyID3
 from mutagen.mp3 import MP3
 from mutagen.flac import FLAC
@@ -15,6 +16,12 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Toplu dönüştürmede tek ffmpeg sürecine verilen en fazla dosya (açık dosya/bellek sınırı)
+FFMPEG_BATCH_SIZE = 16
+
+# Kaynak bit derinliği -> WAV PCM codec'i (bilinmeyen/kayıplı kaynaklar 16-bit)
+PCM_CODECS = {8: 'pcm_u8', 16: 'pcm_s16le', 24: 'pcm_s24le', 32: 'pcm_s32le'}
+
 
 class FormatConverter:
     """Format dönüştürücü ve metadata editörü"""
@@ -29,8 +36,55 @@ class FormatConverter:
             'ultra': '320k'
         }
 
+    def _codec_args(self, target_format: str, quality: str, source_path=None) -> list:
+        """Hedef format için ffmpeg çıkış parametreleri (WAV'da kaynağın bit derinliği korunur)"""
+        if target_format == 'mp3':
+            return ['-c:a', 'libmp3lame', '-b:a', self.bitrate_options[quality], '-q:a', '0']  # Best quality VBR
+        if target_format == 'wav':
+            return ['-c:a', PCM_CODECS.get(self.get_bit_depth(source_path), 'pcm_s16le')]
+        if target_format == 'flac':
+            return ['-c:a', 'flac']  # FLAC is lossless, no bitrate
+        if target_format == 'ogg':
+            quality_map = {'low': '4', 'medium': '6', 'high': '8', 'ultra': '10'}
+            return ['-c:a', 'libvorbis', '-q:a', quality_map[quality]]
+        if target_format == 'm4a':
+            return ['-c:a', 'aac', '-b:a', self.bitrate_options[quality], '-f', 'mp4']
+        raise ValueError(f"Desteklenmeyen format: {target_format}")
+
+    def _run_ffmpeg(self, inputs: list, outputs: list,
+                    progress_callback: Optional[Callable[[float], None]] = None,
+                    duration: float = 0.0):
+        """
+        Tek ffmpeg süreci: N giriş -> N çıkış (i. giriş i. çıkışa map edilir)
+        Ses Python'a çözülmeden doğrudan ffmpeg içinde dönüştürülür;
+        -progress pipe:1 satırlarından ilerleme okunur
+        Args:
+            outputs: [(çıkış yolu, codec parametreleri), ...]
+        """
+        cmd = ['ffmpeg', '-hide_banner', '-nostats', '-loglevel', 'error', '-y', '-progress', 'pipe:1']
+        for path in inputs:
+            cmd += ['-i', str(path)]
+        for i, (path, codec_args) in enumerate(outputs):
+            cmd += ['-map', f'{i}:a:0', *codec_args, str(path)]
+
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, text=True)
+        for line in proc.stdout:
+            # out_time_ms da mikrosaniyedir (eski ffmpeg sürümleri)
+            key, _, value = line.strip().partition('=')
+            if progress_callback and duration > 0 and key in ('out_time_us', 'out_time_ms') and value.isdigit():
+                progress_callback(min(1.0, int(value) / 1e6 / duration))
+
+        errors = proc.stderr.read()
+        if proc.wait() != 0:
+            raise RuntimeError(errors.strip() or f"ffmpeg çıkış kodu: {proc.returncode}")
+
+        if progress_callback:
+            progress_callback(1.0)
+
     def convert(self, input_path: str, output_path: str,
-                target_format: str, quality: str = 'high') -> bool:
+                target_format: str, quality: str = 'high',
+                progress_callback: Optional[Callable[[float], None]] = None) -> bool:
         """
         Dosya formatını dönüştür
         Args:
@@ -38,40 +92,14 @@ class FormatConverter:
             output_path: Hedef dosya
             target_format: mp3, wav, flac, ogg, m4a
             quality: low, medium, high, ultra
+            progress_callback: 0.0-1.0 ilerleme (worker thread'den çağrılır)
         """
         try:
             logger.info(f"🔄 Dönüştürülüyor: {Path(input_path).name} -> {target_format}")
 
-            # Load audio
-            audio = AudioSegment.from_file(input_path)
-
-            # Export parameters
-            export_params = {}
-
-            if target_format == 'mp3':
-                export_params['format'] = 'mp3'
-                export_params['bitrate'] = self.bitrate_options[quality]
-                export_params['parameters'] = ['-q:a', '0']  # Best quality VBR
-
-            elif target_format == 'wav':
-                export_params['format'] = 'wav'
-
-            elif target_format == 'flac':
-                export_params['format'] = 'flac'
-                # FLAC is lossless, no bitrate
-
-            elif target_format == 'ogg':
-                export_params['format'] = 'ogg'
-                quality_map = {'low': '4', 'medium': '6', 'high': '8', 'ultra': '10'}
-                export_params['parameters'] = ['-q:a', quality_map[quality]]
-
-            elif target_format == 'm4a':
-                export_params['format'] = 'mp4'
-                export_params['bitrate'] = self.bitrate_options[quality]
-                export_params['codec'] = 'aac'
-
-            # Export
-            audio.export(output_path, **export_params)
+            duration = self.get_duration(input_path) if progress_callback else 0.0
+            self._run_ffmpeg([input_path], [(output_path, self._codec_args(target_format, quality, input_path))],
+                             progress_callback, duration)
 
             logger.info(f"✅ Dönüştürme tamamlandı: {output_path}")
             return True
@@ -80,6 +108,24 @@ class FormatConverter:
             logger.error(f"Dönüştürme hatası: {e}")
             return False
 
+    def get_duration(self, file_path: str) -> float:
+        """Süreyi başlıktan oku (ffprobe süreci başlatmadan)"""
+        try:
+            audio = mutagen.File(file_path)
+            return audio.info.length if audio is not None else 0.0
+        except Exception:
+            return 0.0
+
+    def get_bit_depth(self, file_path) -> int:
+        """Kaynağın bit derinliğini başlıktan oku (kayıplı formatlarda / okunamazsa 0)"""
+        if file_path is None:
+            return 0
+        try:
+            audio = mutagen.File(file_path)
+            return getattr(audio.info, 'bits_per_sample', 0) if audio is not None else 0
+        except Exception:
+            return 0
+
     def get_metadata(self, file_path: str) -> dict:
         """Metadata oku"""
         try:
@@ -163,12 +209,35 @@ class FormatConverter:
 
             logger.info(f"📁 {len(files)} dosya bulundu")
 
-            converted = 0
+            # Her ffmpeg süreci FFMPEG_BATCH_SIZE dosyayı birden dönüştürür (süreç başlatma maliyeti paylaşılır)
+            # Aynı çıkış yoluna düşen dosyalar (song.mp3 / song.flac) aynı sürece verilmez:
+            # sonraki gruba kayar, gruplar sırayla çalıştığı için eskisi gibi son dosya kazanır
+            batches = []
+            batch, batch_outputs = [], set()
             for file in files:
                 output_file = output_path / f"{file.stem}.{target_format}"
+                if len(batch) == FFMPEG_BATCH_SIZE or output_file in batch_outputs:
+                    batches.append(batch)
+                    batch, batch_outputs = [], set()
+                batch.append((file, output_file))
+                batch_outputs.add(output_file)
+            if batch:
+                batches.append(batch)
 
-                if self.convert(str(file), str(output_file), target_format, quality):
-                    converted += 1
+            converted = 0
+            for batch_items in batches:
+                batch = [file for file, _ in batch_items]
+                outputs = [(output_file, self._codec_args(target_format, quality, file))
+                           for file, output_file in batch_items]
+                try:
+                    self._run_ffmpeg(batch, outputs)
+                    converted += len(batch)
+                except Exception as e:
+                    # Bozuk bir dosya tüm grubu düşürür - bu grubu tek tek dene
+                    logger.warning(f"Toplu ffmpeg başarısız, dosya dosya deneniyor: {e}")
+                    for file, (output_file, _) in zip(batch, outputs):
+                        if self.convert(str(file), str(output_file), target_format, quality):
+                            converted += 1
 
             logger.info(f"✅ Toplu dönüştürme tamamlandı: {converted}/{len(files)}")
             return converted
@@ -183,13 +252,7 @@ class FormatConverter:
         try:
             logger.info(f"🔄 Bitrate değiştiriliyor: {target_bitrate}")
 
-            audio = AudioSegment.from_file(input_path)
-            audio.export(
-                output_path,
-                format='mp3',
-                bitrate=target_bitrate,
-                parameters=['-q:a', '0']
-            )
+            self._run_ffmpeg([input_path], [(output_path, ['-c:a', 'libmp3lame', '-b:a', target_bitrate, '-q:a', '0'])])
 
             logger.info(f"✅ Bitrate değiştirildi: {output_path}")
             return True
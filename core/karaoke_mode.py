@@ -213,12 +213,13 @@ class KaraokeMode:
             if sr_mic != self.sr:
                 mic = librosa.resample(mic, orig_sr=sr_mic, target_sr=self.sr)
 
-            # Stereo conversion
+            # Stereo conversion - mono iki kanala kopyasız broadcast görünümü (0 stride)
+            # (aşağıda yalnızca okunur: pad/çarpım/toplama yeni dizi üretir)
             if backing.ndim == 1:
-                backing = np.stack([backing, backing], axis=0)
+                backing = np.broadcast_to(backing, (2, len(backing)))
 
             if mic.ndim == 1:
-                mic = np.stack([mic, mic], axis=0)
+                mic = np.broadcast_to(mic, (2, len(mic)))
 
             # Length matching
             max_len = max(backing.shape[1], mic.shape[1])
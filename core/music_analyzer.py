@@ -2,17 +2,47 @@
 Advanced Music Analyzer
 BPM, Key, Chord detection, Genre classification, Note Transcription
 """
+import os
+import gc
 import librosa
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 import logging
+from collections import defaultdict
+from operator import itemgetter
 import crepe
 from pathlib import Path
 
+# Nota transkripsiyonu (opsiyonel) - Basic Pitch + pretty_midi
+try:
+    from basic_pitch.inference import predict
+    from basic_pitch import ICASSP_2022_MODEL_PATH
+    import pretty_midi
+    BASIC_PITCH_AVAILABLE = True
+except ImportError:
+    BASIC_PITCH_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# rotations[i] == np.roll(x, -i): 12 anahtar döndürmesi tek indeksleme ile
+KEY_ROTATIONS = (np.arange(12)[:, None] + np.arange(12)) % 12
+
+
+def row_correlations(rows: np.ndarray, profile: np.ndarray) -> np.ndarray:
+    """Her satırın profile ile Pearson korelasyonu (satır başına np.corrcoef yerine tek matris çarpımı)"""
+    r = rows - rows.mean(axis=1, keepdims=True)
+    p = profile - profile.mean()
+    return (r @ p) / (np.sqrt((r * r).sum(axis=1)) * np.sqrt(p @ p))
+
+
+def require_basic_pitch():
+    """Basic Pitch kurulu değilse anlaşılır bir hata ver"""
+    if not BASIC_PITCH_AVAILABLE:
+        raise RuntimeError("basic_pitch ve pretty_midi kurulu değil (pip install basic-pitch)")
+
+
 class MusicAnalyzer:
     """Profesyonel müzik analiz motoru"""
 
@@ -31,6 +61,9 @@ class MusicAnalyzer:
             'B': 'Si'
         }
 
+        # MIDI 0-127 -> (İngilizce, Türkçe) nota isimleri, ilk kullanımda doldurulur
+        self._note_name_table = None
+
     def get_turkish_note_name(self, note_name: str) -> str:
         """İngilizce nota ismini Türkçe'ye çevir (C4 -> Do4)"""
         # Nota ismini ayrıştır (örn: C#4 -> C#, 4)
@@ -40,6 +73,16 @@ class MusicAnalyzer:
         turkish = self.note_names_turkish.get(note_base, note_base)
         return f"{turkish}{octave}" if octave else turkish
 
+    def get_note_name_table(self) -> List[Tuple[str, str]]:
+        """MIDI numarası ile indekslenen (İngilizce, Türkçe) nota isimleri tablosu"""
+        if self._note_name_table is None:
+            require_basic_pitch()
+            self._note_name_table = [
+                (name, self.get_turkish_note_name(name))
+                for name in map(pretty_midi.note_number_to_name, range(128))
+            ]
+        return self._note_name_table
+
     def analyze_full(self, audio_path: str) -> Dict:
         """
         Tam müzik analizi
@@ -158,30 +201,23 @@ class MusicAnalyzer:
             major_profile = np.array([6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88])
             minor_profile = np.array([6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17])
 
-            # Her anahtar için korelasyon hesapla
-            major_correlations = []
-            minor_correlations = []
-
-            for i in range(12):
-                # Rotate chroma to match key
-                rotated = np.roll(chroma_vals, -i)
-
-                major_corr = np.corrcoef(rotated, major_profile)[0, 1]
-                minor_corr = np.corrcoef(rotated, minor_profile)[0, 1]
-
-                major_correlations.append(major_corr)
-                minor_correlations.append(minor_corr)
+            # Her anahtar için korelasyon hesapla (12 döndürme tek seferde)
+            rotations = chroma_vals[KEY_ROTATIONS]
+            major_correlations = row_correlations(rotations, major_profile)
+            minor_correlations = row_correlations(rotations, minor_profile)
 
             # En yüksek korelasyonu bul
-            max_major = max(major_correlations)
-            max_minor = max(minor_correlations)
+            major_idx = int(np.argmax(major_correlations))
+            minor_idx = int(np.argmax(minor_correlations))
+            max_major = major_correlations[major_idx]
+            max_minor = minor_correlations[minor_idx]
 
             if max_major > max_minor:
-                key_idx = major_correlations.index(max_major)
+                key_idx = major_idx
                 scale = 'major'
                 confidence = max_major
             else:
-                key_idx = minor_correlations.index(max_minor)
+                key_idx = minor_idx
                 scale = 'minor'
                 confidence = max_minor
 
@@ -316,9 +352,7 @@ class MusicAnalyzer:
             }
         """
         try:
-            from basic_pitch.inference import predict
-            from basic_pitch import ICASSP_2022_MODEL_PATH
-            import pretty_midi
+            require_basic_pitch()
 
             logger.info("🎹 Notalar çıkarılıyor (Basic Pitch)...")
 
@@ -333,7 +367,7 @@ class MusicAnalyzer:
             # Basic Pitch ile transcription (EN YÜKSEK KALITE AYARLARI)
             model_output, midi_data, note_events = predict(
                 audio_path,
-                ICASSP_2022_MODEL_PATH,
+                get_basic_pitch_model(),
                 onset_threshold=0.5,      # Daha hassas nota başlangıcı (0-1, default: 0.5)
                 frame_threshold=0.3,      # Daha hassas nota tespiti (0-1, default: 0.3)
                 minimum_note_length=127.70,  # Minimum nota süresi (ms, default: 127.70)
@@ -348,10 +382,10 @@ class MusicAnalyzer:
 
             # Notaları parse et
             notes_list = []
+            note_names = self.get_note_name_table()
             for instrument in midi_data.instruments:
                 for note in instrument.notes:
-                    note_name = pretty_midi.note_number_to_name(note.pitch)
-                    note_turkish = self.get_turkish_note_name(note_name)
+                    note_name, note_turkish = note_names[note.pitch]
                     notes_list.append({
                         'note': note_name,
                         'note_turkish': note_turkish,
@@ -362,16 +396,19 @@ class MusicAnalyzer:
                         'velocity': note.velocity
                     })
 
+            # Enstrümanlar arası sırayı tek seferde başlangıç zamanına göre düzelt
+            notes_list.sort(key=itemgetter('start'))
+
             # İstatistikler
             note_count = len(notes_list)
             duration = max([n['end'] for n in notes_list]) if notes_list else 0
 
             # En çok kullanılan notalar
-            note_freq = {}
+            note_freq = defaultdict(int)
             for n in notes_list:
-                note_freq[n['note']] = note_freq.get(n['note'], 0) + 1
+                note_freq[n['note']] += 1
 
-            top_notes = sorted(note_freq.items(), key=lambda x: x[1], reverse=True)[:10]
+            top_notes = sorted(note_freq.items(), key=itemgetter(1), reverse=True)[:10]
 
             logger.info(f"✓ {note_count} nota bulundu")
             logger.info(f"✓ MIDI kaydedildi: {midi_path}")
@@ -412,6 +449,7 @@ class MusicAnalyzer:
                 'text_file': str  # Kaydedilen metin dosyası
             }
         """
+        model = None
         try:
             import whisper
 
@@ -512,6 +550,14 @@ class MusicAnalyzer:
                 'success': False,
                 'error': str(e)
             }
+        finally:
+            if model is not None:
+                # Whisper large-v3 VRAM'de kalmasın (karaoke akışı / sonraki Demucs için)
+                import torch
+                del model
+                gc.collect()
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
 
     def detect_pitch_contour(self, audio_path: str) -> Dict:
         """
@@ -581,6 +627,96 @@ class MusicAnalyzer:
             return 0.0
 
 
+# Process başına bir kez yüklenen Basic Pitch modeli
+_basic_pitch_model = None
+
+
+def configure_tensorflow_gpu() -> str:
+    """
+    Basic Pitch (TensorFlow) için GPU ayarı - model yüklenmeden önce çağrılmalı
+    CUDA varsa tek GPU görünür yapılır ve VRAM ihtiyaç kadar büyütülür
+    Basic Pitch hazır (SavedModel/TFLite/ONNX) modeli yükler - Keras policy'si etkisizdir,
+    çıkarım her durumda float32 çalışır. Kullanılan cihazı döndürür ('GPU' veya 'CPU')
+    """
+    try:
+        import tensorflow as tf
+    except ImportError:
+        return "CPU"
+
+    gpus = []
+    try:
+        gpus = tf.config.list_physical_devices('GPU')
+        if not gpus:
+            logger.info("🎹 Basic Pitch: CPU, float32")
+            return "CPU"
+
+        tf.config.set_visible_devices(gpus[:1], 'GPU')
+        tf.config.experimental.set_memory_growth(gpus[0], True)
+        logger.info("🎹 Basic Pitch: GPU, float32")
+        return "GPU"
+
+    except (RuntimeError, ValueError) as e:
+        # TF runtime zaten başlatılmışsa cihaz ayarı değiştirilemez (GPU yine de kullanılır)
+        logger.warning(f"TensorFlow GPU ayarı uygulanamadı: {e}")
+        device = "GPU" if gpus else "CPU"
+        logger.info(f"🎹 Basic Pitch: {device}, float32")
+        return device
+
+
+def get_basic_pitch_model():
+    """
+    Basic Pitch modelini bir kez yükle ve tekrar kullan
+    Model sınıfı olmayan eski sürümlerde model yolu döner (predict her çağrıda yükler)
+    """
+    global _basic_pitch_model
+    if _basic_pitch_model is None:
+        require_basic_pitch()
+        configure_tensorflow_gpu()
+        try:
+            from basic_pitch.inference import Model
+            _basic_pitch_model = Model(ICASSP_2022_MODEL_PATH)
+        except ImportError:
+            _basic_pitch_model = ICASSP_2022_MODEL_PATH
+    return _basic_pitch_model
+
+
+
+def init_transcription_worker():
+    """
+    Transkripsiyon worker process'i başlatıcı
+    Birden fazla TensorFlow process'i aynı GPU'yu paylaşabilsin diye
+    tüm VRAM'i baştan ayırmak yerine ihtiyaç kadar büyüt
+    """
+    os.environ.setdefault("TF_FORCE_GPU_ALLOW_GROWTH", "true")
+
+
+def predict_stem_notes(audio_path: str, midi_path: str) -> List[Tuple[int, float, float]]:
+    """
+    Tek bir stem için Basic Pitch transkripsiyonu (ProcessPoolExecutor worker'ı)
+    MIDI dosyasını yazar ve notaları (pitch, start, end) olarak döndürür
+    Modül seviyesinde tanımlı - process'ler arası pickle edilebilir
+    """
+    # Basic Pitch ile transcription (EN YÜKSEK KALITE)
+    model_output, midi_data, note_events = predict(
+        audio_path,
+        get_basic_pitch_model(),
+        onset_threshold=0.5,
+        frame_threshold=0.3,
+        minimum_note_length=127.70,
+        minimum_frequency=None,
+        maximum_frequency=None,
+        multiple_pitch_bends=True,
+        melodia_trick=True
+    )
+    midi_data.write(str(midi_path))
+
+    return [
+        (note.pitch, note.start, note.end)
+        for instrument in midi_data.instruments
+        for note in instrument.notes
+    ]
+
+
 if __name__ == "__main__":
     # Test
     analyzer = MusicAnalyzer()
@@ -3,18 +3,48 @@ Musicio ULTRA - Professional Audio Studio
 All-in-one professional audio production suite
 """
 import customtkinter as ctk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, TclError
 import threading
 import sys
 import os
 from pathlib import Path
+from functools import partial
+from collections import deque
+from itertools import islice
+import heapq
 import numpy as np
-from PIL import Image
 import time
-import pygame
+import math
 import json
+import re
+import hashlib
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import sounddevice as sd
+import soundfile as sf
 from typing import Tuple
 
+# Hızlı JSON (opsiyonel) - yoksa stdlib json kullanılır
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Sistem monitörü (opsiyonel) - yoksa RAM göstergesi güncellenmez
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Hızlı resampler (opsiyonel) - yoksa librosa kullanılır
+try:
+    import soxr
+    SOXR_AVAILABLE = True
+except ImportError:
+    SOXR_AVAILABLE = False
+
 # Proje kök dizinini ekle
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -22,36 +52,145 @@ from models.model_manager import ModelManager
 from core.pitch_shifter import PitchShifter
 from core.audio_recorder import AudioRecorder
 from core.audio_effects import AudioEffects
-from core.music_analyzer import MusicAnalyzer
-from core.visualizer import AudioVisualizer
 from core.batch_processor import BatchProcessor
 from core.audio_mixer import AudioMixer
 from core.format_converter import FormatConverter
 from core.karaoke_mode import KaraokeMode
+from core.dsp_kernels import biquad, highpass_coeffs, peaking_coeffs, warmup_kernels
 from gui.vu_meter import VUMeter
 from utils.lyrics_converter import convert_lyrics_txt_to_json
 from utils.language import get_text as _, set_language, get_current_language
 
+# Slider değeri -> renk tablosu (yeşil -> kırmızı), olay başına hex hesaplaması yapılmaz
+SLIDER_COLOR_LUT = [f"#{int(255 * t):02x}{int(180 * (1 - t)):02x}00" for t in (i / 1023 for i in range(1024))]
+
+# Kullanım yüzdesi (0-100) -> renk: <50 yeşil, <80 sarı, üstü kırmızı
+LOAD_COLOR_LUT = ["#10b981"] * 50 + ["#f59e0b"] * 30 + ["#ef4444"] * 21
+
+# Backing track taramasında atlanan klasörler (ayrıca "." ile başlayan tüm klasörler)
+BACKING_SCAN_SKIP_DIRS = frozenset({"venv", "env", "__pycache__", "node_modules", "site-packages", "cache"})
+
+# Alt klasörlere en fazla bu derinliğe kadar inilir
+BACKING_SCAN_MAX_DEPTH = 3
+
+# Cihaz menüsü etiketi "[ID] Ad" biçiminde
+DEVICE_ID_RE = re.compile(r'\[(\d+)\]')
+
 
 class MusicioUltraApp(ctk.CTk):
     """Ultra profesyonel ses stüdyosu"""
 
+    # Karaoke efekt kartları: (anahtar, başlık, varsayılan, maksimum, format,
+    #                          kenar/progress rengi, buton rengi, hover rengi, kenar kalınlığı)
+    EFFECT_SPECS = [
+        ("reverb", "🌊 Reverb (Room)", 0.3, 1, "{:.2f}",
+         ("#3b82f6", "#2563eb"), ("#60a5fa", "#3b82f6"), ("#93c5fd", "#60a5fa"), 1),
+        ("echo", "📢 Echo (Delay)", 0.2, 1, "{:.2f}",
+         ("#8b5cf6", "#7c3aed"), ("#a78bfa", "#8b5cf6"), ("#c4b5fd", "#a78bfa"), 1),
+        ("volume", "🔊 Ses Seviyesi", 1.0, 2, "{:.2f}x",
+         ("#10b981", "#059669"), ("#34d399", "#10b981"), ("#6ee7b7", "#34d399"), 1),
+        ("autotune", "🎵 Autotune", 0.0, 1, "{:.0%}",
+         ("#f59e0b", "#d97706"), ("#fbbf24", "#f59e0b"), ("#fcd34d", "#fbbf24"), 2),
+        ("deesser", "✂️ De-esser (Sibilans)", 0.0, 1, "{:.0%}",
+         ("#ec4899", "#db2777"), ("#f472b6", "#ec4899"), ("#f9a8d4", "#f472b6"), 1),
+    ]
+
+    # Karaoke preset'leri: ad -> efekt değerleri (EFFECT_SPECS anahtarları) + açıklama
+    KARAOKE_PRESETS = {
+        "🎙️ Radio Ready": {
+            "reverb": 0.25,
+            "echo": 0.15,
+            "volume": 1.1,
+            "autotune": 0.5,
+            "deesser": 0.6,
+            "description": "Radyo yayını için optimize edilmiş (hafif efektler, net vokal)"
+        },
+        "🎸 Studio Recording": {
+            "reverb": 0.35,
+            "echo": 0.2,
+            "volume": 1.0,
+            "autotune": 0.7,
+            "deesser": 0.5,
+            "description": "Profesyonel stüdyo kaydı (dengeli, kaliteli)"
+        },
+        "🎤 Live Performance": {
+            "reverb": 0.5,
+            "echo": 0.3,
+            "volume": 1.2,
+            "autotune": 0.3,
+            "deesser": 0.4,
+            "description": "Canlı performans (güçlü reverb, enerji)"
+        },
+        "💿 Podcast": {
+            "reverb": 0.1,
+            "echo": 0.0,
+            "volume": 1.15,
+            "autotune": 0.0,
+            "deesser": 0.7,
+            "description": "Podcast/konuşma (minimal efekt, net ses)"
+        },
+        "🎵 Rap/Hip-Hop": {
+            "reverb": 0.2,
+            "echo": 0.4,
+            "volume": 1.3,
+            "autotune": 0.8,
+            "deesser": 0.5,
+            "description": "Rap/Hip-Hop (güçlü autotune, echo)"
+        },
+        "🎸 Rock Vokal": {
+            "reverb": 0.6,
+            "echo": 0.25,
+            "volume": 1.4,
+            "autotune": 0.2,
+            "deesser": 0.3,
+            "description": "Rock/Metal vokal (çok reverb, ham enerji)"
+        }
+    }
+
     def __init__(self):
         super().__init__()
 
+        # Ortak fontlar: her widget için yeni Tk named-font yaratmak yerine tek örnek
+        self.fonts = {
+            "title_xl": ctk.CTkFont(size=26, weight="bold"),
+            "title_lg": ctk.CTkFont(size=24, weight="bold"),
+            "title_md": ctk.CTkFont(size=20, weight="bold"),
+            "title_sm": ctk.CTkFont(size=18, weight="bold"),
+            "heading": ctk.CTkFont(size=16, weight="bold"),
+            "heading_plain": ctk.CTkFont(size=16),
+            "label": ctk.CTkFont(size=14, weight="bold"),
+            "body": ctk.CTkFont(size=14),
+            "label_sm": ctk.CTkFont(size=13, weight="bold"),
+            "body_md": ctk.CTkFont(size=13),
+            "value": ctk.CTkFont(size=12, weight="bold"),
+            "body_sm": ctk.CTkFont(size=12),
+            "small_bold": ctk.CTkFont(size=11, weight="bold"),
+            "caption": ctk.CTkFont(size=10),
+            "tiny": ctk.CTkFont(size=9),
+        }
+
         # Global değişkenler
         self.model_manager = None
         self.pitch_shifter = None
         self.input_file = None
+        self.input_path = None  # input_file'ın önbelleklenmiş Path hali
         self.output_file = None
         self.is_processing = False
         self.models_loaded = {"demucs": False, "audiosr": False}
+        self._demucs_lock = threading.Lock()  # Eşzamanlı butonlardan çift yüklemeyi engelle
+
+        # Slider sürüklerken UI güncellemelerini birleştir (kare başına tek redraw)
+        self._pending_ui_updates = {}
+        self._ui_update_after_ids = {}
+
+        # Thread'lerden gelen log satırları, Tk ana thread'inde toplu yazılır
+        self._log_queue = deque()
 
         # Yeni modüller
         self.recorder = AudioRecorder()
         self.audio_effects = AudioEffects()
-        self.music_analyzer = MusicAnalyzer()
-        self.visualizer = AudioVisualizer()
+        self.music_analyzer = None  # İlk kullanımda oluşturulur (librosa/crepe yükü)
+        self.visualizer = None  # İlk kullanımda oluşturulur (matplotlib yükü)
         self.batch_processor = BatchProcessor()
         self.audio_mixer = AudioMixer()
         self.format_converter = FormatConverter()
@@ -59,17 +198,45 @@ class MusicioUltraApp(ctk.CTk):
 
         # Karaoke state
         self.karaoke_backing_track = None  # Oluşturulan backing track yolu
+        self.karaoke_lyrics_path = None  # Backing track'e ait sözler (None: yanındaki .lyrics.json)
         self.karaoke_file = None  # Seçilen şarkı dosyası
         self.karaoke_output_folder = None  # Çıkış klasörü
+        self._karaoke_stop = threading.Event()  # Karaoke durdurma sinyali (bekleyen thread'i uyandırır)
+
+        # Karaoke FX işleme blok boyutu (stream bloğunun katı; büyük = daha az CPU, +gecikme)
+        self.karaoke_fx_blocksize = 256
+        # 48kHz'e resample edilmiş backing track önbelleği (.npy, memmap ile açılır)
+        # Kullanıcı başına önbellek: Windows'ta %LOCALAPPDATA%, diğerlerinde $XDG_CACHE_HOME veya ~/.cache
+        cache_root = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+        self.karaoke_cache_dir = (Path(cache_root) if cache_root else Path.home() / ".cache") / "musicio" / "karaoke"
 
         # Config file path
         self.config_file = Path("musicio_config.json")
+        self._save_config_after_id = None
+
+        # Worker thread durum güncellemeleri: anahtar -> en son çağrı (_drain_ui_posts uygular)
+        self._ui_posts = {}
+
+        # Ses cihazı taraması önbelleği: (host API anahtarı, (mikrofonlar, hoparlörler))
+        self._device_cache = None
+        self._karaoke_device_traces = False  # Karaoke cihaz seçimi -> save_config trace'leri eklendi mi
+
+        # Backing track taraması: klasör -> (mtime, alt klasörler, dosyalar), son çizilen satırlar
+        self._backing_dir_cache = {}
+        self._backing_track_rows = None
+        self._backing_scan_running = False
+        # Yeniden kullanılan backing track kartları (yenilemede yalnızca metin + yol güncellenir)
+        self._bt_card_pool = []
+        self._bt_status_label = None
 
         # Load saved settings
         self.load_config()
+        # Karaoke sekmesi henüz kurulmamış olsa da kayıtlı klasör kullanılabilsin
+        self.karaoke_output_folder = self.saved_output_folder
 
-        # Audio player
-        pygame.mixer.init()
+        # Audio player (sounddevice stream, soundfile'dan blok blok okur)
+        self._player_file = None
+        self._player_stream = None
         self.is_playing = False
         self.current_playing_file = None
 
@@ -98,8 +265,19 @@ class MusicioUltraApp(ctk.CTk):
         # Model yöneticisini başlat
         self.initialize_models()
 
+        # DSP çekirdeklerini arka planda derle (karaoke başlarken JIT beklemesi olmasın)
+        threading.Thread(target=warmup_kernels, daemon=True).start()
+
+        # PortAudio host API taramasını arka planda yap (sekme açılınca cihaz listesi hazır)
+        threading.Thread(target=self._prime_device_cache, daemon=True).start()
+
         # Sistem monitörünü başlat
         self.start_system_monitor()
+        self._drain_log()
+        self._drain_ui_posts()
+
+        # Kapanırken bekleyen config yazımını tamamla
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
     def create_ui(self):
         """Ana UI yapısı"""
@@ -197,8 +375,8 @@ class MusicioUltraApp(ctk.CTk):
         main_container.grid_columnconfigure(0, weight=1)
         main_container.grid_rowconfigure(0, weight=1)
 
-        # TabView oluştur
-        self.tabview = ctk.CTkTabview(main_container, height=800)
+        # TabView oluştur (sekme değişince ağır sekmeler ilk görüntülemede kurulur)
+        self.tabview = ctk.CTkTabview(main_container, height=800, command=self._on_tab_changed)
         self.tabview.grid(row=0, column=0, sticky="nsew")
 
         # Tab'ları ekle
@@ -219,9 +397,28 @@ class MusicioUltraApp(ctk.CTk):
         self.create_analyzer_tab()
         self.create_visualizer_tab()
         self.create_batch_tab()
-        self.create_mixer_tab()
-        self.create_karaoke_tab()
-        self.create_converter_tab()
+
+        # Mixer / Karaoke / Converter: widget ağacı büyük, ilk açılışta kurulur
+        self._lazy_tab_builders = {
+            "🎵 Audio Mixer": self.create_mixer_tab,
+            "🎧 Karaoke Mode": self.create_karaoke_tab,
+            "🔄 Format Converter": self.create_converter_tab,
+        }
+
+    def _on_tab_changed(self):
+        """Seçilen sekme henüz kurulmadıysa şimdi kur"""
+        self._build_tab(self.tabview.get())
+
+    def _build_tab(self, name):
+        """Tembel sekmeyi bir kez oluştur"""
+        builder = self._lazy_tab_builders.pop(name, None)
+        if builder is not None:
+            builder()
+
+    def show_tab(self, name):
+        """Sekmeye geç (gerekirse önce içeriğini kur)"""
+        self._build_tab(name)
+        self.tabview.set(name)
 
     def create_pitch_shifter_tab(self):
         """Pitch Shifter tab (orijinal özellik)"""
@@ -270,7 +467,7 @@ class MusicioUltraApp(ctk.CTk):
 
         for text, value, color in btn_specs:
             ctk.CTkButton(quick_btns, text=text, width=90, height=35, fg_color=color,
-                         command=lambda v=value: self.quick_pitch(v)).pack(side="left", padx=5)
+                         command=partial(self.quick_pitch, value)).pack(side="left", padx=5)
 
         # AI & Kalite Ayarları
         settings_frame = ctk.CTkFrame(tab)
@@ -396,9 +593,12 @@ class MusicioUltraApp(ctk.CTk):
 
         # Refresh devices button
         ctk.CTkButton(device_frame, text="🔄 Cihazları Yenile",
-                     command=self.refresh_audio_devices, height=35,
+                     command=partial(self.refresh_audio_devices, rescan=True), height=35,
                      font=ctk.CTkFont(size=12)).grid(row=1, column=0, columnspan=2, pady=10)
 
+        # Menüleri açılışta önbelleğe alınmış cihaz listesinden doldur
+        self.refresh_audio_devices()
+
         # VU Meter - Professional
         vu_frame = ctk.CTkFrame(tab, fg_color=("gray90", "gray20"), corner_radius=15)
         vu_frame.grid(row=2, column=0, padx=20, pady=15, sticky="ew")
@@ -458,6 +658,8 @@ class MusicioUltraApp(ctk.CTk):
         self.rec_pitch_label = ctk.CTkLabel(pitch_frame, text="0.0 semitones",
                                            font=ctk.CTkFont(size=13, weight="bold"), width=110)
         self.rec_pitch_label.pack(side="left", padx=5)
+        self.bind_throttled_label(self.rec_pitch_var, self.rec_pitch_label, "{:.1f} semitones")
+        self.rec_pitch_var.trace_add("write", lambda *args: setattr(self.recorder, 'pitch_shift_semitones', self.rec_pitch_var.get()))
 
         # Monitor switch
         monitor_frame = ctk.CTkFrame(effects_card, fg_color="transparent")
@@ -466,6 +668,7 @@ class MusicioUltraApp(ctk.CTk):
         self.monitor_var = ctk.BooleanVar(value=False)
         ctk.CTkSwitch(monitor_frame, text="🎧 Monitor (Kendi sesini duy)",
                      variable=self.monitor_var, font=ctk.CTkFont(size=13),
+                     command=self.toggle_monitor,
                      progress_color=self.colors["success"]).pack(anchor="w")
 
         # Recording info
@@ -512,7 +715,9 @@ class MusicioUltraApp(ctk.CTk):
                 slider_from = -20 if "dB" in param else 0
                 slider_to = 20 if "dB" in param else (10 if "Ratio" in param else 1)
                 ctk.CTkSlider(param_frame, from_=slider_from, to=slider_to, variable=var, width=300).pack(side="left", padx=10)
-                ctk.CTkLabel(param_frame, textvariable=var, width=60).pack(side="left")
+                value_label = ctk.CTkLabel(param_frame, width=60)
+                value_label.pack(side="left")
+                self.bind_throttled_label(var, value_label, "{:.2f}", color_range=(slider_from, slider_to))
 
         # Apply button
         ctk.CTkButton(tab, text="✨ EFEKTLERİ UYGULA", command=self.apply_effects, height=60, font=ctk.CTkFont(size=18, weight="bold"), fg_color=self.colors["success"]).pack(pady=20)
@@ -628,7 +833,7 @@ class MusicioUltraApp(ctk.CTk):
         viz_types = ["Waveform", "Spectrogram", "Mel Spectrogram", "Chromagram"]
 
         for viz_type in viz_types:
-            ctk.CTkButton(viz_options, text=f"📈 {viz_type}", command=lambda vt=viz_type: self.generate_visualization(vt), width=180).pack(side="left", padx=10)
+            ctk.CTkButton(viz_options, text=f"📈 {viz_type}", command=partial(self.generate_visualization, viz_type), width=180).pack(side="left", padx=10)
 
         # Görsel gösterim alanı
         self.viz_display = ctk.CTkLabel(tab, text="Görselleştirme burada görünecek...")
@@ -696,6 +901,49 @@ class MusicioUltraApp(ctk.CTk):
 
     # === METODLAR ===
 
+    def get_music_analyzer(self):
+        """MusicAnalyzer'ı ilk kullanımda oluştur (ağır import'lar açılışı yavaşlatmasın)"""
+        if self.music_analyzer is None:
+            from core.music_analyzer import MusicAnalyzer
+            self.music_analyzer = MusicAnalyzer(self.model_manager)
+        return self.music_analyzer
+
+    def get_visualizer(self):
+        """AudioVisualizer'ı ilk kullanımda oluştur"""
+        if self.visualizer is None:
+            from core.visualizer import AudioVisualizer
+            self.visualizer = AudioVisualizer()
+        return self.visualizer
+
+    def _ensure_demucs(self) -> bool:
+        """Demucs'u en fazla bir kez yükle, yüklüyse hemen dön"""
+        with self._demucs_lock:
+            if not self.models_loaded.get("demucs"):
+                if self.model_manager.load_demucs() is None:
+                    return False
+                self.models_loaded["demucs"] = True
+            return True
+
+    def _demucs_done(self, ok):
+        """Demucs yükleme sonucu (Tk ana thread'inde)"""
+        if ok:
+            self.demucs_status.configure(text="🟢 Demucs: Hazır")
+            self.models_loaded["demucs"] = True
+            self.add_log("✓ Demucs modeli hazır")
+        else:
+            self.demucs_status.configure(text="🔴 Demucs: Hata")
+            self.add_log("⚠️ Demucs yüklenemedi")
+
+    def _audiosr_done(self, ok):
+        """AudioSR yükleme sonucu (Tk ana thread'inde)"""
+        if ok:
+            self.audiosr_status.configure(text="🟢 AudioSR: Hazır")
+            self.models_loaded["audiosr"] = True
+            self.add_log("✓ AudioSR modeli hazır")
+        else:
+            self.audiosr_status.configure(text="🔴 AudioSR: Opsiyonel")
+            self.add_log("⚠️ AudioSR yüklenemedi (opsiyonel)")
+
     def initialize_models(self):
         """Model başlatma"""
         def init():
@@ -717,37 +965,34 @@ class MusicioUltraApp(ctk.CTk):
             # Modelleri arka planda yükle
             self.add_log("🤖 AI modelleri yükleniyor...")
 
-            # Demucs yükle
-            self.demucs_status.configure(text="🟡 Demucs: Yükleniyor...")
-            if self.model_manager.load_demucs():
-                self.demucs_status.configure(text="🟢 Demucs: Hazır")
-                self.models_loaded["demucs"] = True
-                self.add_log("✓ Demucs modeli hazır")
-            else:
-                self.demucs_status.configure(text="🔴 Demucs: Hata")
-                self.add_log("⚠️ Demucs yüklenemedi")
+            # Demucs ve AudioSR paralel yüklenir (ağırlık okuma + CUDA init GIL'i bırakır)
+            def on_loaded(done_callback):
+                # Sonucu Tk ana thread'ine aktar; yükleme exception'ı başarısız sayılır
+                return lambda fut: self.after(0, done_callback, fut.exception() is None and bool(fut.result()))
 
-            # AudioSR yükle
+            self.demucs_status.configure(text="🟡 Demucs: Yükleniyor...")
             self.audiosr_status.configure(text="🟡 AudioSR: Yükleniyor...")
-            if self.model_manager.load_audiosr():
-                self.audiosr_status.configure(text="🟢 AudioSR: Hazır")
-                self.models_loaded["audiosr"] = True
-                self.add_log("✓ AudioSR modeli hazır")
-            else:
-                self.audiosr_status.configure(text="🔴 AudioSR: Opsiyonel")
-                self.add_log("⚠️ AudioSR yüklenemedi (opsiyonel)")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                executor.submit(self._ensure_demucs).add_done_callback(on_loaded(self._demucs_done))
+                executor.submit(self.model_manager.load_audiosr).add_done_callback(on_loaded(self._audiosr_done))
 
             # MusicAnalyzer'a model_manager'ı bağla (Whisper için vokal ayırma)
-            self.music_analyzer.model_manager = self.model_manager
+            if self.music_analyzer is not None:
+                self.music_analyzer.model_manager = self.model_manager
 
             # Karaoke mode'u başlat
             self.karaoke_mode = KaraokeMode(self.model_manager)
 
-            self.add_log("✓ Sistem hazır!")
-            self.status_badge.configure(text="● Hazır", text_color="#10b981")
+            # Model sonuçlarından sonra sıraya girer (after kuyruğu FIFO)
+            self.after(0, self._models_ready)
 
         threading.Thread(target=init, daemon=True).start()
 
+    def _models_ready(self):
+        """Tüm modeller yüklendikten sonra durum rozetini güncelle"""
+        self.add_log("✓ Sistem hazır!")
+        self.status_badge.configure(text="● Hazır", text_color="#10b981")
+
     def select_file(self):
         """Dosya seç"""
         filename = filedialog.askopenfilename(
@@ -755,9 +1000,16 @@ class MusicioUltraApp(ctk.CTk):
             filetypes=[("Ses Dosyaları", "*.mp3 *.wav *.flac *.ogg *.m4a"), ("Tüm Dosyalar", "*.*")]
         )
         if filename:
-            self.input_file = str(filename)
-            self.file_info_label.configure(text=f"📂 {Path(filename).name}")
-            self.add_log(f"Dosya seçildi: {Path(filename).name}")
+            self.input_path = Path(filename)
+            self.input_file = str(self.input_path)
+            self.file_info_label.configure(text=f"📂 {self.input_path.name}")
+            self.add_log(f"Dosya seçildi: {self.input_path.name}")
+
+    def _require_input(self) -> Path:
+        """Seçili giriş dosyasının Path'ini döndür (seçilmemişse hata)"""
+        if self.input_path is None:
+            raise RuntimeError("Giriş dosyası seçilmedi")
+        return self.input_path
 
     def select_output(self):
         """Çıktı seç"""
@@ -768,12 +1020,84 @@ class MusicioUltraApp(ctk.CTk):
         )
         if filename:
             self.output_file = str(filename)
-            self.add_log(f"📂 Kayıt yeri: {filename}")
-            self.add_log(f"Kayıt yeri: {Path(filename).name}")
+            self.add_log(f"📂 Kayıt yeri: {filename} ({Path(filename).name})")
 
     def update_pitch_visual(self, value):
-        """Pitch visual güncelle"""
-        self.pitch_visual.configure(text=f"{value:+.1f}")
+        """Pitch visual güncelle (~60 FPS ile sınırlı)"""
+        self.schedule_ui_update("pitch_visual", self._flush_pitch_visual)
+
+    def _flush_pitch_visual(self):
+        """Bekleyen pitch değerini label'a yaz"""
+        self.pitch_visual.configure(text=f"{self.semitone_var.get():+.1f}")
+
+    def _ui(self, fn, *args, **kwargs):
+        """Worker thread'den Tk ana thread'ine çağrı aktar (dialog, widget güncellemesi)"""
+        self.after(0, partial(fn, *args, **kwargs))
+
+    def post_ui(self, key, fn, *args, **kwargs):
+        """
+        Worker thread'den durum güncellemesi (progress, etiket) gönder
+        Aynı anahtar için yalnızca en son değer tutulur; _drain_ui_posts kare başına bir kez uygular
+        """
+        self._ui_posts[key] = partial(fn, *args, **kwargs)
+
+    def _drain_ui_posts(self):
+        """Bekleyen worker güncellemelerini uygula (~30 FPS)"""
+        posts = self._ui_posts
+        # popitem atomik: boşaltırken gelen yeni değerler kaybolmaz, en geç sonraki turda uygulanır
+        while posts:
+            _, callback = posts.popitem()
+            try:
+                callback()
+            except TclError:
+                pass  # Widget yok edilmiş olabilir
+            except Exception as e:
+                self.add_log(f"⚠️ UI güncelleme hatası: {e}")
+        self.after(33, self._drain_ui_posts)
+
+    def schedule_ui_update(self, key, callback, delay_ms=16):
+        """Aynı anahtar için gelen UI güncellemelerini tek bir after() çağrısında birleştir"""
+        self._pending_ui_updates[key] = callback
+        if self._ui_update_after_ids.get(key) is None:
+            self._ui_update_after_ids[key] = self.after(delay_ms, lambda: self._flush_ui_update(key))
+
+    def _flush_ui_update(self, key):
+        """Anahtar için bekleyen en son güncellemeyi uygula"""
+        self._ui_update_after_ids[key] = None
+        callback = self._pending_ui_updates.pop(key, None)
+        if callback:
+            callback()
+
+    def bind_throttled_label(self, var, label, fmt, color_range=None):
+        """
+        Değişken her yazıldığında label'ı kare başına en fazla bir kez güncelle
+        color_range=(min, max) verilirse label rengi SLIDER_COLOR_LUT'tan seçilir
+        """
+        key = str(var)  # Tk değişken adı benzersiz
+
+        if color_range is None:
+            update = lambda: label.configure(text=fmt.format(var.get()))
+        else:
+            low, high = color_range
+            scale = 1023 / (high - low)
+
+            def update():
+                value = var.get()
+                idx = min(1023, max(0, int((value - low) * scale)))
+                label.configure(text=fmt.format(value), text_color=SLIDER_COLOR_LUT[idx])
+
+        var.trace_add("write", lambda *args: self.schedule_ui_update(key, update))
+        update()
+
+    def bind_throttled_entry(self, var, entry, fmt):
+        """Değişken her yazıldığında entry içeriğini kare başına en fazla bir kez yenile"""
+        key = str(var)
+
+        def update():
+            entry.delete(0, "end")
+            entry.insert(0, fmt.format(var.get()))
+
+        var.trace_add("write", lambda *args: self.schedule_ui_update(key, update))
 
     def quick_pitch(self, value):
         """Hızlı pitch ayarla"""
@@ -792,39 +1116,41 @@ class MusicioUltraApp(ctk.CTk):
             return
 
         def process():
-            self.process_btn.configure(state="disabled", text="⏳ İŞLENİYOR...")
-            self.progress_bar.set(0)
-            self.progress_label.configure(text="⚙️ Başlatılıyor...")
-            self.status_badge.configure(text="● İşleniyor", text_color="#f59e0b")
+            self.post_ui("process_btn", self.process_btn.configure, state="disabled", text="⏳ İŞLENİYOR...")
+            self.post_ui("progress_bar", self.progress_bar.set, 0)
+            self.post_ui("progress_label", self.progress_label.configure, text="⚙️ Başlatılıyor...")
+            self.post_ui("status_badge", self.status_badge.configure, text="● İşleniyor", text_color="#f59e0b")
 
             # Output path
-            assert self.input_file is not None, "Input file must be set"
-            input_path = Path(self.input_file)
+            input_path = self._require_input()
 
             if self.output_file:
                 output = self.output_file
             else:
                 output = str(input_path.parent / f"shifted_{input_path.name}")
 
-            self.add_log("=" * 60)
-            self.add_log("🚀 PITCH SHIFTING BAŞLIYOR")
-            self.add_log(f"📂 Giriş: {input_path.name}")
-            self.add_log(f"💾 Çıkış: {output}")
-            self.add_log(f"🎚️ Pitch: {self.semitone_var.get():+.1f} semitone")
-            self.add_log(f"⚙️ Kalite: {self.quality_var.get().upper()}")
-            self.add_log(f"🎤 Vokal Ayırma: {'AÇIK' if self.ai_separation_var.get() else 'KAPALI'}")
-            self.add_log(f"✨ AI İyileştirme: {'AÇIK' if self.ai_enhancement_var.get() else 'KAPALI'}")
-            self.add_log(f"🎮 GPU: RTX 5090 (CUDA 12.9)")
-            self.add_log("=" * 60)
-
-            self.progress_bar.set(0.1)
-            self.progress_label.configure(text="📂 Dosya yükleniyor...")
+            # Başlık bloğu tek log kaydı olarak yazılır
+            separator = "=" * 60
+            self.add_log("\n".join([
+                separator,
+                "🚀 PITCH SHIFTING BAŞLIYOR",
+                f"📂 Giriş: {input_path.name}",
+                f"💾 Çıkış: {output}",
+                f"🎚️ Pitch: {self.semitone_var.get():+.1f} semitone",
+                f"⚙️ Kalite: {self.quality_var.get().upper()}",
+                f"🎤 Vokal Ayırma: {'AÇIK' if self.ai_separation_var.get() else 'KAPALI'}",
+                f"✨ AI İyileştirme: {'AÇIK' if self.ai_enhancement_var.get() else 'KAPALI'}",
+                "🎮 GPU: RTX 5090 (CUDA 12.9)",
+                separator
+            ]))
+
+            self.post_ui("progress_bar", self.progress_bar.set, 0.1)
+            self.post_ui("progress_label", self.progress_label.configure, text="📂 Dosya yükleniyor...")
             self.add_log("📂 Ses dosyası yükleniyor...")
 
-            self.progress_bar.set(0.3)
-            self.progress_label.configure(text="🎚️ Pitch değiştiriliyor (RTX 5090)...")
-            self.add_log("🎚️ Pitch shifting uygulanıyor...")
-            self.add_log("🔥 RTX 5090 maksimum hızda çalışıyor...")
+            self.post_ui("progress_bar", self.progress_bar.set, 0.3)
+            self.post_ui("progress_label", self.progress_label.configure, text="🎚️ Pitch değiştiriliyor (RTX 5090)...")
+            self.add_log("🎚️ Pitch shifting uygulanıyor...\n🔥 RTX 5090 maksimum hızda çalışıyor...")
 
             # Get pitch_shifter (already checked in outer scope)
             pitch_shifter = self.pitch_shifter
@@ -841,33 +1167,30 @@ class MusicioUltraApp(ctk.CTk):
             )
             success, msg = result  # type: ignore[misc]
 
-            self.progress_bar.set(0.9)
-            self.progress_label.configure(text="💾 Kaydediliyor...")
+            self.post_ui("progress_bar", self.progress_bar.set, 0.9)
+            self.post_ui("progress_label", self.progress_label.configure, text="💾 Kaydediliyor...")
             self.add_log("💾 Dosya kaydediliyor...")
 
             if success:
-                self.progress_bar.set(1.0)
-                self.progress_label.configure(text="✅ Tamamlandı!")
-                self.add_log("=" * 60)
-                self.add_log("✅ İŞLEM BAŞARILI!")
-                self.add_log(f"📂 Konum: {output}")
+                self.post_ui("progress_bar", self.progress_bar.set, 1.0)
+                self.post_ui("progress_label", self.progress_label.configure, text="✅ Tamamlandı!")
+                summary = [separator, "✅ İŞLEM BAŞARILI!", f"📂 Konum: {output}"]
                 try:
                     size_mb = Path(output).stat().st_size / 1024 / 1024
-                    self.add_log(f"💾 Boyut: {size_mb:.2f} MB")
+                    summary.append(f"💾 Boyut: {size_mb:.2f} MB")
                 except:
                     pass
-                self.add_log("=" * 60)
-                messagebox.showinfo("✅ Başarılı", f"İşlem tamamlandı!\n\n📂 Dosya:\n{output}\n\n🎚️ Pitch: {self.semitone_var.get():+.1f} semitone")
+                summary.append(separator)
+                self.add_log("\n".join(summary))
+                self._ui(messagebox.showinfo, "✅ Başarılı", f"İşlem tamamlandı!\n\n📂 Dosya:\n{output}\n\n🎚️ Pitch: {self.semitone_var.get():+.1f} semitone")
             else:
-                self.progress_bar.set(0)
-                self.progress_label.configure(text="❌ Hata!")
-                self.add_log("=" * 60)
-                self.add_log(f"❌ HATA: {msg}")
-                self.add_log("=" * 60)
-                messagebox.showerror("❌ Hata", f"İşlem başarısız!\n\n{msg}")
+                self.post_ui("progress_bar", self.progress_bar.set, 0)
+                self.post_ui("progress_label", self.progress_label.configure, text="❌ Hata!")
+                self.add_log(f"{separator}\n❌ HATA: {msg}\n{separator}")
+                self._ui(messagebox.showerror, "❌ Hata", f"İşlem başarısız!\n\n{msg}")
 
-            self.process_btn.configure(state="normal", text="🚀 İŞLEME BAŞLA")
-            self.status_badge.configure(text="● Hazır", text_color="#10b981")
+            self.post_ui("process_btn", self.process_btn.configure, state="normal", text="🚀 İŞLEME BAŞLA")
+            self.post_ui("status_badge", self.status_badge.configure, text="● Hazır", text_color="#10b981")
 
         threading.Thread(target=process, daemon=True).start()
 
@@ -885,6 +1208,51 @@ class MusicioUltraApp(ctk.CTk):
         self.stop_rec_btn.configure(state="disabled")
         self.add_log(f"✓ Kayıt tamamlandı: {output}")
 
+    def toggle_monitor(self):
+        """Monitor (kendi sesini duy) aç/kapat - düşük gecikmeli duplex stream"""
+        if self.monitor_var.get():
+            started = self.recorder.start_monitoring(
+                self.rec_pitch_var.get(),
+                input_device=self.parse_device_id(self.mic_device_var.get()),
+                output_device=self.parse_device_id(self.speaker_device_var.get())
+            )
+            if started:
+                self.add_log("🎧 Monitor aktif (düşük gecikme)")
+            else:
+                self.monitor_var.set(False)
+                self.add_log("❌ Monitor başlatılamadı")
+        else:
+            self.recorder.stop_monitoring()
+            self.add_log("🎧 Monitor kapatıldı")
+
+    def toggle_karaoke_monitor(self):
+        """Karaoke 'Kendi Sesini Duy' - blocking I/O monitor (audio thread'inde Python yok)"""
+        if self.karaoke_monitor_var.get():
+            started = self.recorder.start_monitoring(
+                0,
+                input_device=self.parse_device_id(self.karaoke_mic_var.get()),
+                output_device=self.parse_device_id(self.karaoke_speaker_var.get()),
+                blocksize=2048,
+                blocking=True
+            )
+            if started:
+                self.add_log("🎧 Karaoke monitor aktif")
+            else:
+                self.karaoke_monitor_var.set(False)
+                self.add_log("❌ Karaoke monitor başlatılamadı")
+        else:
+            self.recorder.stop_monitoring()
+            self.add_log("🎧 Karaoke monitor kapatıldı")
+
+    def parse_device_id(self, device_label):
+        """'[3] Cihaz adı' etiketinden cihaz ID'sini al (varsayılan cihaz için None)"""
+        if device_label and device_label.startswith("["):
+            try:
+                return int(device_label[1:device_label.index("]")])
+            except ValueError:
+                return None
+        return None
+
     def apply_effects(self):
         """Efektleri uygula"""
         if not self.input_file:
@@ -902,9 +1270,9 @@ class MusicioUltraApp(ctk.CTk):
             return
 
         def analyze():
-            assert self.input_file is not None, "Input file must be set"
+            self._require_input()
             self.add_log("Analiz ediliyor...")
-            results = self.music_analyzer.analyze_full(self.input_file)
+            results = self.get_music_analyzer().analyze_full(self.input_file)
 
             # Sonuçları göster
             self.analysis_results.delete("1.0", "end")
@@ -931,7 +1299,7 @@ class MusicioUltraApp(ctk.CTk):
             return
 
         def transcribe():
-            assert self.input_file is not None, "Input file must be set"
+            self._require_input()
 
             self.add_log("🎹 Notalar çıkarılıyor (Basic Pitch)...")
             self.add_log("⏳ Bu işlem birkaç dakika sürebilir...")
@@ -942,7 +1310,7 @@ class MusicioUltraApp(ctk.CTk):
                 self.add_log("❌ İşlem iptal edildi")
                 return
 
-            results = self.music_analyzer.transcribe_notes(self.input_file, output_dir)
+            results = self.get_music_analyzer().transcribe_notes(self.input_file, output_dir)
 
             if results.get('success'):
                 # Sonuçları göster
@@ -953,78 +1321,79 @@ class MusicioUltraApp(ctk.CTk):
                 # TÜM NOTALARI LİSTELE
                 all_notes = results['notes']
 
-                # Saniye saniye grupla
-                import math
+                # Saniye saniye grupla (NumPy ile - nota başına saniye döngüsü yok)
                 max_time = math.ceil(results['duration'])
-                notes_by_second = {}
 
+                # Hem İngilizce hem Türkçe - etiket yalnızca pitch'e bağlı,
+                # aynı pitch'teki notalar tek string nesnesini paylaşır
+                pitch_labels = {}
                 for note in all_notes:
-                    start_sec = int(note['start'])
-                    end_sec = int(note['end'])
-                    for sec in range(start_sec, end_sec + 1):
-                        if sec <= max_time:
-                            if sec not in notes_by_second:
-                                notes_by_second[sec] = []
-                            # Hem İngilizce hem Türkçe
-                            notes_by_second[sec].append(f"{note['note_turkish']} ({note['note']})")
-
-                # Saniye saniye string oluştur
-                notes_by_sec_str = ""
-                for sec in sorted(notes_by_second.keys()):
-                    notes_in_sec = ', '.join(sorted(set(notes_by_second[sec])))
-                    notes_by_sec_str += f"{sec:3d}s: {notes_in_sec}\n"
+                    if note['pitch'] not in pitch_labels:
+                        pitch_labels[note['pitch']] = f"{note['note_turkish']} ({note['note']})"
+                labels = [pitch_labels[note['pitch']] for note in all_notes]
+                starts = np.fromiter((int(note['start']) for note in all_notes), dtype=np.int32, count=len(all_notes))
+                ends = np.fromiter((int(note['end']) for note in all_notes), dtype=np.int32, count=len(all_notes))
+
+                sep = "=" * 70
+
+                # Sonuç metni parça parça toplanır, widget'a tek join ile verilir
+                parts = [
+                    "\n🎹 NOTA TRANSKRİPSİYONU SONUÇLARI\n", sep, "\n\n",
+                    "📊 İstatistikler:\n",
+                    f"  • Toplam Nota: {results['note_count']}\n",
+                    f"  • Süre: {results['duration']:.1f}s\n",
+                    f"  • Ortalama Nota Süresi: {results['average_duration']:.3f}s\n\n",
+                    "🎵 En Çok Kullanılan Notalar:\n", top_notes_str, "\n\n",
+                    sep, "\n⏱️ SANİYE SANİYE NOTALAR (Çalmak İçin):\n", sep, "\n",
+                    "💡 Format: Do (C4) = Do notası, 4. oktav\n\n",
+                ]
+                add = parts.append
+
+                # Saniye saniye satırlar - notalar başlangıca göre sıralı olduğundan
+                # başlamış notalar bir prefix; döngü ilk notadan son bitişe kadar
+                if all_notes:
+                    np.minimum(ends, max_time, out=ends)
+                    sec_range = range(int(starts[0]), int(ends.max()) + 1)
+                else:
+                    sec_range = range(0)
+                for sec in sec_range:
+                    started = int(np.searchsorted(starts, sec, side='right'))
+                    idx = np.nonzero(ends[:started] >= sec)[0]
+                    if idx.size:
+                        notes_in_sec = ', '.join(sorted({labels[i] for i in idx}))
+                        add(f"{sec:3d}s: {notes_in_sec}\n")
+
+                add("\n\n")
+                add(sep)
+                add("\n📝 DETAYLI NOTA LİSTESİ:\n")
+                add(sep)
+                add("\nSıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre\n"
+                    "----  -------------   --------------------   -------\n")
 
                 # Detaylı nota listesi
-                notes_list_str = ""
-                for i, note in enumerate(all_notes[:200], 1):  # İlk 200 nota
-                    notes_list_str += f"{i:4d}. {note['note_turkish']:6s} ({note['note']:4s}) | {note['start']:7.2f}s → {note['end']:7.2f}s | {note['duration']:.3f}s\n"
+                for i, note in enumerate(islice(all_notes, 200), 1):  # İlk 200 nota
+                    add(f"{i:4d}. {note['note_turkish']:6s} ({note['note']:4s}) | {note['start']:7.2f}s → {note['end']:7.2f}s | {note['duration']:.3f}s\n")
 
                 if len(all_notes) > 200:
-                    notes_list_str += f"\n... ve {len(all_notes) - 200} nota daha\n"
-
-                self.analysis_results.insert("1.0", f"""
-🎹 NOTA TRANSKRİPSİYONU SONUÇLARI
-{'='*70}
-
-📊 İstatistikler:
-  • Toplam Nota: {results['note_count']}
-  • Süre: {results['duration']:.1f}s
-  • Ortalama Nota Süresi: {results['average_duration']:.3f}s
-
-🎵 En Çok Kullanılan Notalar:
-{top_notes_str}
-
-{'='*70}
-⏱️ SANİYE SANİYE NOTALAR (Çalmak İçin):
-{'='*70}
-💡 Format: Do (C4) = Do notası, 4. oktav
-
-{notes_by_sec_str}
-
-{'='*70}
-📝 DETAYLI NOTA LİSTESİ:
-{'='*70}
-Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
-----  -------------   --------------------   -------
-{notes_list_str}
-{'='*70}
-
-💾 DOSYALAR:
-  • MIDI: {results['midi_path']}
-
-✓ Transkripsiyon tamamlandı!
-
-💡 Nasıl Kullanılır:
-  • "Saniye Saniye Notalar" bölümünü takip ederek çalabilirsiniz
-  • MIDI dosyasını FL Studio, Ableton gibi programlarda açabilirsiniz
-  • Do = C, Re = D, Mi = E, Fa = F, Sol = G, La = A, Si = B
-  • Sayı oktavı gösterir (4 = orta oktav)
-                """)
+                    add(f"\n... ve {len(all_notes) - 200} nota daha\n")
+
+                parts.extend([
+                    "\n", sep, "\n\n",
+                    "💾 DOSYALAR:\n",
+                    f"  • MIDI: {results['midi_path']}\n\n",
+                    "✓ Transkripsiyon tamamlandı!\n\n",
+                    "💡 Nasıl Kullanılır:\n",
+                    "  • \"Saniye Saniye Notalar\" bölümünü takip ederek çalabilirsiniz\n",
+                    "  • MIDI dosyasını FL Studio, Ableton gibi programlarda açabilirsiniz\n",
+                    "  • Do = C, Re = D, Mi = E, Fa = F, Sol = G, La = A, Si = B\n",
+                    "  • Sayı oktavı gösterir (4 = orta oktav)\n",
+                ])
+                self.analysis_results.insert("1.0", "".join(parts))
 
                 self.add_log(f"✓ {results['note_count']} nota bulundu")
                 self.add_log(f"💾 MIDI: {results['midi_path']}")
 
-                messagebox.showinfo(
+                self._ui(messagebox.showinfo,
                     "Başarılı!",
                     f"Notalar başarıyla çıkarıldı!\n\n"
                     f"Toplam: {results['note_count']} nota\n"
@@ -1033,7 +1402,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             else:
                 error_msg = results.get('error', 'Bilinmeyen hata')
                 self.add_log(f"❌ Hata: {error_msg}")
-                messagebox.showerror("Hata", f"Nota çıkarma başarısız!\n\n{error_msg}")
+                self._ui(messagebox.showerror, "Hata", f"Nota çıkarma başarısız!\n\n{error_msg}")
 
         threading.Thread(target=transcribe, daemon=True).start()
 
@@ -1044,7 +1413,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             return
 
         def transcribe():
-            assert self.input_file is not None, "Input file must be set"
+            self._require_input()
 
             self.add_log("🎤 Şarkı sözleri çıkarılıyor (Whisper AI)...")
             self.add_log("⏳ İlk kullanımda model indirilir, biraz bekleyin...")
@@ -1057,61 +1426,55 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
 
             # Dil seçimini al
             selected_language = self.lyrics_language_var.get()
-            results = self.music_analyzer.transcribe_lyrics(self.input_file, output_dir, language=selected_language)
+            results = self.get_music_analyzer().transcribe_lyrics(self.input_file, output_dir, language=selected_language)
 
             if results.get('success'):
                 # Sonuçları göster
                 self.analysis_results.delete("1.0", "end")
 
+                sep = "=" * 70
+                lyrics_timestamped = results['lyrics_timestamped']
+
+                # Sonuç metni parça parça toplanır, widget'a tek join ile verilir
+                parts = [
+                    "\n🎤 ŞARKI SÖZLERİ TRANSKRİPSİYONU\n", sep, "\n\n",
+                    "📊 İstatistikler:\n",
+                    f"  • Dil: {results['language'].upper()}\n",
+                    f"  • Kelime Sayısı: {results['word_count']}\n",
+                    f"  • Satır Sayısı: {len(lyrics_timestamped)}\n\n",
+                    sep, "\n📝 TAM ŞARKI SÖZLERİ:\n", sep, "\n\n",
+                    results['lyrics'], "\n\n",
+                    sep, "\n⏱️ ZAMAN DAMGALI SÖZLER (Karaoke için):\n", sep, "\n\n",
+                ]
+                add = parts.append
+
                 # Zaman damgalı sözleri formatla
-                timestamped_lyrics = ""
-                for item in results['lyrics_timestamped'][:50]:  # İlk 50 satır
+                for item in islice(lyrics_timestamped, 50):  # İlk 50 satır
                     min_start = int(item['start'] // 60)
                     sec_start = int(item['start'] % 60)
-                    timestamped_lyrics += f"[{min_start:02d}:{sec_start:02d}] {item['text']}\n"
-
-                if len(results['lyrics_timestamped']) > 50:
-                    timestamped_lyrics += f"\n... ve {len(results['lyrics_timestamped']) - 50} satır daha\n"
-
-                self.analysis_results.insert("1.0", f"""
-🎤 ŞARKI SÖZLERİ TRANSKRİPSİYONU
-{'='*70}
-
-📊 İstatistikler:
-  • Dil: {results['language'].upper()}
-  • Kelime Sayısı: {results['word_count']}
-  • Satır Sayısı: {len(results['lyrics_timestamped'])}
-
-{'='*70}
-📝 TAM ŞARKI SÖZLERİ:
-{'='*70}
-
-{results['lyrics']}
-
-{'='*70}
-⏱️ ZAMAN DAMGALI SÖZLER (Karaoke için):
-{'='*70}
-
-{timestamped_lyrics}
-
-{'='*70}
-💾 Metin Dosyası:
-{results['text_file']}
-
-✓ Transkripsiyon tamamlandı!
-
-💡 Nasıl Kullanılır:
-  • "Zaman Damgalı Sözler" bölümü karaoke için kullanılabilir
-  • Her satırın başındaki [MM:SS] zaman damgasıdır
-  • Metin dosyasını açarak tüm sözleri görebilirsiniz
-  • Şarkıyla birlikte okuyabilirsiniz
-                """)
+                    add(f"[{min_start:02d}:{sec_start:02d}] {item['text']}\n")
+
+                if len(lyrics_timestamped) > 50:
+                    add(f"\n... ve {len(lyrics_timestamped) - 50} satır daha\n")
+
+                parts.extend([
+                    "\n\n", sep, "\n",
+                    "💾 Metin Dosyası:\n",
+                    f"{results['text_file']}\n\n",
+                    "✓ Transkripsiyon tamamlandı!\n\n",
+                    "💡 Nasıl Kullanılır:\n",
+                    "  • \"Zaman Damgalı Sözler\" bölümü karaoke için kullanılabilir\n",
+                    "  • Her satırın başındaki [MM:SS] zaman damgasıdır\n",
+                    "  • Metin dosyasını açarak tüm sözleri görebilirsiniz\n",
+                    "  • Şarkıyla birlikte okuyabilirsiniz\n",
+                ])
+                self.analysis_results.insert("1.0", "".join(parts))
 
                 self.add_log(f"✓ {results['word_count']} kelime bulundu")
                 self.add_log(f"✓ Dil: {results['language']}")
                 self.add_log(f"💾 Dosya: {results['text_file']}")
 
-                messagebox.showinfo(
+                self._ui(messagebox.showinfo,
                     "Başarılı!",
                     f"Şarkı sözleri başarıyla çıkarıldı!\n\n"
                     f"Dil: {results['language'].upper()}\n"
@@ -1121,7 +1484,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             else:
                 error_msg = results.get('error', 'Bilinmeyen hata')
                 self.add_log(f"❌ Hata: {error_msg}")
-                messagebox.showerror("Hata", f"Şarkı sözü çıkarma başarısız!\n\n{error_msg}")
+                self._ui(messagebox.showerror, "Hata", f"Şarkı sözü çıkarma başarısız!\n\n{error_msg}")
 
         threading.Thread(target=transcribe, daemon=True).start()
 
@@ -1132,7 +1495,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             return
 
         def separate():
-            assert self.input_file is not None, "Input file must be set"
+            self._require_input()
 
             self.add_log("🎸 Enstrümanlar ayrılıyor (Demucs AI)...")
             self.add_log("⏳ Bu işlem birkaç dakika sürebilir...")
@@ -1146,16 +1509,15 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             # Model manager kontrolü
             if not self.model_manager:
                 self.add_log("❌ Model manager başlatılmadı")
-                messagebox.showerror("Hata", "Model manager başlatılmadı!")
+                self._ui(messagebox.showerror, "Hata", "Model manager başlatılmadı!")
                 return
 
             # Demucs modelini yükle
             if not self.models_loaded.get("demucs"):
                 self.add_log("🤖 Demucs modeli yükleniyor...")
                 self.demucs_status.configure(text="🟡 Demucs: Yükleniyor...")
-                self.model_manager.load_demucs()
-                self.demucs_status.configure(text="🟢 Demucs: Hazır")
-                self.models_loaded["demucs"] = True
+                if self._ensure_demucs():
+                    self.demucs_status.configure(text="🟢 Demucs: Hazır")
 
             self.add_log("🎵 Ses ayrıştırılıyor (RTX 5090)...")
             self.add_log("📊 4 kanal: Drums, Bass, Other, Vocals")
@@ -1168,12 +1530,17 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
                 # Sonuçları göster
                 self.analysis_results.delete("1.0", "end")
 
-                files_info = ""
+                # Tüm stem'ler aynı klasörde: tek dizin okumasıyla boyutları al
+                with os.scandir(output_dir) as entries:
+                    sizes = {e.name: e.stat().st_size for e in entries if e.is_file()}
+
+                info_lines = []
                 total_size = 0
                 for name, path in separated.items():
-                    file_size = Path(path).stat().st_size / (1024*1024)
+                    file_size = sizes.get(os.path.basename(path), 0) / (1024*1024)
                     total_size += file_size
-                    files_info += f"  {name:8s}: {path}\n            Boyut: {file_size:.2f} MB\n\n"
+                    info_lines.append(f"  {name:8s}: {path}\n            Boyut: {file_size:.2f} MB\n\n")
+                files_info = "".join(info_lines)
 
                 self.analysis_results.insert("1.0", f"""
 🎸 ENSTRÜMAN AYIRMA SONUÇLARI
@@ -1208,7 +1575,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
                 for name, path in separated.items():
                     self.add_log(f"  • {name}: {Path(path).name}")
 
-                messagebox.showinfo(
+                self._ui(messagebox.showinfo,
                     "Başarılı!",
                     f"Enstrümanlar başarıyla ayrıldı!\n\n"
                     f"Toplam: {len(separated)} dosya\n"
@@ -1217,7 +1584,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
                 )
             else:
                 self.add_log("❌ Hata: Enstrüman ayırma başarısız!")
-                messagebox.showerror("Hata", "Enstrüman ayırma başarısız!")
+                self._ui(messagebox.showerror, "Hata", "Enstrüman ayırma başarısız!")
 
         threading.Thread(target=separate, daemon=True).start()
 
@@ -1228,7 +1595,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             return
 
         def transcribe():
-            assert self.input_file is not None, "Input file must be set"
+            self._require_input()
 
             self.add_log("🎼 Her enstrüman için notalar çıkarılıyor...")
             self.add_log("⏳ Bu işlem 10-15 dakika sürebilir...")
@@ -1244,13 +1611,12 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             self.add_log("🎸 Adım 1/2: Enstrümanlar ayrılıyor...")
 
             if not self.model_manager:
-                messagebox.showerror("Hata", "Model manager başlatılmadı!")
+                self._ui(messagebox.showerror, "Hata", "Model manager başlatılmadı!")
                 return
 
             if not self.models_loaded.get("demucs"):
                 self.add_log("🤖 Demucs modeli yükleniyor...")
-                self.model_manager.load_demucs()
-                self.models_loaded["demucs"] = True
+                self._ensure_demucs()
 
             temp_dir = Path(output_dir) / "temp_separated"
             temp_dir.mkdir(parents=True, exist_ok=True)
@@ -1260,7 +1626,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
 
             if not separated:
                 self.add_log("❌ Enstrüman ayırma başarısız!")
-                messagebox.showerror("Hata", "Enstrüman ayırma başarısız!")
+                self._ui(messagebox.showerror, "Hata", "Enstrüman ayırma başarısız!")
                 return
 
             self.add_log(f"✓ {len(separated)} enstrüman ayrıldı")
@@ -1268,93 +1634,97 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             # 2. Her enstrüman için nota çıkar
             self.add_log("🎹 Adım 2/2: Her enstrüman için notalar çıkarılıyor...")
 
-            from basic_pitch.inference import predict
-            from basic_pitch import ICASSP_2022_MODEL_PATH
-            import pretty_midi
+            from core.music_analyzer import predict_stem_notes, init_transcription_worker
 
-            instruments_data = {}
 
-            for idx, (inst_name, inst_path) in enumerate(separated.items(), 1):
-                self.add_log(f"  [{idx}/{len(separated)}] 🎵 {inst_name.upper()} notaları çıkarılıyor...")
+            stem_results = {}
+            start_key = itemgetter('start')
 
-                try:
+            # 128 MIDI notasının isimleri bir kez hesaplanmış tablo
+            note_names = self.get_music_analyzer().get_note_name_table()
+
+            # Her stem ayrı process'te - Basic Pitch çağrıları GIL'i paylaşmadan paralel çalışır
+            max_workers = min(4, len(separated), os.cpu_count() or 1)
+            self.add_log(f"  ⚡ {len(separated)} stem, {max_workers} paralel process")
+
+            input_stem = self._require_input().stem
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=init_transcription_worker) as executor:
+                futures = {}
+                for inst_name, inst_path in separated.items():
                     # MIDI dosya yolu
-                    midi_path = Path(output_dir) / f"{Path(self.input_file).stem}_{inst_name}_notes.mid"
-
-                    # Basic Pitch ile transcription (EN YÜKSEK KALITE)
-                    model_output, midi_data, note_events = predict(
-                        inst_path,
-                        ICASSP_2022_MODEL_PATH,
-                        onset_threshold=0.5,
-                        frame_threshold=0.3,
-                        minimum_note_length=127.70,
-                        minimum_frequency=None,
-                        maximum_frequency=None,
-                        multiple_pitch_bends=True,
-                        melodia_trick=True
-                    )
-                    midi_data.write(str(midi_path))
-
-                    # Notaları parse et
-                    notes_list = []
-                    for instrument in midi_data.instruments:
-                        for note in instrument.notes:
-                            note_name = pretty_midi.note_number_to_name(note.pitch)
-                            # Türkçe nota ismi
-                            note_tr = self.music_analyzer.get_turkish_note_name(note_name)
-                            notes_list.append({
+                    midi_path = Path(output_dir) / f"{input_stem}_{inst_name}_notes.mid"
+                    futures[executor.submit(predict_stem_notes, inst_path, str(midi_path))] = (inst_name, midi_path)
+
+                for idx, future in enumerate(as_completed(futures), 1):
+                    inst_name, midi_path = futures[future]
+                    self.add_log(f"  [{idx}/{len(separated)}] 🎵 {inst_name.upper()}")
+
+                    try:
+                        # Notaları parse et
+                        notes_list = []
+                        append_note = notes_list.append
+                        for pitch, start, end in future.result():
+                            # İngilizce ve Türkçe nota ismi
+                            note_name, note_tr = note_names[pitch]
+                            append_note({
                                 'note': note_name,
                                 'note_turkish': note_tr,
-                                'pitch': note.pitch,
-                                'start': note.start,
-                                'end': note.end,
-                                'duration': note.end - note.start
+                                'pitch': pitch,
+                                'start': start,
+                                'end': end,
+                                'duration': end - start
                             })
+                        notes_list.sort(key=start_key)
 
-                    instruments_data[inst_name] = {
-                        'midi_path': str(midi_path),
-                        'notes': notes_list,
-                        'note_count': len(notes_list)
-                    }
+                        stem_results[inst_name] = {
+                            'midi_path': str(midi_path),
+                            'notes': notes_list,
+                            'note_count': len(notes_list)
+                        }
 
-                    self.add_log(f"    ✓ {len(notes_list)} nota bulundu")
+                        self.add_log(f"    ✓ {len(notes_list)} nota bulundu")
 
-                except Exception as e:
-                    self.add_log(f"    ❌ {inst_name} hatası: {e}")
+                    except Exception as e:
+                        self.add_log(f"    ❌ {inst_name} hatası: {e}")
+
+            # Sonuçları stem sırasıyla göster (tamamlanma sırasıyla değil)
+            instruments_data = {name: stem_results[name] for name in separated if name in stem_results}
 
             # Sonuçları göster
             self.analysis_results.delete("1.0", "end")
 
-            result_text = "🎼 ENSTRÜMAN NOTALARI SONUÇLARI\n" + "="*70 + "\n\n"
+            result_parts = ["🎼 ENSTRÜMAN NOTALARI SONUÇLARI\n" + "="*70 + "\n\n"]
+            add = result_parts.append
 
             for inst_name, data in instruments_data.items():
-                result_text += f"🎵 {inst_name.upper()}\n"
-                result_text += f"{'='*70}\n"
-                result_text += f"  • Nota Sayısı: {data['note_count']}\n"
-                result_text += f"  • MIDI Dosyası: {data['midi_path']}\n\n"
+                add(f"🎵 {inst_name.upper()}\n")
+                add(f"{'='*70}\n")
+                add(f"  • Nota Sayısı: {data['note_count']}\n")
+                add(f"  • MIDI Dosyası: {data['midi_path']}\n\n")
 
                 # İlk 20 nota
-                result_text += f"  İlk 20 Nota:\n"
-                for i, note in enumerate(data['notes'][:20], 1):
-                    result_text += f"    {i:2d}. {note['note_turkish']:6s} ({note['note']:4s}) | {note['start']:6.2f}s\n"
+                add(f"  İlk 20 Nota:\n")
+                for i, note in enumerate(islice(data['notes'], 20), 1):
+                    add(f"    {i:2d}. {note['note_turkish']:6s} ({note['note']:4s}) | {note['start']:6.2f}s\n")
 
                 if data['note_count'] > 20:
-                    result_text += f"    ... ve {data['note_count'] - 20} nota daha\n"
+                    add(f"    ... ve {data['note_count'] - 20} nota daha\n")
 
-                result_text += "\n" + "="*70 + "\n\n"
+                add("\n" + "="*70 + "\n\n")
 
-            result_text += "\n✓ Tüm enstrüman notaları çıkarıldı!\n\n"
-            result_text += "💡 Kullanım:\n"
-            result_text += "  • Her enstrümanın MIDI dosyasını müzik yazılımında açabilirsiniz\n"
-            result_text += "  • DRUMS: Davul ritimleri\n"
-            result_text += "  • BASS: Bas gitar melodisi\n"
-            result_text += "  • OTHER: Piyano, gitarlar, synth\n"
-            result_text += "  • VOCALS: Şarkıcı melodisi\n"
+            add("\n✓ Tüm enstrüman notaları çıkarıldı!\n\n")
+            add("💡 Kullanım:\n")
+            add("  • Her enstrümanın MIDI dosyasını müzik yazılımında açabilirsiniz\n")
+            add("  • DRUMS: Davul ritimleri\n")
+            add("  • BASS: Bas gitar melodisi\n")
+            add("  • OTHER: Piyano, gitarlar, synth\n")
+            add("  • VOCALS: Şarkıcı melodisi\n")
 
+            result_text = "".join(result_parts)
             self.analysis_results.insert("1.0", result_text)
 
             self.add_log("✓ İşlem tamamlandı!")
-            messagebox.showinfo(
+            self._ui(messagebox.showinfo,
                 "Başarılı!",
                 f"Enstrüman notaları başarıyla çıkarıldı!\n\n"
                 f"Toplam: {len(instruments_data)} enstrüman\n"
@@ -1369,7 +1739,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             messagebox.showerror("Hata", "Dosya seçilmedi!")
             return
 
-        assert self.input_file is not None, "Input file must be set"
+        self._require_input()
         self.add_log(f"📊 {viz_type} oluşturuluyor...")
         # İmplementasyon devam edecek...
 
@@ -1420,77 +1790,147 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         if file:
             file_path = Path(file)
             if file_path.exists():
-                pygame.mixer.music.load(str(file_path))
-                pygame.mixer.music.play()
+                self.stop_audio()
+                self._player_file = sf.SoundFile(str(file_path))
+                self._player_stream = sd.OutputStream(
+                    samplerate=self._player_file.samplerate,
+                    channels=self._player_file.channels,
+                    dtype='float32',
+                    blocksize=512,
+                    callback=self._player_callback,
+                    finished_callback=lambda: self.after(0, self._on_playback_finished)
+                )
+                self._player_stream.start()
                 self.is_playing = True
+                self.play_btn.configure(text="⏸️")
                 self.add_log(f"🎵 Oynatılıyor: {file_path.name}")
 
+    def _player_callback(self, outdata, frames, time_info, status):
+        """Oynatma stream callback'i - dosyadan doğrudan çıkış buffer'ına oku"""
+        read = self._player_file.read(frames, dtype='float32', always_2d=True, out=outdata)
+        if len(read) < frames:
+            outdata[len(read):] = 0
+            raise sd.CallbackStop
+
+    def _on_playback_finished(self):
+        """Dosya sonuna gelindi (Tk ana thread'inde)"""
+        if self._player_stream is not None and not self._player_stream.active and self.is_playing:
+            # CallbackStop stream'i durdurulmuş değil yalnızca pasif bırakır: start() için stop() gerekli;
+            # tekrar ▶ basıldığında parça baştan çalsın
+            self._player_stream.stop()
+            self._player_file.seek(0)
+            self.is_playing = False
+            self.play_btn.configure(text="▶️")
+
     def toggle_play(self):
         """Play/Pause"""
+        if self._player_stream is None:
+            return
+
         if self.is_playing:
-            pygame.mixer.music.pause()
+            # Dosya konumu korunur, devam ederken yeniden okunmaz
+            self._player_stream.stop()
             self.is_playing = False
             self.play_btn.configure(text="▶️")
         else:
-            pygame.mixer.music.unpause()
+            if not self._player_stream.stopped:
+                # Dosya sonu bildirimi henüz işlenmediyse: stream'i durdur ve başa sar
+                self._player_stream.stop()
+                self._player_file.seek(0)
+            self._player_stream.start()
             self.is_playing = True
             self.play_btn.configure(text="⏸️")
 
     def stop_audio(self):
         """Stop"""
-        pygame.mixer.music.stop()
+        if self._player_stream is not None:
+            self._player_stream.close()
+            self._player_stream = None
+        if self._player_file is not None:
+            self._player_file.close()
+            self._player_file = None
         self.is_playing = False
         self.play_btn.configure(text="▶️")
 
     def add_log(self, message):
-        """Log ekle"""
-        # log_text widget'ı henüz oluşturulmamışsa, loglamayı atla
-        if not hasattr(self, 'log_text'):
-            return
-
+        """Log ekle (thread-safe, _drain_log ile toplu yazılır)"""
         timestamp = time.strftime("%H:%M:%S")
-        self.log_text.insert("end", f"[{timestamp}] {message}\n")
-        self.log_text.see("end")
+        self._log_queue.append(f"[{timestamp}] {message}\n")
+
+    def _drain_log(self):
+        """Bekleyen log satırlarını tek insert + tek see ile yaz"""
+        if self._log_queue and hasattr(self, 'log_text'):
+            lines = []
+            popleft = self._log_queue.popleft
+            while self._log_queue:
+                lines.append(popleft())
+            self.log_text.insert("end", "".join(lines))
+            self.log_text.see("end")
+        self.after(50, self._drain_log)
 
     def start_system_monitor(self):
         """Sistem kullanımını sürekli güncelle"""
-        def update_stats():
-            import psutil
+        self._monitor_process = psutil.Process() if PSUTIL_AVAILABLE else None
 
-            while True:
-                try:
-                    # RAM kullanımı
-                    ram = psutil.Process().memory_info().rss / 1e9
-                    self.ram_usage_label.configure(text=f"💾 RAM: {ram:.2f} GB")
-
-                    # GPU kullanımı
-                    if self.model_manager and hasattr(self.model_manager, 'get_gpu_usage'):
-                        gpu_info = self.model_manager.get_gpu_usage()
-                        if gpu_info.get('available'):
-                            vram_used = gpu_info['allocated_gb']
-                            vram_total = gpu_info['total_gb']
-                            vram_percent = gpu_info['usage_percent']
-
-                            # Renk kodlaması
-                            if vram_percent < 50:
-                                color = "#10b981"  # Yeşil
-                            elif vram_percent < 80:
-                                color = "#f59e0b"  # Sarı
-                            else:
-                                color = "#ef4444"  # Kırmızı
+        # Son yazılan (ram_text, gpu_state) - değişmeyen label'lar yeniden çizilmez
+        self._monitor_prev = (None, None)
 
-                            self.gpu_usage_label.configure(
-                                text=f"📊 VRAM: {vram_used:.1f} GB / {vram_total:.1f} GB ({vram_percent:.0f}%)",
-                                text_color=color
-                            )
+        # Tick iş süresinin üstel hareketli ortalaması (saniye) ve hata backoff'u
+        self._monitor_work_ema = None
+        self._monitor_error_delay_ms = 0
+        self.update_system_stats()
 
-                    time.sleep(1)  # Her 1 saniyede güncelle
+    def update_system_stats(self):
+        """Tek monitör tick'i - Tk thread'inde çalışır, kendini after() ile yeniden planlar"""
+        period = 1.0  # Hedef: saniyede 1 güncelleme
+        tick_start = time.perf_counter()
 
-                except Exception as e:
-                    print(f"Monitor hatası: {e}")
-                    time.sleep(5)
+        try:
+            # RAM kullanımı
+            ram_text = None
+            if self._monitor_process is not None:
+                ram = self._monitor_process.memory_info().rss / 1e9
+                ram_text = f"💾 RAM: {ram:.2f} GB"
+
+            # GPU kullanımı
+            gpu_state = None
+            if self.model_manager and hasattr(self.model_manager, 'get_gpu_usage'):
+                gpu_info = self.model_manager.get_gpu_usage()
+                if gpu_info.get('available'):
+                    vram_used = gpu_info['allocated_gb']
+                    vram_total = gpu_info['total_gb']
+                    vram_percent = gpu_info['usage_percent']
+
+                    # Renk kodlaması (tablodan)
+                    color = LOAD_COLOR_LUT[min(100, max(0, int(vram_percent)))]
+
+                    gpu_state = (f"📊 VRAM: {vram_used:.1f} GB / {vram_total:.1f} GB ({vram_percent:.0f}%)", color)
+
+            # Sadece değişen label'ları güncelle
+            prev_ram_text, prev_gpu_state = self._monitor_prev
+            if ram_text is not None and ram_text != prev_ram_text:
+                self.ram_usage_label.configure(text=ram_text)
+            if gpu_state is not None and gpu_state != prev_gpu_state:
+                self.gpu_usage_label.configure(text=gpu_state[0], text_color=gpu_state[1])
+            self._monitor_prev = (ram_text, gpu_state)
 
-        threading.Thread(target=update_stats, daemon=True).start()
+        except Exception as e:
+            print(f"Monitor hatası: {e}")
+            # Üstel backoff: 250ms, 500ms, 1s ... en fazla 5s
+            self._monitor_error_delay_ms = min(5000, max(250, self._monitor_error_delay_ms * 2))
+            self.after(self._monitor_error_delay_ms, self.update_system_stats)
+            return
+
+        self._monitor_error_delay_ms = 0
+
+        # İş süresinin EMA'sını bekleme süresinden düş (tahmin [0, period) aralığına sıkıştırılır)
+        work = time.perf_counter() - tick_start
+        ema = self._monitor_work_ema
+        ema = work if ema is None else ema + 0.2 * (work - ema)
+        self._monitor_work_ema = ema
+        sleep_for = period - min(ema, period - 0.001)
+
+        self.after(int(sleep_for * 1000), self.update_system_stats)
 
     def quick_load_file(self):
         """Quick action: Load file"""
@@ -1498,22 +1938,22 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
 
     def quick_record(self):
         """Quick action: Record"""
-        self.tabview.set("🎤 Mikrofon Kaydı")
+        self.show_tab("🎤 Mikrofon Kaydı")
 
     def quick_analyze(self):
         """Quick action: Analyze"""
-        self.tabview.set("🎼 Müzik Analizi")
+        self.show_tab("🎼 Müzik Analizi")
 
     def quick_batch(self):
         """Quick action: Batch"""
-        self.tabview.set("🎚️ Batch İşlem")
+        self.show_tab("🎚️ Batch İşlem")
 
     def create_mixer_tab(self):
         """Audio Mixer tab"""
         tab = self.tabview.tab("🎵 Audio Mixer")
         tab.grid_columnconfigure(0, weight=1)
 
-        ctk.CTkLabel(tab, text="🎵 Multi-Track Audio Mixer", font=ctk.CTkFont(size=24, weight="bold")).pack(pady=20)
+        ctk.CTkLabel(tab, text="🎵 Multi-Track Audio Mixer", font=self.fonts["title_lg"]).pack(pady=20)
 
         # Track ekleme
         btn_frame = ctk.CTkFrame(tab)
@@ -1530,7 +1970,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         self.mixer_track_widgets = []
 
         # Mix butonu
-        ctk.CTkButton(tab, text="🎚️ MIX & EXPORT", command=self.mixer_export, height=60, font=ctk.CTkFont(size=18, weight="bold"), fg_color=self.colors["success"]).pack(pady=20)
+        ctk.CTkButton(tab, text="🎚️ MIX & EXPORT", command=self.mixer_export, height=60, font=self.fonts["title_sm"], fg_color=self.colors["success"]).pack(pady=20)
 
     def create_karaoke_tab(self):
         """Karaoke Mode tab"""
@@ -1545,8 +1985,8 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         header_frame = ctk.CTkFrame(scroll_container, fg_color="transparent")
         header_frame.pack(pady=15)
 
-        ctk.CTkLabel(header_frame, text="🎧 Professional Karaoke Studio", font=ctk.CTkFont(size=26, weight="bold")).pack()
-        ctk.CTkLabel(header_frame, text="Real-time Effects | AI Vocal Removal | Professional Mixing", font=ctk.CTkFont(size=12), text_color="gray").pack()
+        ctk.CTkLabel(header_frame, text="🎧 Professional Karaoke Studio", font=self.fonts["title_xl"]).pack()
+        ctk.CTkLabel(header_frame, text="Real-time Effects | AI Vocal Removal | Professional Mixing", font=self.fonts["body_sm"], text_color="gray").pack()
 
         # VU METER - PROFESSIONAL AUDIO LEVEL MONITORING
         vu_container = ctk.CTkFrame(scroll_container, fg_color=("#2a2d3a", "#1a1a2e"), corner_radius=15)
@@ -1565,7 +2005,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         self.karaoke_placeholder_label = ctk.CTkLabel(
             self.karaoke_player_container,
             text="🎬 Professional Player will appear here when you start karaoke\n\nPress 'RECORD + MIX' to begin",
-            font=ctk.CTkFont(size=16),
+            font=self.fonts["heading_plain"],
             text_color="gray50"
         )
         self.karaoke_placeholder_label.pack(expand=True, pady=50)
@@ -1577,7 +2017,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         devices_section = ctk.CTkFrame(scroll_container, fg_color=("#2a2d3a", "#1a1a2e"), corner_radius=15)
         devices_section.pack(pady=15, fill="x", padx=30)
 
-        ctk.CTkLabel(devices_section, text="🎚️ Audio Devices", font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", padx=20, pady=(15, 10))
+        ctk.CTkLabel(devices_section, text="🎚️ Audio Devices", font=self.fonts["heading"]).pack(anchor="w", padx=20, pady=(15, 10))
 
         # Device controls grid
         dev_grid = ctk.CTkFrame(devices_section, fg_color="transparent")
@@ -1586,7 +2026,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         # Mikrofon
         mic_frame = ctk.CTkFrame(dev_grid, fg_color="transparent")
         mic_frame.pack(fill="x", pady=5)
-        ctk.CTkLabel(mic_frame, text="🎤 Mikrofon:", width=120, anchor="w", font=ctk.CTkFont(size=13)).pack(side="left", padx=5)
+        ctk.CTkLabel(mic_frame, text="🎤 Mikrofon:", width=120, anchor="w", font=self.fonts["body_md"]).pack(side="left", padx=5)
         self.karaoke_mic_var = ctk.StringVar(value="Varsayılan")
         self.karaoke_mic_menu = ctk.CTkOptionMenu(mic_frame, variable=self.karaoke_mic_var, values=["Varsayılan"], width=300)
         self.karaoke_mic_menu.pack(side="left", padx=5)
@@ -1594,20 +2034,23 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         # Hoparlör
         speaker_frame = ctk.CTkFrame(dev_grid, fg_color="transparent")
         speaker_frame.pack(fill="x", pady=5)
-        ctk.CTkLabel(speaker_frame, text="🔊 Hoparlör:", width=120, anchor="w", font=ctk.CTkFont(size=13)).pack(side="left", padx=5)
+        ctk.CTkLabel(speaker_frame, text="🔊 Hoparlör:", width=120, anchor="w", font=self.fonts["body_md"]).pack(side="left", padx=5)
         self.karaoke_speaker_var = ctk.StringVar(value="Varsayılan")
         self.karaoke_speaker_menu = ctk.CTkOptionMenu(speaker_frame, variable=self.karaoke_speaker_var, values=["Varsayılan"], width=300)
         self.karaoke_speaker_menu.pack(side="left", padx=5)
 
         # Refresh button
-        ctk.CTkButton(dev_grid, text="🔄 Yenile", command=self.refresh_karaoke_devices, width=100, height=28).pack(pady=5)
+        ctk.CTkButton(dev_grid, text="🔄 Yenile", command=partial(self.refresh_karaoke_devices, rescan=True), width=100, height=28).pack(pady=5)
+
+        # Menüleri önbellekten doldur, kayıtlı mikrofon/hoparlörü geri seç
+        self.refresh_karaoke_devices()
 
         # Giriş dosyası seçimi
         file_frame = ctk.CTkFrame(scroll_container)
         file_frame.pack(pady=10, fill="x", padx=30)
 
-        ctk.CTkLabel(file_frame, text="🎵 Şarkı Dosyası:", font=ctk.CTkFont(size=14, weight="bold")).pack(side="left", padx=10)
-        self.karaoke_file_label = ctk.CTkLabel(file_frame, text="Seçilmedi", font=ctk.CTkFont(size=12))
+        ctk.CTkLabel(file_frame, text="🎵 Şarkı Dosyası:", font=self.fonts["label"]).pack(side="left", padx=10)
+        self.karaoke_file_label = ctk.CTkLabel(file_frame, text="Seçilmedi", font=self.fonts["body_sm"])
         self.karaoke_file_label.pack(side="left", padx=10, fill="x", expand=True)
         ctk.CTkButton(file_frame, text="📂 Dosya Seç", command=self.karaoke_select_file, width=120, height=35).pack(side="right", padx=10)
 
@@ -1615,12 +2058,12 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         output_frame = ctk.CTkFrame(scroll_container)
         output_frame.pack(pady=10, fill="x", padx=30)
 
-        ctk.CTkLabel(output_frame, text="💾 Çıkış Klasörü:", font=ctk.CTkFont(size=14, weight="bold")).pack(side="left", padx=10)
+        ctk.CTkLabel(output_frame, text="💾 Çıkış Klasörü:", font=self.fonts["label"]).pack(side="left", padx=10)
         # Kaydedilmiş klasörü göster
         initial_output_text = self.saved_output_folder if hasattr(self, 'saved_output_folder') and self.saved_output_folder else "Seçilmedi"
         if hasattr(self, 'saved_output_folder') and self.saved_output_folder:
             self.karaoke_output_folder = self.saved_output_folder
-        self.karaoke_output_label = ctk.CTkLabel(output_frame, text=initial_output_text, font=ctk.CTkFont(size=12))
+        self.karaoke_output_label = ctk.CTkLabel(output_frame, text=initial_output_text, font=self.fonts["body_sm"])
         self.karaoke_output_label.pack(side="left", padx=10, fill="x", expand=True)
         ctk.CTkButton(output_frame, text="📁 Klasör Seç", command=self.karaoke_select_output, width=120, height=35).pack(side="right", padx=10)
 
@@ -1634,7 +2077,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
 
         pitch_header = ctk.CTkFrame(pitch_card, fg_color="transparent")
         pitch_header.pack(fill="x", padx=20, pady=(15, 5))
-        ctk.CTkLabel(pitch_header, text="🎚️ Pitch Shift", font=ctk.CTkFont(size=16, weight="bold")).pack(side="left")
+        ctk.CTkLabel(pitch_header, text="🎚️ Pitch Shift", font=self.fonts["heading"]).pack(side="left")
 
         pitch_controls = ctk.CTkFrame(pitch_card, fg_color="transparent")
         pitch_controls.pack(fill="x", padx=20, pady=(5, 15))
@@ -1647,13 +2090,15 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         pitch_entry_frame = ctk.CTkFrame(pitch_controls, fg_color="transparent")
         pitch_entry_frame.pack(side="left", padx=5)
 
-        self.karaoke_pitch_entry = ctk.CTkEntry(pitch_entry_frame, width=60, height=35, font=ctk.CTkFont(size=14, weight="bold"), justify="center")
+        self.karaoke_pitch_entry = ctk.CTkEntry(pitch_entry_frame, width=60, height=35, font=self.fonts["label"], justify="center")
         self.karaoke_pitch_entry.pack(side="left")
         self.karaoke_pitch_entry.insert(0, "0")
-        self.karaoke_pitch_entry.bind("<Return>", lambda e: self.update_karaoke_pitch_from_entry())
-        self.karaoke_pitch_var.trace_add("write", lambda *args: self.karaoke_pitch_entry.delete(0, "end") or self.karaoke_pitch_entry.insert(0, f"{self.karaoke_pitch_var.get():.1f}"))
+        # Yazarken değil, onaylanınca senkronize et (Enter veya odak kaybı)
+        for sequence in ("<Return>", "<FocusOut>"):
+            self.karaoke_pitch_entry.bind(sequence, lambda e: self.update_karaoke_pitch_from_entry())
+        self.bind_throttled_entry(self.karaoke_pitch_var, self.karaoke_pitch_entry, "{:.1f}")
 
-        ctk.CTkLabel(pitch_entry_frame, text="semitones", font=ctk.CTkFont(size=10), text_color="gray60").pack(side="left", padx=5)
+        ctk.CTkLabel(pitch_entry_frame, text="semitones", font=self.fonts["caption"], text_color="gray60").pack(side="left", padx=5)
 
         # Tempo - Modern kart tasarımı
         tempo_card = ctk.CTkFrame(settings_frame, fg_color=("gray90", "gray20"), corner_radius=15)
@@ -1661,7 +2106,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
 
         tempo_header = ctk.CTkFrame(tempo_card, fg_color="transparent")
         tempo_header.pack(fill="x", padx=20, pady=(15, 5))
-        ctk.CTkLabel(tempo_header, text="⏱️ Tempo", font=ctk.CTkFont(size=16, weight="bold")).pack(side="left")
+        ctk.CTkLabel(tempo_header, text="⏱️ Tempo", font=self.fonts["heading"]).pack(side="left")
 
         tempo_controls = ctk.CTkFrame(tempo_card, fg_color="transparent")
         tempo_controls.pack(fill="x", padx=20, pady=(5, 15))
@@ -1674,13 +2119,14 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         tempo_entry_frame = ctk.CTkFrame(tempo_controls, fg_color="transparent")
         tempo_entry_frame.pack(side="left", padx=5)
 
-        self.karaoke_tempo_entry = ctk.CTkEntry(tempo_entry_frame, width=60, height=35, font=ctk.CTkFont(size=14, weight="bold"), justify="center")
+        self.karaoke_tempo_entry = ctk.CTkEntry(tempo_entry_frame, width=60, height=35, font=self.fonts["label"], justify="center")
         self.karaoke_tempo_entry.pack(side="left")
         self.karaoke_tempo_entry.insert(0, "1.0")
-        self.karaoke_tempo_entry.bind("<Return>", lambda e: self.update_karaoke_tempo_from_entry())
-        self.karaoke_tempo_var.trace_add("write", lambda *args: self.karaoke_tempo_entry.delete(0, "end") or self.karaoke_tempo_entry.insert(0, f"{self.karaoke_tempo_var.get():.2f}"))
+        for sequence in ("<Return>", "<FocusOut>"):
+            self.karaoke_tempo_entry.bind(sequence, lambda e: self.update_karaoke_tempo_from_entry())
+        self.bind_throttled_entry(self.karaoke_tempo_var, self.karaoke_tempo_entry, "{:.2f}")
 
-        ctk.CTkLabel(tempo_entry_frame, text="x", font=ctk.CTkFont(size=10), text_color="gray60").pack(side="left", padx=5)
+        ctk.CTkLabel(tempo_entry_frame, text="x", font=self.fonts["caption"], text_color="gray60").pack(side="left", padx=5)
 
         # Real-time Effects Section - ENHANCED VISUALS
         effects_section = ctk.CTkFrame(scroll_container, fg_color=("#252836", "#16171f"), corner_radius=20, border_width=2, border_color=("#667eea", "#5a67d8"))
@@ -1689,71 +2135,19 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         # Section header with gradient-style colors
         effects_header = ctk.CTkFrame(effects_section, fg_color=("#667eea", "#5a67d8"), corner_radius=15)
         effects_header.pack(fill="x", padx=15, pady=15)
-        ctk.CTkLabel(effects_header, text="✨ REAL-TIME VOCAL EFFECTS", font=ctk.CTkFont(size=16, weight="bold"), text_color="white").pack(pady=10)
+        ctk.CTkLabel(effects_header, text="✨ REAL-TIME VOCAL EFFECTS", font=self.fonts["heading"], text_color="white").pack(pady=10)
 
         effects_grid = ctk.CTkFrame(effects_section, fg_color="transparent")
         effects_grid.pack(fill="x", padx=20, pady=(0, 15))
 
-        # Reverb - Professional card style
-        reverb_card = ctk.CTkFrame(effects_grid, fg_color=("#2d3142", "#1a1d2e"), corner_radius=12, border_width=1, border_color=("#3b82f6", "#2563eb"))
-        reverb_card.pack(fill="x", pady=8, padx=5)
-        reverb_inner = ctk.CTkFrame(reverb_card, fg_color="transparent")
-        reverb_inner.pack(fill="x", padx=15, pady=10)
-        ctk.CTkLabel(reverb_inner, text="🌊 Reverb (Room)", width=150, anchor="w", font=ctk.CTkFont(size=13, weight="bold")).pack(side="left")
-        self.karaoke_reverb_var = ctk.DoubleVar(value=0.3)
-        reverb_slider = ctk.CTkSlider(reverb_inner, from_=0, to=1, variable=self.karaoke_reverb_var, width=300, height=18, progress_color=("#3b82f6", "#2563eb"), button_color=("#60a5fa", "#3b82f6"), button_hover_color=("#93c5fd", "#60a5fa"))
-        reverb_slider.pack(side="left", padx=10)
-        reverb_label = ctk.CTkLabel(reverb_inner, text="", width=60, font=ctk.CTkFont(size=12, weight="bold"), text_color=("#3b82f6", "#60a5fa"))
-        reverb_label.pack(side="left")
-        self.karaoke_reverb_var.trace_add("write", lambda *args: reverb_label.configure(text=f"{self.karaoke_reverb_var.get():.2f}"))
-        reverb_label.configure(text=f"{self.karaoke_reverb_var.get():.2f}")
-
-        # Echo/Delay - Professional card style
-        echo_card = ctk.CTkFrame(effects_grid, fg_color=("#2d3142", "#1a1d2e"), corner_radius=12, border_width=1, border_color=("#8b5cf6", "#7c3aed"))
-        echo_card.pack(fill="x", pady=8, padx=5)
-        echo_inner = ctk.CTkFrame(echo_card, fg_color="transparent")
-        echo_inner.pack(fill="x", padx=15, pady=10)
-        ctk.CTkLabel(echo_inner, text="📢 Echo (Delay)", width=150, anchor="w", font=ctk.CTkFont(size=13, weight="bold")).pack(side="left")
-        self.karaoke_echo_var = ctk.DoubleVar(value=0.2)
-        echo_slider = ctk.CTkSlider(echo_inner, from_=0, to=1, variable=self.karaoke_echo_var, width=300, height=18, progress_color=("#8b5cf6", "#7c3aed"), button_color=("#a78bfa", "#8b5cf6"), button_hover_color=("#c4b5fd", "#a78bfa"))
-        echo_slider.pack(side="left", padx=10)
-        echo_label = ctk.CTkLabel(echo_inner, text="", width=60, font=ctk.CTkFont(size=12, weight="bold"), text_color=("#8b5cf6", "#a78bfa"))
-        echo_label.pack(side="left")
-        self.karaoke_echo_var.trace_add("write", lambda *args: echo_label.configure(text=f"{self.karaoke_echo_var.get():.2f}"))
-        echo_label.configure(text=f"{self.karaoke_echo_var.get():.2f}")
-
-        # Volume/Gain - Professional card style
-        volume_card = ctk.CTkFrame(effects_grid, fg_color=("#2d3142", "#1a1d2e"), corner_radius=12, border_width=1, border_color=("#10b981", "#059669"))
-        volume_card.pack(fill="x", pady=8, padx=5)
-        volume_inner = ctk.CTkFrame(volume_card, fg_color="transparent")
-        volume_inner.pack(fill="x", padx=15, pady=10)
-        ctk.CTkLabel(volume_inner, text="🔊 Ses Seviyesi", width=150, anchor="w", font=ctk.CTkFont(size=13, weight="bold")).pack(side="left")
-        self.karaoke_volume_var = ctk.DoubleVar(value=1.0)
-        volume_slider = ctk.CTkSlider(volume_inner, from_=0, to=2, variable=self.karaoke_volume_var, width=300, height=18, progress_color=("#10b981", "#059669"), button_color=("#34d399", "#10b981"), button_hover_color=("#6ee7b7", "#34d399"))
-        volume_slider.pack(side="left", padx=10)
-        volume_label = ctk.CTkLabel(volume_inner, text="", width=60, font=ctk.CTkFont(size=12, weight="bold"), text_color=("#10b981", "#34d399"))
-        volume_label.pack(side="left")
-        self.karaoke_volume_var.trace_add("write", lambda *args: volume_label.configure(text=f"{self.karaoke_volume_var.get():.2f}x"))
-        volume_label.configure(text=f"{self.karaoke_volume_var.get():.2f}x")
-
-        # Autotune - PROFESSIONAL STUDIO QUALITY
-        autotune_card = ctk.CTkFrame(effects_grid, fg_color=("#2d3142", "#1a1d2e"), corner_radius=12, border_width=2, border_color=("#f59e0b", "#d97706"))
-        autotune_card.pack(fill="x", pady=8, padx=5)
-        autotune_inner = ctk.CTkFrame(autotune_card, fg_color="transparent")
-        autotune_inner.pack(fill="x", padx=15, pady=10)
-        ctk.CTkLabel(autotune_inner, text="🎵 Autotune", width=150, anchor="w", font=ctk.CTkFont(size=13, weight="bold")).pack(side="left")
-        self.karaoke_autotune_var = ctk.DoubleVar(value=0.0)
-        autotune_slider = ctk.CTkSlider(autotune_inner, from_=0, to=1, variable=self.karaoke_autotune_var, width=300, height=18, progress_color=("#f59e0b", "#d97706"), button_color=("#fbbf24", "#f59e0b"), button_hover_color=("#fcd34d", "#fbbf24"))
-        autotune_slider.pack(side="left", padx=10)
-        autotune_label = ctk.CTkLabel(autotune_inner, text="", width=60, font=ctk.CTkFont(size=12, weight="bold"), text_color=("#f59e0b", "#fbbf24"))
-        autotune_label.pack(side="left")
-        self.karaoke_autotune_var.trace_add("write", lambda *args: autotune_label.configure(text=f"{int(self.karaoke_autotune_var.get() * 100)}%"))
-        autotune_label.configure(text=f"{int(self.karaoke_autotune_var.get() * 100)}%")
+        # Efekt kartları EFFECT_SPECS'ten üretilir
+        effect_cards = {spec[0]: self._make_effect_card(effects_grid, *spec) for spec in self.EFFECT_SPECS}
+        autotune_card = effect_cards["autotune"]
 
         # Autotune Key - In same card
         key_inner = ctk.CTkFrame(autotune_card, fg_color="transparent")
         key_inner.pack(fill="x", padx=15, pady=(0, 10))
-        ctk.CTkLabel(key_inner, text="🎹 Anahtar (Key)", width=150, anchor="w", font=ctk.CTkFont(size=12)).pack(side="left")
+        ctk.CTkLabel(key_inner, text="🎹 Anahtar (Key)", width=150, anchor="w", font=self.fonts["body_sm"]).pack(side="left")
         self.karaoke_key_var = ctk.StringVar(value="C Major")
         key_menu = ctk.CTkOptionMenu(key_inner, variable=self.karaoke_key_var,
                                       values=["C Major", "D Major", "E Major", "F Major", "G Major", "A Major", "B Major",
@@ -1761,33 +2155,24 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
                                       width=200, height=32, fg_color=("#f59e0b", "#d97706"), button_color=("#fbbf24", "#f59e0b"), button_hover_color=("#fcd34d", "#fbbf24"))
         key_menu.pack(side="left", padx=10)
 
-        # De-esser - Professional card style
-        deesser_card = ctk.CTkFrame(effects_grid, fg_color=("#2d3142", "#1a1d2e"), corner_radius=12, border_width=1, border_color=("#ec4899", "#db2777"))
-        deesser_card.pack(fill="x", pady=8, padx=5)
-        deesser_inner = ctk.CTkFrame(deesser_card, fg_color="transparent")
-        deesser_inner.pack(fill="x", padx=15, pady=10)
-        ctk.CTkLabel(deesser_inner, text="✂️ De-esser (Sibilans)", width=150, anchor="w", font=ctk.CTkFont(size=13, weight="bold")).pack(side="left")
-        self.karaoke_deesser_var = ctk.DoubleVar(value=0.0)
-        deesser_slider = ctk.CTkSlider(deesser_inner, from_=0, to=1, variable=self.karaoke_deesser_var, width=300, height=18, progress_color=("#ec4899", "#db2777"), button_color=("#f472b6", "#ec4899"), button_hover_color=("#f9a8d4", "#f472b6"))
-        deesser_slider.pack(side="left", padx=10)
-        deesser_label = ctk.CTkLabel(deesser_inner, text="", width=60, font=ctk.CTkFont(size=12, weight="bold"), text_color=("#ec4899", "#f472b6"))
-        deesser_label.pack(side="left")
-        self.karaoke_deesser_var.trace_add("write", lambda *args: deesser_label.configure(text=f"{int(self.karaoke_deesser_var.get() * 100)}%"))
-        deesser_label.configure(text=f"{int(self.karaoke_deesser_var.get() * 100)}%")
-
         # Monitoring checkbox - Enhanced style
         monitor_frame = ctk.CTkFrame(effects_grid, fg_color=("#2d3142", "#1a1d2e"), corner_radius=12)
         monitor_frame.pack(fill="x", pady=8, padx=5)
-        ctk.CTkCheckBox(monitor_frame, text="🎧 Kendi Sesini Duy (Real-time Monitoring)", variable=ctk.BooleanVar(value=False), font=ctk.CTkFont(size=13, weight="bold"), checkbox_width=24, checkbox_height=24).pack(pady=12, padx=15)
+        self.karaoke_monitor_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(monitor_frame, text="🎧 Kendi Sesini Duy (Real-time Monitoring)", variable=self.karaoke_monitor_var, command=self.toggle_karaoke_monitor, font=self.fonts["label_sm"], checkbox_width=24, checkbox_height=24).pack(pady=12, padx=15)
 
         # Vokal kaldırma
-        ctk.CTkCheckBox(settings_frame, text="🎤 Vokalleri Kaldır (AI)", font=ctk.CTkFont(size=14), variable=ctk.BooleanVar(value=True)).pack(pady=10)
+        ctk.CTkCheckBox(settings_frame, text="🎤 Vokalleri Kaldır (AI)", font=self.fonts["body"], variable=ctk.BooleanVar(value=True)).pack(pady=10)
+
+        # Şarkı sözü çıkarma (Whisper) - kapalıyken model hiç yüklenmez
+        self.karaoke_lyrics_var = ctk.BooleanVar(value=True)
+        ctk.CTkCheckBox(settings_frame, text="📝 Şarkı sözleri çıkar (Whisper AI)", font=self.fonts["body"], variable=self.karaoke_lyrics_var).pack(pady=(0, 10))
 
         # PROFESSIONAL PRESETS - Stüdyo Kalitesi
         preset_section = ctk.CTkFrame(scroll_container, fg_color=("#2a2d3a", "#1a1a2e"), corner_radius=15)
         preset_section.pack(pady=15, fill="x", padx=30)
 
-        ctk.CTkLabel(preset_section, text="🎚️ Professional Presets", font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", padx=20, pady=(15, 10))
+        ctk.CTkLabel(preset_section, text="🎚️ Professional Presets", font=self.fonts["heading"]).pack(anchor="w", padx=20, pady=(15, 10))
 
         preset_grid = ctk.CTkFrame(preset_section, fg_color="transparent")
         preset_grid.pack(fill="x", padx=20, pady=(0, 15))
@@ -1795,11 +2180,10 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         # Preset seçimi
         preset_frame = ctk.CTkFrame(preset_grid, fg_color="transparent")
         preset_frame.pack(fill="x", pady=5)
-        ctk.CTkLabel(preset_frame, text="🎛️ Preset Seç:", width=120, anchor="w", font=ctk.CTkFont(size=13)).pack(side="left")
+        ctk.CTkLabel(preset_frame, text="🎛️ Preset Seç:", width=120, anchor="w", font=self.fonts["body_md"]).pack(side="left")
         self.karaoke_preset_var = ctk.StringVar(value="Manuel")
         preset_menu = ctk.CTkOptionMenu(preset_frame, variable=self.karaoke_preset_var,
-                                         values=["Manuel", "🎙️ Radio Ready", "🎸 Studio Recording", "🎤 Live Performance",
-                                                 "💿 Podcast", "🎵 Rap/Hip-Hop", "🎸 Rock Vokal"],
+                                         values=["Manuel", *self.KARAOKE_PRESETS],
                                          width=250, command=self.apply_karaoke_preset)
         preset_menu.pack(side="left", padx=5)
 
@@ -1814,7 +2198,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             command=self.karaoke_create_backing,
             width=280,
             height=70,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.fonts["heading"],
             fg_color=("#667eea", "#5a67d8"),
             hover_color=("#5a67d8", "#4c51bf"),
             corner_radius=20,
@@ -1830,7 +2214,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             command=self.karaoke_record_mix,
             width=280,
             height=70,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.fonts["heading"],
             fg_color=("#ef4444", "#dc2626"),
             hover_color=("#dc2626", "#b91c1c"),
             corner_radius=20,
@@ -1845,7 +2229,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
 
         history_header = ctk.CTkFrame(history_section, fg_color="transparent")
         history_header.pack(fill="x", padx=15, pady=10)
-        ctk.CTkLabel(history_header, text="📂 Önceki Backing Track'ler", font=ctk.CTkFont(size=14, weight="bold")).pack(side="left")
+        ctk.CTkLabel(history_header, text="📂 Önceki Backing Track'ler", font=self.fonts["label"]).pack(side="left")
         ctk.CTkButton(history_header, text="🔄 Yenile", command=self.refresh_backing_tracks, width=80, height=28).pack(side="right")
 
         # Scrollable listbox frame
@@ -1870,7 +2254,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         self.karaoke_progress_bar.pack(pady=10)
         self.karaoke_progress_bar.set(0)
 
-        self.karaoke_progress_label = ctk.CTkLabel(progress_frame, text="", font=ctk.CTkFont(size=12))
+        self.karaoke_progress_label = ctk.CTkLabel(progress_frame, text="", font=self.fonts["body_sm"])
         self.karaoke_progress_label.pack()
 
     def create_converter_tab(self):
@@ -1878,14 +2262,14 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         tab = self.tabview.tab("🔄 Format Converter")
         tab.grid_columnconfigure(0, weight=1)
 
-        ctk.CTkLabel(tab, text="🔄 Professional Format Converter", font=ctk.CTkFont(size=24, weight="bold")).pack(pady=20)
+        ctk.CTkLabel(tab, text="🔄 Professional Format Converter", font=self.fonts["title_lg"]).pack(pady=20)
 
         # Dosya seçimi
         file_frame = ctk.CTkFrame(tab)
         file_frame.pack(pady=20, fill="x", padx=50)
 
-        ctk.CTkLabel(file_frame, text="📂 Dosya:", font=ctk.CTkFont(size=14)).pack(side="left", padx=10)
-        self.converter_file_label = ctk.CTkLabel(file_frame, text="Seçilmedi", font=ctk.CTkFont(size=12))
+        ctk.CTkLabel(file_frame, text="📂 Dosya:", font=self.fonts["body"]).pack(side="left", padx=10)
+        self.converter_file_label = ctk.CTkLabel(file_frame, text="Seçilmedi", font=self.fonts["body_sm"])
         self.converter_file_label.pack(side="left", padx=10)
         ctk.CTkButton(file_frame, text="Seç", command=self.converter_select_file, width=100).pack(side="right", padx=10)
 
@@ -1893,57 +2277,57 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         format_frame = ctk.CTkFrame(tab)
         format_frame.pack(pady=20, fill="x", padx=50)
 
-        ctk.CTkLabel(format_frame, text="🎵 Hedef Format:", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
-
         self.converter_format_var = ctk.StringVar(value="mp3")
 
         formats = [("MP3", "mp3"), ("WAV", "wav"), ("FLAC", "flac"), ("OGG", "ogg"), ("M4A", "m4a")]
 
-        format_btns = ctk.CTkFrame(format_frame, fg_color="transparent")
-        format_btns.pack(pady=10)
+        # Başlık + butonlar aynı kart içinde grid (ara container frame yok)
+        format_frame.grid_columnconfigure(tuple(range(len(formats))), weight=1)
+        ctk.CTkLabel(format_frame, text="🎵 Hedef Format:", font=self.fonts["heading"]).grid(row=0, column=0, columnspan=len(formats), pady=10)
 
-        for name, value in formats:
-            ctk.CTkRadioButton(format_btns, text=name, variable=self.converter_format_var, value=value, font=ctk.CTkFont(size=14)).pack(side="left", padx=20)
+        for i, (name, value) in enumerate(formats):
+            ctk.CTkRadioButton(format_frame, text=name, variable=self.converter_format_var, value=value, font=self.fonts["body"]).grid(row=1, column=i, padx=20, pady=(0, 20))
 
         # Kalite
         quality_frame = ctk.CTkFrame(tab)
         quality_frame.pack(pady=20, fill="x", padx=50)
 
-        ctk.CTkLabel(quality_frame, text="⚙️ Kalite/Bitrate:", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
-
         self.converter_quality_var = ctk.StringVar(value="high")
 
         qualities = [("Low (128k)", "low"), ("Medium (192k)", "medium"), ("High (256k)", "high"), ("Ultra (320k)", "ultra")]
 
-        quality_btns = ctk.CTkFrame(quality_frame, fg_color="transparent")
-        quality_btns.pack(pady=10)
+        quality_frame.grid_columnconfigure(tuple(range(len(qualities))), weight=1)
+        ctk.CTkLabel(quality_frame, text="⚙️ Kalite/Bitrate:", font=self.fonts["heading"]).grid(row=0, column=0, columnspan=len(qualities), pady=10)
 
-        for name, value in qualities:
-            ctk.CTkRadioButton(quality_btns, text=name, variable=self.converter_quality_var, value=value, font=ctk.CTkFont(size=12)).pack(side="left", padx=15)
+        for i, (name, value) in enumerate(qualities):
+            ctk.CTkRadioButton(quality_frame, text=name, variable=self.converter_quality_var, value=value, font=self.fonts["body_sm"]).grid(row=1, column=i, padx=15, pady=(0, 20))
 
         # Metadata
         meta_frame = ctk.CTkFrame(tab)
         meta_frame.pack(pady=20, fill="x", padx=50)
 
-        ctk.CTkLabel(meta_frame, text="📝 Metadata (Opsiyonel):", font=ctk.CTkFont(size=14)).pack(pady=10)
+        meta_frame.grid_columnconfigure((0, 1), weight=1)
+        ctk.CTkLabel(meta_frame, text="📝 Metadata (Opsiyonel):", font=self.fonts["body"]).grid(row=0, column=0, columnspan=2, pady=10)
 
-        meta_grid = ctk.CTkFrame(meta_frame, fg_color="transparent")
-        meta_grid.pack(pady=10)
+        self.meta_title = ctk.CTkEntry(meta_frame, placeholder_text="Title", width=200)
+        self.meta_title.grid(row=1, column=0, padx=10, pady=5, sticky="e")
 
-        self.meta_title = ctk.CTkEntry(meta_grid, placeholder_text="Title", width=200)
-        self.meta_title.grid(row=0, column=0, padx=10, pady=5)
+        self.meta_artist = ctk.CTkEntry(meta_frame, placeholder_text="Artist", width=200)
+        self.meta_artist.grid(row=1, column=1, padx=10, pady=5, sticky="w")
 
-        self.meta_artist = ctk.CTkEntry(meta_grid, placeholder_text="Artist", width=200)
-        self.meta_artist.grid(row=0, column=1, padx=10, pady=5)
+        self.meta_album = ctk.CTkEntry(meta_frame, placeholder_text="Album", width=200)
+        self.meta_album.grid(row=2, column=0, padx=10, pady=(5, 20), sticky="e")
 
-        self.meta_album = ctk.CTkEntry(meta_grid, placeholder_text="Album", width=200)
-        self.meta_album.grid(row=1, column=0, padx=10, pady=5)
-
-        self.meta_genre = ctk.CTkEntry(meta_grid, placeholder_text="Genre", width=200)
-        self.meta_genre.grid(row=1, column=1, padx=10, pady=5)
+        self.meta_genre = ctk.CTkEntry(meta_frame, placeholder_text="Genre", width=200)
+        self.meta_genre.grid(row=2, column=1, padx=10, pady=(5, 20), sticky="w")
 
         # Convert butonu
-        ctk.CTkButton(tab, text="🔄 DÖNÜŞTÜR", command=self.converter_convert, height=70, font=ctk.CTkFont(size=20, weight="bold"), fg_color=self.colors["success"]).pack(pady=30)
+        ctk.CTkButton(tab, text="🔄 DÖNÜŞTÜR", command=self.converter_convert, height=70, font=self.fonts["title_md"], fg_color=self.colors["success"]).pack(pady=(30, 10))
+
+        # İlerleme (ffmpeg -progress çıktısından)
+        self.converter_progress_bar = ctk.CTkProgressBar(tab, width=400)
+        self.converter_progress_bar.pack(pady=(0, 30))
+        self.converter_progress_bar.set(0)
 
     # === YENİ METODLAR ===
 
@@ -1967,7 +2351,7 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         track_frame.pack(fill="x", pady=10, padx=10)
 
         # Track adı
-        ctk.CTkLabel(track_frame, text=f"🎵 {track.name}", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=10, pady=5)
+        ctk.CTkLabel(track_frame, text=f"🎵 {track.name}", font=self.fonts["label"]).pack(anchor="w", padx=10, pady=5)
 
         # Volume slider
         vol_frame = ctk.CTkFrame(track_frame, fg_color="transparent")
@@ -1992,11 +2376,15 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         self.mixer_track_widgets.append(track_frame)
 
     def mixer_auto_sync(self):
-        """AI tempo/key sync"""
-        self.audio_mixer.auto_sync_tempo()
-        self.audio_mixer.auto_match_keys()
-        self.add_log("🤖 AI sync tamamlandı")
-        messagebox.showinfo("Başarılı", "Track'ler senkronize edildi!")
+        """AI tempo/key sync (analiz worker thread'de, UI donmaz)"""
+        def sync():
+            self.audio_mixer.auto_sync_tempo()
+            self.audio_mixer.auto_match_keys()
+            self.add_log("🤖 AI sync tamamlandı")
+            self._ui(messagebox.showinfo, "Başarılı", "Track'ler senkronize edildi!")
+
+        self.add_log("🤖 AI sync başladı...")
+        threading.Thread(target=sync, daemon=True).start()
 
     def mixer_clear(self):
         """Tüm track'leri temizle"""
@@ -2046,8 +2434,8 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             self.karaoke_output_folder = folder
             self.karaoke_output_label.configure(text=folder)
             self.add_log(f"💾 Çıkış klasörü: {folder}")
-            # Otomatik kaydet
-            self.save_config()
+            # Otomatik kaydet (ertelenmiş - kapanışta bekleyen yazım uygulanır)
+            self.schedule_save_config()
 
     def karaoke_create_backing(self):
         """Backing track oluştur"""
@@ -2060,30 +2448,30 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             return
 
         def create():
-            self.status_badge.configure(text="● İşleniyor", text_color="#f59e0b")
-            self.karaoke_progress_bar.set(0)
-            self.karaoke_progress_label.configure(text="Başlatılıyor...")
+            self.post_ui("status_badge", self.status_badge.configure, text="● İşleniyor", text_color="#f59e0b")
+            self.post_ui("karaoke_progress_bar", self.karaoke_progress_bar.set, 0)
+            self.post_ui("karaoke_progress_label", self.karaoke_progress_label.configure, text="Başlatılıyor...")
 
             if not self.karaoke_mode:
-                self.karaoke_progress_label.configure(text="🤖 AI modeli yükleniyor...")
-                self.karaoke_progress_bar.set(0.1)
+                self.post_ui("karaoke_progress_label", self.karaoke_progress_label.configure, text="🤖 AI modeli yükleniyor...")
+                self.post_ui("karaoke_progress_bar", self.karaoke_progress_bar.set, 0.1)
                 self.add_log("🤖 Demucs AI modeli yükleniyor...")
-                self.demucs_status.configure(text="🟡 Demucs: Yükleniyor...")
+                self.post_ui("demucs_status", self.demucs_status.configure, text="🟡 Demucs: Yükleniyor...")
                 self.karaoke_mode = KaraokeMode(self.model_manager)
-                self.demucs_status.configure(text="🟢 Demucs: Hazır")
+                self.post_ui("demucs_status", self.demucs_status.configure, text="🟢 Demucs: Hazır")
                 self.models_loaded["demucs"] = True
                 self.add_log("✓ Demucs hazır")
 
-            self.karaoke_progress_bar.set(0.2)
-            self.karaoke_progress_label.configure(text="📂 Dosya okunuyor...")
+            self.post_ui("karaoke_progress_bar", self.karaoke_progress_bar.set, 0.2)
+            self.post_ui("karaoke_progress_label", self.karaoke_progress_label.configure, text="📂 Dosya okunuyor...")
             self.add_log(f"📂 İşleniyor: {Path(self.karaoke_file).name}")
 
-            self.karaoke_progress_bar.set(0.3)
-            self.karaoke_progress_label.configure(text="🎤 Vokaller ayrıştırılıyor (RTX 5090)...")
+            self.post_ui("karaoke_progress_bar", self.karaoke_progress_bar.set, 0.3)
+            self.post_ui("karaoke_progress_label", self.karaoke_progress_label.configure, text="🎤 Vokaller ayrıştırılıyor (RTX 5090)...")
             self.add_log("🎤 AI ile vokal ayırma başladı...")
 
-            self.karaoke_progress_bar.set(0.5)
-            self.karaoke_progress_label.configure(text="🎼 Backing track oluşturuluyor...")
+            self.post_ui("karaoke_progress_bar", self.karaoke_progress_bar.set, 0.5)
+            self.post_ui("karaoke_progress_label", self.karaoke_progress_label.configure, text="🎼 Backing track oluşturuluyor...")
 
             backing = self.karaoke_mode.create_backing_track(
                 self.karaoke_file,
@@ -2093,46 +2481,66 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
                 tempo_change=self.karaoke_tempo_var.get()
             )
 
+            # Demucs bu akışta artık gerekmez: VRAM'i Whisper'a ve karaoke'ye bırak
+            # (models_loaded False -> sonraki ayırma _ensure_demucs ile yeniden yükler)
+            with self._demucs_lock:
+                if self.models_loaded.get("demucs"):
+                    self.model_manager.unload_demucs()
+                    self.models_loaded["demucs"] = False
+                    self.post_ui("demucs_status", self.demucs_status.configure, text="⚪ Demucs: Boşaltıldı")
+                    self.add_log("🧹 Demucs bellekten boşaltıldı (VRAM serbest)")
+
             if backing:
                 # BACKING TRACK YOLUNU SAKLA
                 self.karaoke_backing_track = backing
+                self.karaoke_lyrics_path = None
 
-                # ŞARKI SÖZLERİNİ ÇIKAR (Whisper AI)
-                self.karaoke_progress_bar.set(0.9)
-                self.karaoke_progress_label.configure(text="🎤 Şarkı sözleri çıkarılıyor (Whisper AI)...")
-                self.add_log("🎤 Whisper AI ile şarkı sözleri çıkarılıyor...")
-
-                try:
-                    from core.music_analyzer import MusicAnalyzer
-                    import json
-
-                    analyzer = MusicAnalyzer()
-                    lyrics_result = analyzer.transcribe_lyrics(
-                        self.karaoke_file,
-                        output_dir=self.karaoke_output_folder,
-                        language="auto"  # Otomatik dil tespiti
-                    )
+                # ŞARKI SÖZLERİNİ ÇIKAR (Whisper AI) - kapalıysa Whisper hiç yüklenmez
+                if not self.karaoke_lyrics_var.get():
+                    self.add_log("ℹ️ Şarkı sözü çıkarma kapalı (Whisper atlandı)")
+                else:
+                    self.post_ui("karaoke_progress_bar", self.karaoke_progress_bar.set, 0.9)
+                    self.post_ui("karaoke_progress_label", self.karaoke_progress_label.configure, text="🎤 Şarkı sözleri çıkarılıyor (Whisper AI)...")
+                    self.add_log("🎤 Whisper AI ile şarkı sözleri çıkarılıyor...")
 
-                    if lyrics_result.get('success'):
-                        # Save lyrics as JSON for karaoke player
-                        lyrics_json_path = Path(backing).with_suffix('.lyrics.json')
-                        with open(lyrics_json_path, 'w', encoding='utf-8') as f:
-                            json.dump(lyrics_result, f, ensure_ascii=False, indent=2)
+                    try:
+                        # Tek MusicAnalyzer örneği tekrar kullanılır (yeniden init yok)
+                        lyrics_result = self.get_music_analyzer().transcribe_lyrics(
+                            self.karaoke_file,
+                            output_dir=self.karaoke_output_folder,
+                            language="auto"  # Otomatik dil tespiti
+                        )
 
-                        self.add_log(f"✅ Şarkı sözleri çıkarıldı!")
-                        self.add_log(f"📝 Dil: {lyrics_result.get('language', 'unknown')}")
-                        self.add_log(f"📄 Sözler kaydedildi: {lyrics_json_path}")
-                    else:
-                        self.add_log("⚠️ Şarkı sözleri çıkarılamadı (devam ediliyor)")
-                except Exception as e:
-                    self.add_log(f"⚠️ Sözler çıkarılamadı: {e}")
+                        if lyrics_result.get('success'):
+                            # Save lyrics as JSON for karaoke player
+                            lyrics_json_path = Path(backing).with_suffix('.lyrics.json')
+                            if ORJSON_AVAILABLE:
+                                # Kelime zamanlı binlerce segment: native serileştirme, UTF-8 bayt olarak yaz
+                                lyrics_json_path.write_bytes(orjson.dumps(
+                                    lyrics_result,
+                                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+                            else:
+                                with open(lyrics_json_path, 'w', encoding='utf-8') as f:
+                                    json.dump(lyrics_result, f, ensure_ascii=False, indent=2)
+
+                            self.add_log(f"✅ Şarkı sözleri çıkarıldı!")
+                            self.add_log(f"📝 Dil: {lyrics_result.get('language', 'unknown')}")
+                            self.add_log(f"📄 Sözler kaydedildi: {lyrics_json_path}")
+                            self.karaoke_lyrics_path = lyrics_json_path
+                        else:
+                            self.add_log("⚠️ Şarkı sözleri çıkarılamadı (devam ediliyor)")
+                    except Exception as e:
+                        self.add_log(f"⚠️ Sözler çıkarılamadı: {e}")
 
                 # AUTO-CONVERT EXISTING _lyrics.txt FILES
                 try:
                     # Check for existing _lyrics.txt file in source folder
                     source_file = Path(self.karaoke_file)
                     source_folder = source_file.parent
-                    lyrics_txt_files = list(source_folder.glob("*_lyrics.txt"))
+                    # Tek scandir geçişi: Path yalnızca eşleşen dosyalar için oluşturulur
+                    with os.scandir(source_folder) as it:
+                        lyrics_txt_files = [Path(e.path) for e in it
+                                            if e.name.endswith("_lyrics.txt") and e.is_file()]
 
                     if lyrics_txt_files:
                         self.add_log(f"📝 {len(lyrics_txt_files)} adet _lyrics.txt dosyası bulundu!")
@@ -2145,27 +2553,29 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
                                 import shutil
                                 target_json = Path(backing).with_suffix('.lyrics.json')
                                 shutil.copy(json_path, target_json)
+                                self.karaoke_lyrics_path = target_json
                                 self.add_log(f"✅ Lyrics JSON oluşturuldu!")
                                 self.add_log(f"📄 Dosya: {target_json}")
                 except Exception as e:
                     self.add_log(f"ℹ️ Lyrics TXT dönüşümü: {e}")
 
                 file_size = Path(backing).stat().st_size / (1024*1024)
-                self.karaoke_progress_bar.set(1.0)
-                self.karaoke_progress_label.configure(text=f"✅ Tamamlandı! ({file_size:.2f} MB)")
+                self.post_ui("karaoke_progress_bar", self.karaoke_progress_bar.set, 1.0)
+                self.post_ui("karaoke_progress_label", self.karaoke_progress_label.configure, text=f"✅ Tamamlandı! ({file_size:.2f} MB)")
                 self.add_log(f"✅ Backing track oluşturuldu!")
                 self.add_log(f"📂 Dosya: {backing}")
                 self.add_log(f"📦 Boyut: {file_size:.2f} MB")
                 self.add_log(f"🎤 Artık 'KAYIT + MİX' butonuna tıklayabilirsin!")
-                messagebox.showinfo("Başarılı", f"Backing track oluşturuldu!\n\n{backing}\n\nBoyut: {file_size:.2f} MB\n\n✅ Artık kayıt yapabilirsin!")
+                self._ui(messagebox.showinfo, "Başarılı", f"Backing track oluşturuldu!\n\n{backing}\n\nBoyut: {file_size:.2f} MB\n\n✅ Artık kayıt yapabilirsin!")
             else:
                 self.karaoke_backing_track = None
-                self.karaoke_progress_bar.set(0)
-                self.karaoke_progress_label.configure(text="❌ Hata!")
+                self.karaoke_lyrics_path = None
+                self.post_ui("karaoke_progress_bar", self.karaoke_progress_bar.set, 0)
+                self.post_ui("karaoke_progress_label", self.karaoke_progress_label.configure, text="❌ Hata!")
                 self.add_log("❌ Hata: Backing track oluşturulamadı!")
-                messagebox.showerror("Hata", "Backing track oluşturulamadı!")
+                self._ui(messagebox.showerror, "Hata", "Backing track oluşturulamadı!")
 
-            self.status_badge.configure(text="● Hazır", text_color="#10b981")
+            self.post_ui("status_badge", self.status_badge.configure, text="● Hazır", text_color="#10b981")
 
         threading.Thread(target=create, daemon=True).start()
 
@@ -2175,6 +2585,8 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             value = float(self.karaoke_pitch_entry.get())
             value = max(-12, min(12, value))  # -12 ile 12 arası sınırla
             self.karaoke_pitch_var.set(value)
+            # Slider + etiket tek seferde boyansın (olay döngüsüne yeniden girmeden)
+            self.karaoke_pitch_entry.master.update_idletasks()
         except ValueError:
             self.karaoke_pitch_entry.delete(0, "end")
             self.karaoke_pitch_entry.insert(0, f"{self.karaoke_pitch_var.get():.1f}")
@@ -2185,15 +2597,68 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             value = float(self.karaoke_tempo_entry.get())
             value = max(0.5, min(2.0, value))  # 0.5 ile 2.0 arası sınırla
             self.karaoke_tempo_var.set(value)
+            self.karaoke_tempo_entry.master.update_idletasks()
         except ValueError:
             self.karaoke_tempo_entry.delete(0, "end")
             self.karaoke_tempo_entry.insert(0, f"{self.karaoke_tempo_var.get():.2f}")
 
+    def _load_backing_audio(self, path):
+        """Backing track'i (örnek, kanal) float32 olarak yükle - 48kHz'e resample sonucu diskte önbelleklenir"""
+        path = Path(path)
+        with sf.SoundFile(str(path)) as f:
+            sr = f.samplerate
+            if sr <= 48000:
+                # Resample yok: doğrudan oku (float32, her zaman 2D - float64 kopyası yok)
+                return f.read(dtype='float32', always_2d=True), sr
+
+            # Önbellek anahtarı: yol + boyut + mtime (dosya değişince anahtar da değişir)
+            stat = path.stat()
+            prefix = f"{path.stem}.{hashlib.md5(str(path.resolve()).encode()).hexdigest()[:12]}"
+            cache_file = self.karaoke_cache_dir / f"{prefix}.{stat.st_size}.{stat.st_mtime_ns}.48k.f32.npy"
+            if cache_file.exists():
+                self.add_log(f"⚡ Resample önbellekten: {cache_file.name}")
+                # mmap: kopyasız, sayfalar erişildikçe OS page cache'ten gelir
+                return np.load(cache_file, mmap_mode='r'), 48000
+
+            backing_audio = f.read(dtype='float32', always_2d=True)
+
+        # EXTREME LOW LATENCY: 48kHz'e downsample
+        self.add_log(f"⚡ Ultra low latency: {sr}Hz -> 48000Hz resampling...")
+        if SOXR_AVAILABLE:
+            # (örnek, kanal) float32 doğrudan - transpoz yok, C polyphase çekirdek
+            backing_audio = soxr.resample(backing_audio, sr, 48000, quality='HQ')
+        else:
+            import librosa
+            backing_audio = np.ascontiguousarray(librosa.resample(backing_audio.T, orig_sr=sr, target_sr=48000).T)
+
+        try:
+            self.karaoke_cache_dir.mkdir(parents=True, exist_ok=True)
+            # Aynı dosyanın eski sürümlerine ait önbellekleri temizle
+            for stale in self.karaoke_cache_dir.glob(f"{prefix}.*.npy"):
+                stale.unlink()
+            # Atomik yazım: yarım kalan dosya önbellek olarak okunmaz
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                np.save(f, backing_audio)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.add_log(f"⚠️ Resample önbelleği yazılamadı: {e}")
+
+        return backing_audio, 48000
+
+    @staticmethod
+    def _parse_device_id(label):
+        """'[3] Cihaz adı' etiketinden cihaz ID'si - varsayılan/tanımsız ise None"""
+        match = DEVICE_ID_RE.search(label or "")
+        return int(match.group(1)) if match else None
+
     def karaoke_record_mix(self):
         """Kaydet ve mix et - Real-time karaoke with effects"""
         # Eğer karaoke zaten çalışıyorsa, DURDUR
         if hasattr(self, 'karaoke_stream') and self.karaoke_stream and self.karaoke_stream.active:
             self.add_log("⏹️ Karaoke durduruluyor...")
+            # Bekleyen karaoke thread'ini hemen uyandır
+            self._karaoke_stop.set()
             try:
                 self.karaoke_stream.stop()
                 self.karaoke_stream.close()
@@ -2233,20 +2698,26 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             # Otomatik olarak output klasöründe backing track ara
             self.add_log(f"DEBUG: output_folder = {self.karaoke_output_folder}")
             if self.karaoke_output_folder and Path(self.karaoke_output_folder).exists():
-                # Tüm WAV dosyalarını bul
-                all_wavs = list(Path(self.karaoke_output_folder).glob("*.wav"))
-                self.add_log(f"DEBUG: Bulunan WAV dosyaları ({len(all_wavs)}):")
-                for wav in all_wavs:
-                    self.add_log(f"  - {wav.name}")
-
-                # Instrumental veya backing içerenleri filtrele
-                backing_files = [f for f in all_wavs if 'instrumental' in f.name.lower() or 'backing' in f.name.lower()]
+                # Tek scandir geçişi: WAV'ları listele, instrumental/backing içerenleri aynı anda ayır
+                wav_names, backing_files = [], []
+                with os.scandir(self.karaoke_output_folder) as it:
+                    for entry in it:
+                        if entry.name.endswith(".wav") and entry.is_file():
+                            wav_names.append(entry.name)
+                            lower = entry.name.lower()
+                            if 'instrumental' in lower or 'backing' in lower:
+                                backing_files.append(entry)
+                self.add_log(f"DEBUG: Bulunan WAV dosyaları ({len(wav_names)}):")
+                for name in wav_names:
+                    self.add_log(f"  - {name}")
+
                 self.add_log(f"DEBUG: Backing track dosyaları ({len(backing_files)}):")
                 for bf in backing_files:
                     self.add_log(f"  - {bf.name}")
 
                 if backing_files:
-                    self.karaoke_backing_track = str(backing_files[0])
+                    self.karaoke_backing_track = backing_files[0].path
+                    self.karaoke_lyrics_path = None
                     self.add_log(f"✓ Backing track otomatik bulundu: {Path(self.karaoke_backing_track).name}")
                 else:
                     self.add_log("DEBUG: Hiç backing track bulunamadı!")
@@ -2271,50 +2742,33 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         self.add_log(f"🎤 Mikrofon: {mic_device}")
         self.add_log(f"🔊 Hoparlör: {speaker_device}")
 
+        # Cihaz ID'leri thread'e girmeden bir kez çözülür (None = varsayılan cihaz)
+        self.karaoke_mic_id = self._parse_device_id(mic_device)
+        self.karaoke_speaker_id = self._parse_device_id(speaker_device)
+        mic_id, speaker_id = self.karaoke_mic_id, self.karaoke_speaker_id
+
         # Thread'de çalıştır
         def start_karaoke():
-            import sounddevice as sd
-            import soundfile as sf
-            import numpy as np
-            from pedalboard import Pedalboard, Reverb, Compressor, PeakFilter
+            # Efekt sınıfları bir kez bağlanır: rebuild_fx_board (slider olayları) closure'dan okur
+            from pedalboard import Pedalboard, Reverb, Compressor, PeakFilter, Delay
             from gui.karaoke_player import KaraokePlayer
 
             try:
-                # Backing track yükle
-                backing_audio, sr = sf.read(self.karaoke_backing_track)
-
-                # EXTREME LOW LATENCY: 48kHz'e downsample (eğer daha yüksekse)
-                if sr > 48000:
-                    import librosa
-                    self.add_log(f"⚡ Ultra low latency: {sr}Hz -> 48000Hz resampling...")
-                    backing_audio = librosa.resample(backing_audio.T, orig_sr=sr, target_sr=48000).T
-                    sr = 48000
+                backing_audio, sr = self._load_backing_audio(self.karaoke_backing_track)
 
-                # Load lyrics (multiple locations supported)
+                # Load lyrics: yol backing track belirlenirken hazırlanır (tek stat, arama yok)
                 lyrics_data = None
-                import json
-
-                # Try different lyrics file locations
-                lyrics_paths = [
-                    Path(self.karaoke_backing_track).with_suffix('.lyrics.json'),  # Next to backing track
-                ]
-
-                # Add karaoke_file paths only if it exists
-                if self.karaoke_file:
-                    lyrics_paths.append(Path(self.karaoke_file).with_suffix('') / "_lyrics.json")  # Original analyzer location
-                    lyrics_paths.append(Path(self.karaoke_file).parent / (Path(self.karaoke_file).stem + "_lyrics.json"))  # Same folder
-
-                self.add_log(f"DEBUG: Lyrics aranıyor ({len(lyrics_paths)} konum)...")
-                for lyrics_file in lyrics_paths:
-                    self.add_log(f"DEBUG: Deneniyor: {lyrics_file}")
-                    if lyrics_file.exists():
-                        try:
+                lyrics_file = self.karaoke_lyrics_path or Path(self.karaoke_backing_track).with_suffix('.lyrics.json')
+                if lyrics_file.exists():
+                    try:
+                        if ORJSON_AVAILABLE:
+                            lyrics_data = orjson.loads(lyrics_file.read_bytes())
+                        else:
                             with open(lyrics_file, 'r', encoding='utf-8') as f:
                                 lyrics_data = json.load(f)
-                            self.add_log(f"✅ Şarkı sözleri yüklendi: {lyrics_file.name}")
-                            break
-                        except Exception as e:
-                            self.add_log(f"⚠️ Sözler okunamadı ({lyrics_file.name}): {e}")
+                        self.add_log(f"✅ Şarkı sözleri yüklendi: {lyrics_file.name}")
+                    except Exception as e:
+                        self.add_log(f"⚠️ Sözler okunamadı ({lyrics_file.name}): {e}")
 
                 if not lyrics_data:
                     self.add_log("⚠️ Şarkı sözleri bulunamadı (karaoke player sade görünecek)")
@@ -2353,7 +2807,6 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
 
                 # Function to rebuild FX board from player's parameters
                 def rebuild_fx_board():
-                    from pedalboard import Delay
                     p = karaoke_player.fx_params
 
                     effects = [
@@ -2392,13 +2845,20 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
                     return Pedalboard(effects)
 
                 # Create initial FX board
-                from pedalboard import Delay
-                fx_board = rebuild_fx_board()
+                # Tek elemanlı liste: UI thread yeni board'u kurup tek atamayla değiştirir,
+                # audio callback blok başına bir kez okur (GIL altında atomik)
+                fx_ref = [rebuild_fx_board()]
+                self._last_fx_params = dict(karaoke_player.fx_params)
 
                 # Callback to update FX when user changes sliders
+                # (player slider sürüklemesini debounce eder: burada yalnızca son değerler gelir)
                 def on_fx_change(params):
-                    nonlocal fx_board
-                    fx_board = rebuild_fx_board()
+                    last = self._last_fx_params
+                    # Kayda değer değişiklik yoksa native board yeniden kurulmaz
+                    if all(abs(params[k] - last.get(k, math.inf)) <= 1e-3 for k in params):
+                        return
+                    self._last_fx_params = dict(params)
+                    fx_ref[0] = rebuild_fx_board()
                     self.add_log(f"🎛️ FX güncellendi")
 
                 karaoke_player.on_fx_change_callback = on_fx_change
@@ -2407,105 +2867,135 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
                 self.add_log("🎤 Mikrofon aktif - PROFESYONEL FX AKTIF!")
                 self.add_log("⏹️ Durdurmak için tekrar 'KAYIT + MİX' butonuna tıkla")
 
-                # Parse mikrofon device ID
-                mic_id = None
-                if mic_device != "Varsayılan (Default)" and "[" in mic_device:
-                    mic_id = int(mic_device.split("[")[1].split("]")[0])
-
-                # Parse hoparlör device ID
-                speaker_id = None
-                if speaker_device != "Varsayılan (Default)" and "[" in speaker_device:
-                    speaker_id = int(speaker_device.split("[")[1].split("]")[0])
-
                 # Kayıt parametreleri
                 # Mikrofon: genellikle mono (1 kanal)
                 # Output: stereo (backing track ile aynı)
                 input_channels = 1  # Mikrofon mono
-                output_channels = 2 if len(backing_audio.shape) > 1 else 1
+                output_channels = 2
+
+                # OPTIMIZED LOW LATENCY - Stable performance
+                blocksize = 128  # Balanced: 128 samples = ~2.7ms @ 48kHz (stable, no dropouts)
+
+                # Sonu sessizlikle blok katına tamamla: callback'te sınır kontrolü / np.pad yok
+                # (zaten blok katıysa kopyalanmaz - önbellekten gelen memmap diskte kalır)
+                pad = -len(backing_audio) % blocksize
+                if pad:
+                    backing_audio = np.pad(backing_audio, ((0, pad), (0, 0)))
 
-                # Backing track'i stereo yap (eğer değilse)
-                if len(backing_audio.shape) == 1:
-                    backing_audio = np.stack([backing_audio, backing_audio], axis=-1)
-                    output_channels = 2
+                # Backing track'i stereo yap (eğer değilse) - kopyasız broadcast görünümü
+                if backing_audio.shape[1] == 1:
+                    backing_audio = np.broadcast_to(backing_audio, (len(backing_audio), 2))
+
+                # (blok, örnek, kanal) görünümü - backing_blocks[i] kopyasız, bitişik blok
+                backing_blocks = backing_audio.reshape(-1, blocksize, 2)
+                n_blocks = len(backing_blocks)
 
                 # Callback function for PROFESSIONAL real-time audio processing with FX
                 frame_idx = [0]  # Mutable counter for backing track position
 
                 # Setup seek callback
                 def on_seek(position_samples):
-                    frame_idx[0] = position_samples
+                    frame_idx[0] = position_samples - position_samples % blocksize  # Blok sınırına hizala
 
                 karaoke_player.on_seek_callback = on_seek
 
+                # De-esser: sidechain (5 kHz high-pass) sibilans oranını izler, oran eşiği aştıkça
+                # ~6.5 kHz peaking cut derinleşir (slider = en fazla -12 dB); filtre durumları bloklar arasında korunur
+                deess_state = np.zeros(2)
+                deess_coeffs = [0.0, None]  # (kesim dB, biquad katsayıları)
+                deess_buf = np.empty(blocksize, dtype=np.float32)  # Filtre çıkışı - tek sefer ayrılır
+                side_state = np.zeros(2)
+                side_coeffs = highpass_coeffs(5000.0, 0.707, sr)
+                side_buf = np.empty(blocksize, dtype=np.float32)
+                deess_env = [0.0]
+                deess_release = math.exp(-blocksize / (sr * 0.08))  # ~80 ms bırakma
+
+                # VU / oynatıcı konumu ~30 Hz yeterli: her vu_every blokta bir güncelle
+                vu_every = max(1, int(sr / blocksize / 30))
+                vu_counter = [0]
+
+                # FX toplu işleme: fx_group adet stream bloğu tek fx_board çağrısında işlenir
+                # (çağrı başına sabit maliyet bölünür, gecikme +1 FX bloğu)
+                fx_group = max(1, self.karaoke_fx_blocksize // blocksize)
+                fx_blocksize = fx_group * blocksize
+
+                # Mikrofon mono -> stereo toplama tamponu (kanal, örnek) - tek sefer ayrılır
+                fx_in = np.empty((2, fx_blocksize), dtype=np.float32)
+                # Önceki FX bloğunun çıktısı (örnek, kanal); ilk blok sessiz
+                fx_out = [np.zeros((fx_blocksize, 2), dtype=np.float32)]
+                fx_slot = [0]
+
+                # Backing track bittikten sonra kullanılan tek sefer ayrılmış sessiz blok
+                silence_block = np.zeros((blocksize, 2), dtype=np.float32)
+
                 def audio_callback(indata, outdata, frames, time, status):
                     if status:
                         print(f"Status: {status}")
 
-                    # Mikrofon ses seviyesini al (mono)
-                    mic_level = np.sqrt(np.mean(indata**2))
-
-                    # VU metre güncelle (amplitude to dB)
-                    left_amp = mic_level * self.karaoke_volume_var.get()
-                    right_amp = mic_level * self.karaoke_volume_var.get()
-                    self.karaoke_vu_meter.set_levels_from_amplitude(left_amp, right_amp)
-
-                    # Update karaoke player position
-                    karaoke_player.update_position(frame_idx[0])
-
-                    # Backing track frame'ini al
-                    start = frame_idx[0]
-                    end = min(start + frames, len(backing_audio))
-
-                    if start < len(backing_audio):
-                        backing_chunk = backing_audio[start:end]
-                        frame_idx[0] = end
-
-                        # Boyut eşitle
-                        if len(backing_chunk) < frames:
-                            backing_chunk = np.pad(backing_chunk, ((0, frames - len(backing_chunk)), (0, 0)))
-
-                        # Mikrofon mono -> stereo'ya çevir
-                        mic_stereo = np.stack([indata[:, 0], indata[:, 0]], axis=-1)
-
+                    # VU metre + oynatıcı konumu (ekran tazeleme hızında, her blokta değil)
+                    vu_counter[0] += 1
+                    if vu_counter[0] >= vu_every:
+                        vu_counter[0] = 0
+                        self.karaoke_vu_meter.set_levels_from_block(indata[:, 0], self.karaoke_volume_var.get())
+                        karaoke_player.update_position(frame_idx[0])
+
+                    mic = indata[:, 0]
+                    deess = self.karaoke_deesser_var.get()
+                    if deess > 0:
+                        # Yüksek bant gücünün toplam güce oranı: seviyeden bağımsız sibilans ölçüsü
+                        biquad(mic, side_buf, side_state, *side_coeffs)
+                        ratio = float(np.dot(side_buf, side_buf)) / (float(np.dot(mic, mic)) + 1e-12)
+                        # Anlık atak, üstel bırakma
+                        env = max(ratio, deess_env[0] * deess_release)
+                        deess_env[0] = env
+                        # Oran 0.2'de kesim başlar, 0.5'te tam derinliğe ulaşır
+                        amount = min(1.0, max(0.0, (env - 0.2) / 0.3))
+                        # 0.5 dB adımlar: katsayılar yalnızca kesim değişince yeniden hesaplanır
+                        cut_db = round(-24.0 * deess * amount) / 2
+                        if deess_coeffs[1] is None or deess_coeffs[0] != cut_db:
+                            deess_coeffs[:] = [cut_db, peaking_coeffs(6500.0, cut_db, 2.0, sr)]
+                        biquad(mic, deess_buf, deess_state, *deess_coeffs[1])
+                        mic = deess_buf
+
+                    # Mikrofon mono -> stereo: toplama tamponundaki yuvaya yaz (yeni dizi yok)
+                    start = fx_slot[0] * blocksize
+                    end = start + blocksize
+                    fx_in[0, start:end] = mic
+                    fx_in[1, start:end] = mic
+                    # Aynı yuvanın bir önceki FX bloğundaki işlenmiş karşılığı
+                    mic_with_effects = fx_out[0][start:end]
+
+                    fx_slot[0] += 1
+                    if fx_slot[0] == fx_group:
+                        fx_slot[0] = 0
                         # === PROFESSIONAL FX PROCESSING ===
-                        # Apply STUDIO-QUALITY effects to microphone input
+                        # Compressor -> EQ -> Reverb (optimal order for vocals)
+                        # reset=False: reverb kuyruğu / delay hattı bloklar arasında korunur
+                        # Pedalboard (kanal, örnek) bekler; çıktı (örnek, kanal)'a döner
                         try:
-                            # Pedalboard expects shape: (channels, samples)
-                            mic_transposed = mic_stereo.T  # (samples, 2) -> (2, samples)
-
-                            # Apply professional effect chain
-                            # Compressor -> EQ -> Reverb (optimal order for vocals)
-                            mic_fx = fx_board(mic_transposed, sr)
-
-                            # Back to (samples, channels)
-                            mic_with_effects = mic_fx.T * self.karaoke_volume_var.get()
+                            fx_out[0] = fx_ref[0](fx_in, sr, reset=False).T
                         except Exception:
-                            # Fallback to no FX if error
-                            mic_with_effects = mic_stereo * self.karaoke_volume_var.get()
-
-                        # Mix (backing track + mikrofon with professional FX)
-                        mixed = backing_chunk + mic_with_effects
-
-                        # Clipping önle
-                        mixed = np.clip(mixed, -1.0, 1.0)
-
-                        # Output'a yaz
-                        outdata[:] = mixed
+                            # Fallback to no FX if error (fx_in sonraki blokta üzerine yazılır - kopya)
+                            fx_out[0] = fx_in.T.copy()
+
+                    # Backing track bloğunu al (stream sabit blocksize ile çağırır)
+                    # Track bittiyse sessiz blok: parça sonu ayrı bir yol gerektirmez
+                    block_idx = frame_idx[0] // blocksize
+                    if block_idx < n_blocks:
+                        backing_chunk = backing_blocks[block_idx]
+                        frame_idx[0] += blocksize
                     else:
-                        # Backing track bitti - sadece mikrofonu FX ile çıkar
-                        mic_stereo = np.stack([indata[:, 0], indata[:, 0]], axis=-1)
+                        backing_chunk = silence_block
 
-                        try:
-                            mic_transposed = mic_stereo.T
-                            mic_fx = fx_board(mic_transposed, sr)
-                            outdata[:] = mic_fx.T * self.karaoke_volume_var.get()
-                        except:
-                            outdata[:] = mic_stereo * self.karaoke_volume_var.get()
+                    # Mix (backing track + mikrofon with professional FX) doğrudan outdata'da:
+                    # ara dizi yok, bellek üzerinden tek geçiş
+                    np.multiply(mic_with_effects, self.karaoke_volume_var.get(), out=outdata)
+                    outdata += backing_chunk
 
-                # Stream başlat (ayrı input/output kanal sayısı)
-                # OPTIMIZED LOW LATENCY - Stable performance
-                blocksize = 128  # Balanced: 128 samples = ~2.7ms @ 48kHz (stable, no dropouts)
+                    # Clipping önle
+                    np.clip(outdata, -1.0, 1.0, out=outdata)
 
+                # Stream başlat (ayrı input/output kanal sayısı)
                 # Stream'i self'e kaydet (stop için)
                 self.karaoke_stream = sd.Stream(device=(mic_id, speaker_id),
                              samplerate=sr,
@@ -2515,19 +3005,19 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
                              latency='low',  # Low latency mode
                              prime_output_buffers_using_stream_callback=False)
 
+                self._karaoke_stop.clear()
                 self.karaoke_stream.start()
-                latency_ms = (blocksize / sr) * 1000
+                latency_ms = (blocksize + fx_blocksize) / sr * 1000
                 self.add_log("✅ Karaoke aktif! (PROFESYONEL MODE)")
-                self.add_log(f"🎯 Latency: ~{latency_ms:.1f}ms ({blocksize} samples @ {sr}Hz)")
+                self.add_log(f"🎯 Latency: ~{latency_ms:.1f}ms ({blocksize} samples + {fx_blocksize} FX @ {sr}Hz)")
                 self.add_log("🎤 PROFESYONEL FX + ULTRA LOW LATENCY!")
                 self.add_log("⏹️ Durdurmak için 'KAYIT + MİX' butonuna tekrar tıkla")
 
                 # Backing track bitene kadar bekle (veya stop komutu gelene kadar)
+                # Event: durdurma anında uyandırır, saniyelik yoklama yok
                 duration = len(backing_audio) / sr
-                for i in range(int(duration)):
-                    if not self.karaoke_stream or not self.karaoke_stream.active:
-                        break  # Durduruldu
-                    sd.sleep(1000)  # 1 saniye bekle
+                if self._karaoke_stop.wait(timeout=duration):
+                    return  # Durduruldu - stream'i durdurma yolu kapattı
 
                 # Stream'i kapat (eğer hala açıksa)
                 if self.karaoke_stream and self.karaoke_stream.active:
@@ -2538,85 +3028,43 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
 
             except Exception as e:
                 self.add_log(f"❌ Hata: {e}")
-                messagebox.showerror("Hata", f"Karaoke başlatılamadı:\n{e}")
+                self._ui(messagebox.showerror, "Hata", f"Karaoke başlatılamadı:\n{e}")
 
         threading.Thread(target=start_karaoke, daemon=True).start()
 
-    def apply_karaoke_preset(self, preset_name):
-        """Professional preset'leri uygula"""
-        presets = {
-            "🎙️ Radio Ready": {
-                "reverb": 0.25,
-                "echo": 0.15,
-                "volume": 1.1,
-                "autotune": 0.5,
-                "deesser": 0.6,
-                "description": "Radyo yayını için optimize edilmiş (hafif efektler, net vokal)"
-            },
-            "🎸 Studio Recording": {
-                "reverb": 0.35,
-                "echo": 0.2,
-                "volume": 1.0,
-                "autotune": 0.7,
-                "deesser": 0.5,
-                "description": "Profesyonel stüdyo kaydı (dengeli, kaliteli)"
-            },
-            "🎤 Live Performance": {
-                "reverb": 0.5,
-                "echo": 0.3,
-                "volume": 1.2,
-                "autotune": 0.3,
-                "deesser": 0.4,
-                "description": "Canlı performans (güçlü reverb, enerji)"
-            },
-            "💿 Podcast": {
-                "reverb": 0.1,
-                "echo": 0.0,
-                "volume": 1.15,
-                "autotune": 0.0,
-                "deesser": 0.7,
-                "description": "Podcast/konuşma (minimal efekt, net ses)"
-            },
-            "🎵 Rap/Hip-Hop": {
-                "reverb": 0.2,
-                "echo": 0.4,
-                "volume": 1.3,
-                "autotune": 0.8,
-                "deesser": 0.5,
-                "description": "Rap/Hip-Hop (güçlü autotune, echo)"
-            },
-            "🎸 Rock Vokal": {
-                "reverb": 0.6,
-                "echo": 0.25,
-                "volume": 1.4,
-                "autotune": 0.2,
-                "deesser": 0.3,
-                "description": "Rock/Metal vokal (çok reverb, ham enerji)"
-            }
-        }
+    def _make_effect_card(self, parent, key, title, default, maximum, fmt, color, button_color, hover_color, border_width):
+        """Tek bir karaoke efekt kartı oluştur, değişkeni self.karaoke_<key>_var olarak bağla"""
+        card = ctk.CTkFrame(parent, fg_color=("#2d3142", "#1a1d2e"), corner_radius=12, border_width=border_width, border_color=color)
+        card.pack(fill="x", pady=8, padx=5)
+        inner = ctk.CTkFrame(card, fg_color="transparent")
+        inner.pack(fill="x", padx=15, pady=10)
+        ctk.CTkLabel(inner, text=title, width=150, anchor="w", font=self.fonts["label_sm"]).pack(side="left")
 
-        if preset_name in presets:
-            preset = presets[preset_name]
+        var = ctk.DoubleVar(value=default)
+        setattr(self, f"karaoke_{key}_var", var)
+        ctk.CTkSlider(inner, from_=0, to=maximum, variable=var, width=300, height=18, progress_color=color, button_color=button_color, button_hover_color=hover_color).pack(side="left", padx=10)
 
-            # Apply preset values
-            self.karaoke_reverb_var.set(preset["reverb"])
-            self.karaoke_echo_var.set(preset["echo"])
-            self.karaoke_volume_var.set(preset["volume"])
-            self.karaoke_autotune_var.set(preset["autotune"])
-            self.karaoke_deesser_var.set(preset["deesser"])
+        label = ctk.CTkLabel(inner, text="", width=60, font=self.fonts["value"], text_color=(color[0], button_color[0]))
+        label.pack(side="left")
+        self.bind_throttled_label(var, label, fmt)
+        return card
 
-            # Log the change
+    def apply_karaoke_preset(self, preset_name):
+        """Professional preset'leri uygula"""
+        preset = self.KARAOKE_PRESETS.get(preset_name)
+        if preset is not None:
+            # Yalnızca değişen slider'lara yaz (etiket güncellemeleri zaten kare başına birleştirilir)
+            for key, *_ in self.EFFECT_SPECS:
+                var = getattr(self, f"karaoke_{key}_var")
+                if var.get() != preset[key]:
+                    var.set(preset[key])
+
+            # Bildirim log'a (modal pencere UI'ı ve preset denemelerini bloklamasın)
             self.add_log(f"🎛️ Preset uygulandı: {preset_name}")
             self.add_log(f"   → {preset['description']}")
-
-            # Show notification
-            messagebox.showinfo("Preset Uygulandı",
-                              f"{preset_name}\n\n{preset['description']}\n\n"
-                              f"Reverb: {preset['reverb']:.2f}\n"
-                              f"Echo: {preset['echo']:.2f}\n"
-                              f"Volume: {preset['volume']:.2f}x\n"
-                              f"Autotune: {int(preset['autotune']*100)}%\n"
-                              f"De-esser: {int(preset['deesser']*100)}%")
+            self.add_log(f"   Reverb: {preset['reverb']:.2f} | Echo: {preset['echo']:.2f} | "
+                         f"Volume: {preset['volume']:.2f}x | Autotune: {int(preset['autotune']*100)}% | "
+                         f"De-esser: {int(preset['deesser']*100)}%")
 
     def converter_select_file(self):
         """Converter için dosya seç"""
@@ -2639,6 +3087,8 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         input_path = Path(self.converter_file)
         output_path = input_path.parent / f"{input_path.stem}_converted.{self.converter_format_var.get()}"
 
+        self.converter_progress_bar.set(0)
+
         def convert():
             self.add_log(f"🔄 Dönüştürülüyor: {self.converter_format_var.get()}")
 
@@ -2646,7 +3096,8 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
                 self.converter_file,
                 str(output_path),
                 self.converter_format_var.get(),
-                self.converter_quality_var.get()
+                self.converter_quality_var.get(),
+                progress_callback=partial(self.post_ui, "converter_progress_bar", self.converter_progress_bar.set)
             )
 
             if success:
@@ -2665,168 +3116,304 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
                     self.format_converter.set_metadata(str(output_path), metadata)
 
                 self.add_log(f"✅ Dönüştürüldü: {output_path.name}")
-                messagebox.showinfo("Başarılı", f"Dönüştürme tamamlandı!\n{output_path}")
+                self._ui(messagebox.showinfo, "Başarılı", f"Dönüştürme tamamlandı!\n{output_path}")
             else:
-                messagebox.showerror("Hata", "Dönüştürme başarısız!")
+                self._ui(messagebox.showerror, "Hata", "Dönüştürme başarısız!")
 
         threading.Thread(target=convert, daemon=True).start()
 
-    def refresh_audio_devices(self):
-        """Audio cihazlarını yenile ve menülere doldur (Recorder tab için)"""
+    def get_audio_device_lists(self):
+        """
+        (mikrofon, hoparlör) menü etiketleri - cihaz taraması önbelleklenir
+        Host API'lerin varsayılan cihazları veya cihaz sayıları değişince yeniden taranır
+        """
+        key = tuple(
+            (api['default_input_device'], api['default_output_device'], len(api['devices']))
+            for api in sd.query_hostapis()
+        )
+        if self._device_cache is not None and self._device_cache[0] == key:
+            return self._device_cache[1]
+
+        # Mikrofon (input) ve hoparlör/kulaklık (output) cihazları - tek geçiş
+        mic_devices = ["Varsayılan (Default)"]
+        speaker_devices = ["Varsayılan (Default)"]
+        for i, dev in enumerate(sd.query_devices()):
+            if dev['max_input_channels'] > 0:
+                mic_devices.append(f"[{i}] {dev['name']}")
+            if dev['max_output_channels'] > 0:
+                speaker_devices.append(f"[{i}] {dev['name']}")
+
+        self._device_cache = (key, (mic_devices, speaker_devices))
+        return mic_devices, speaker_devices
+
+    def _prime_device_cache(self):
+        """Cihaz önbelleğini açılışta doldur (worker thread) - hata olursa ilk yenilemede tekrar denenir"""
         try:
-            import sounddevice as sd
-
-            devices = sd.query_devices()
-
-            # Mikrofon cihazları (input)
-            mic_devices = ["Varsayılan (Default)"]
-            for i, dev in enumerate(devices):
-                if dev['max_input_channels'] > 0:
-                    mic_devices.append(f"[{i}] {dev['name']}")
-
-            # Hoparlör/Kulaklık cihazları (output)
-            speaker_devices = ["Varsayılan (Default)"]
-            for i, dev in enumerate(devices):
-                if dev['max_output_channels'] > 0:
-                    speaker_devices.append(f"[{i}] {dev['name']}")
+            self.get_audio_device_lists()
+        except Exception:
+            pass
 
-            # Menüleri güncelle
-            self.mic_device_menu.configure(values=mic_devices)
-            self.speaker_device_menu.configure(values=speaker_devices)
+    def invalidate_device_cache(self):
+        """Bir sonraki sorguda cihazları yeniden tara"""
+        self._device_cache = None
 
-            self.add_log(f"🔄 {len(mic_devices)-1} mikrofon, {len(speaker_devices)-1} hoparlör bulundu")
+    def refresh_audio_devices(self, rescan=False):
+        """Audio cihazlarını yenile ve menülere doldur (Recorder tab için) - rescan: önbelleği atla"""
+        self._query_audio_devices(self._apply_audio_devices, rescan)
 
-        except Exception as e:
-            self.add_log(f"❌ Cihaz listesi yüklenemedi: {e}")
-            messagebox.showerror("Hata", f"Audio cihazları yüklenemedi:\n{e}")
+    def refresh_karaoke_devices(self, rescan=False):
+        """Audio cihazlarını yenile ve menülere doldur (Karaoke tab için) - rescan: önbelleği atla"""
+        self._query_audio_devices(self._apply_karaoke_devices, rescan)
 
-    def refresh_karaoke_devices(self):
-        """Audio cihazlarını yenile ve menülere doldur (Karaoke tab için)"""
-        try:
-            import sounddevice as sd
+    def _query_audio_devices(self, apply, rescan):
+        """PortAudio sorgusunu worker thread'de yap (yüzlerce ms sürebilir), menüleri Tk thread'inde doldur"""
+        if rescan:
+            self.invalidate_device_cache()
 
-            devices = sd.query_devices()
+        def worker():
+            try:
+                mic_devices, speaker_devices = self.get_audio_device_lists()
+            except Exception as e:
+                self.add_log(f"❌ Cihaz listesi yüklenemedi: {e}")
+                self._ui(messagebox.showerror, "Hata", f"Audio cihazları yüklenemedi:\n{e}")
+                return
+            self._ui(apply, mic_devices, speaker_devices)
 
-            # Mikrofon cihazları (input)
-            mic_devices = ["Varsayılan (Default)"]
-            for i, dev in enumerate(devices):
-                if dev['max_input_channels'] > 0:
-                    mic_devices.append(f"[{i}] {dev['name']}")
+        threading.Thread(target=worker, daemon=True).start()
 
-            # Hoparlör/Kulaklık cihazları (output)
-            speaker_devices = ["Varsayılan (Default)"]
-            for i, dev in enumerate(devices):
-                if dev['max_output_channels'] > 0:
-                    speaker_devices.append(f"[{i}] {dev['name']}")
+    def _apply_audio_devices(self, mic_devices, speaker_devices):
+        """Recorder menülerini güncelle (Tk ana thread'inde)"""
+        self.mic_device_menu.configure(values=mic_devices)
+        self.speaker_device_menu.configure(values=speaker_devices)
 
-            # Karaoke menülerini güncelle
-            self.karaoke_mic_menu.configure(values=mic_devices)
-            self.karaoke_speaker_menu.configure(values=speaker_devices)
+        self.add_log(f"🔄 {len(mic_devices)-1} mikrofon, {len(speaker_devices)-1} hoparlör bulundu")
 
-            # Kaydedilmiş cihazları otomatik seç
-            if hasattr(self, 'saved_mic_device') and self.saved_mic_device:
-                if self.saved_mic_device in mic_devices:
-                    self.karaoke_mic_var.set(self.saved_mic_device)
-                    self.add_log(f"✓ Mikrofon geri yüklendi: {self.saved_mic_device}")
+    def _apply_karaoke_devices(self, mic_devices, speaker_devices):
+        """Karaoke menülerini güncelle ve kayıtlı cihazları seç (Tk ana thread'inde)"""
+        self.karaoke_mic_menu.configure(values=mic_devices)
+        self.karaoke_speaker_menu.configure(values=speaker_devices)
 
-            if hasattr(self, 'saved_speaker_device') and self.saved_speaker_device:
-                if self.saved_speaker_device in speaker_devices:
-                    self.karaoke_speaker_var.set(self.saved_speaker_device)
-                    self.add_log(f"✓ Hoparlör geri yüklendi: {self.saved_speaker_device}")
+        # Kaydedilmiş cihazları otomatik seç
+        if hasattr(self, 'saved_mic_device') and self.saved_mic_device:
+            if self.saved_mic_device in mic_devices:
+                self.karaoke_mic_var.set(self.saved_mic_device)
+                self.add_log(f"✓ Mikrofon geri yüklendi: {self.saved_mic_device}")
 
-            # Her seçim değiştiğinde kaydet
-            self.karaoke_mic_var.trace_add("write", lambda *args: self.save_config())
-            self.karaoke_speaker_var.trace_add("write", lambda *args: self.save_config())
+        if hasattr(self, 'saved_speaker_device') and self.saved_speaker_device:
+            if self.saved_speaker_device in speaker_devices:
+                self.karaoke_speaker_var.set(self.saved_speaker_device)
+                self.add_log(f"✓ Hoparlör geri yüklendi: {self.saved_speaker_device}")
 
-            self.add_log(f"🔄 Karaoke: {len(mic_devices)-1} mikrofon, {len(speaker_devices)-1} hoparlör bulundu")
+        # Her seçim değiştiğinde kaydet (debounce'lu) - trace'ler bir kez eklenir, yenilemelerde birikmez
+        if not self._karaoke_device_traces:
+            self._karaoke_device_traces = True
+            self.karaoke_mic_var.trace_add("write", lambda *args: self.schedule_save_config())
+            self.karaoke_speaker_var.trace_add("write", lambda *args: self.schedule_save_config())
 
-        except Exception as e:
-            self.add_log(f"❌ Karaoke cihaz listesi yüklenemedi: {e}")
-            messagebox.showerror("Hata", f"Audio cihazları yüklenemedi:\n{e}")
+        self.add_log(f"🔄 Karaoke: {len(mic_devices)-1} mikrofon, {len(speaker_devices)-1} hoparlör bulundu")
 
     def refresh_backing_tracks(self):
-        """Mevcut backing track dosyalarını tara ve listele"""
+        """Backing track taramasını arka planda başlat (dosya sistemi UI'ı dondurmaz)"""
+        if self._backing_scan_running:
+            return
+        self._backing_scan_running = True
+
+        # İlk taramada liste boşken ilerleme göster (sonraki yenilemelerde mevcut liste kalır)
+        if self._backing_track_rows is None:
+            self._set_backing_status("⏳ Taranıyor...")
+
+        threading.Thread(target=self._scan_backing_tracks, daemon=True).start()
+
+    def _list_backing_dir(self, path):
+        """
+        Klasörü listele: (alt klasörler, [(backing dosyası, stat)])
+        mtime değişmediyse liste önbellekten gelir, yalnızca dosyalar yeniden stat edilir
+        """
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._backing_dir_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            files = []
+            for file_path in cached[2]:
+                try:
+                    files.append((file_path, os.stat(file_path)))
+                except OSError:
+                    pass
+            return cached[1], files
+
+        subdirs, files = [], []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    # Gizli / ortam / önbellek klasörleri taranmaz
+                    if not entry.name.startswith(".") and entry.name not in BACKING_SCAN_SKIP_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.name.startswith("instrumental_") and entry.name.endswith(".wav"):
+                    try:
+                        # DirEntry.stat: Windows'ta listelemeden gelir, ek sistem çağrısı yok
+                        files.append((entry.path, entry.stat()))
+                    except OSError:
+                        pass
+        self._backing_dir_cache[path] = (mtime, subdirs, [file_path for file_path, _ in files])
+        return subdirs, files
+
+    def _scan_backing_tracks(self):
+        """
+        Backing track dosyalarını tara (worker thread) - instrumental_ ile başlayan WAV'lar
+        Önce proje kökü ve çıkış klasörü (yeni dosyalar burada); 10 sonuç yoksa sınırlı derinlikte iner
+        """
         try:
-            # Önceki widget'ları temizle
-            for widget in self.backing_tracks_frame.winfo_children():
-                widget.destroy()
-
-            # Backing track'leri tara (instrumental_ ile başlayan WAV dosyaları)
-            backing_files = []
-            for root, dirs, files in os.walk("."):
-                for file in files:
-                    if file.startswith("instrumental_") and file.endswith(".wav"):
-                        full_path = os.path.join(root, file)
-                        backing_files.append(full_path)
-
-            if not backing_files:
-                ctk.CTkLabel(self.backing_tracks_frame, text="📭 Henüz backing track oluşturulmamış",
-                           text_color="gray60", font=ctk.CTkFont(size=12)).pack(pady=10)
+            rows = []
+            seen = set()
+            pending = []  # (klasör, kalan derinlik)
+            for root in (".", self.karaoke_output_folder):
+                if not root or os.path.abspath(root) in seen:
+                    continue
+                seen.add(os.path.abspath(root))
+                try:
+                    subdirs, files = self._list_backing_dir(root)
+                except OSError:
+                    continue
+                rows.extend((file_path, st.st_mtime, st.st_size) for file_path, st in files)
+                pending.extend((d, BACKING_SCAN_MAX_DEPTH - 1) for d in subdirs)
+
+            # Üst seviyede yeterli aday varsa ağacın geri kalanı taranmaz
+            if len(rows) < 10:
+                while pending:
+                    path, depth = pending.pop()
+                    if os.path.abspath(path) in seen:
+                        continue
+                    try:
+                        subdirs, files = self._list_backing_dir(path)
+                    except OSError:
+                        continue
+                    rows.extend((file_path, st.st_mtime, st.st_size) for file_path, st in files)
+                    if depth > 0:
+                        pending.extend((d, depth - 1) for d in subdirs)
+
+            if rows:
+                self.add_log(f"📂 {len(rows)} backing track bulundu")
+
+            # En yeni 10 dosya (tam sıralama yerine sınırlı heap)
+            self._ui(self._render_backing_tracks, heapq.nlargest(10, rows, key=itemgetter(1)))
+        except Exception as e:
+            self.add_log(f"❌ Backing track taramas\u0131 hatas\u0131: {e}")
+        finally:
+            self._backing_scan_running = False
+
+    def _set_backing_status(self, text):
+        """Liste durum etiketini göster (None: gizle) - etiket bir kez oluşturulur"""
+        if text is None:
+            if self._bt_status_label is not None:
+                self._bt_status_label.pack_forget()
+            return
+        if self._bt_status_label is None:
+            self._bt_status_label = ctk.CTkLabel(self.backing_tracks_frame, text=text,
+                                                 text_color="gray60", font=self.fonts["body_sm"])
+        else:
+            self._bt_status_label.configure(text=text)
+        self._bt_status_label.pack(pady=10)
+
+    def _create_backing_card(self):
+        """Havuz için boş kart oluştur - butonlar bir kez bağlanır, yol kart üzerinde tutulur"""
+        card = ctk.CTkFrame(self.backing_tracks_frame, fg_color=("#3a3d4a", "#2a2d3a"), corner_radius=10)
+        card._file_path = None
+
+        # Sol taraf - Bilgiler
+        info_frame = ctk.CTkFrame(card, fg_color="transparent")
+        info_frame.pack(side="left", fill="x", expand=True, padx=10, pady=8)
+
+        card._name_label = ctk.CTkLabel(info_frame, text="", font=self.fonts["small_bold"], anchor="w")
+        card._name_label.pack(anchor="w")
+
+        card._info_label = ctk.CTkLabel(info_frame, text="", font=self.fonts["tiny"],
+                                        text_color="gray60", anchor="w")
+        card._info_label.pack(anchor="w")
+
+        # Sağ taraf - Butonlar
+        btn_frame = ctk.CTkFrame(card, fg_color="transparent")
+        btn_frame.pack(side="right", padx=10)
+
+        ctk.CTkButton(btn_frame, text="✅ Kullan", width=70, height=28,
+                    fg_color=("#10b981", "#059669"),
+                    hover_color=("#059669", "#047857"),
+                    command=partial(self._backing_card_use, card)).pack(side="left", padx=5)
+
+        ctk.CTkButton(btn_frame, text="🗑️ Sil", width=60, height=28,
+                    fg_color=("#ef4444", "#dc2626"),
+                    hover_color=("#dc2626", "#b91c1c"),
+                    command=partial(self._backing_card_delete, card)).pack(side="left")
+
+        self._bt_card_pool.append(card)
+        return card
+
+    def _backing_card_use(self, card):
+        """Kartın gösterdiği backing track'i yükle"""
+        if card._file_path:
+            self.load_backing_track(card._file_path)
+
+    def _backing_card_delete(self, card):
+        """Kartın gösterdiği backing track'i sil"""
+        if card._file_path:
+            self.delete_backing_track(card._file_path)
+
+    def _render_backing_tracks(self, rows):
+        """Tarama sonucunu listele - havuzdaki kartlar yeniden kullanılır, yalnızca eksik kart oluşturulur"""
+        try:
+            if rows == self._backing_track_rows:
                 return
+            self._backing_track_rows = rows
 
-            # Dosyaları tarihine göre sırala (en yeni üstte)
-            backing_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+            if not rows:
+                for card in self._bt_card_pool:
+                    card.pack_forget()
+                self._set_backing_status("📭 Henüz backing track oluşturulmamış")
+                return
+            self._set_backing_status(None)
 
-            self.add_log(f"📂 {len(backing_files)} backing track bulundu")
+            for i, (file_path, mtime, size) in enumerate(rows):
+                card = self._bt_card_pool[i] if i < len(self._bt_card_pool) else self._create_backing_card()
+                card._file_path = file_path
 
-            # Her dosya için bir kart oluştur
-            for file_path in backing_files[:10]:  # Son 10 dosyayı göster
                 file_name = Path(file_path).name
-                file_size = Path(file_path).stat().st_size / (1024*1024)  # MB
-                file_date = time.strftime('%d.%m.%Y %H:%M', time.localtime(os.path.getmtime(file_path)))
-
-                # Kart frame
-                card = ctk.CTkFrame(self.backing_tracks_frame, fg_color=("#3a3d4a", "#2a2d3a"), corner_radius=10)
-                card.pack(fill="x", pady=5, padx=5)
-
-                # Sol taraf - Bilgiler
-                info_frame = ctk.CTkFrame(card, fg_color="transparent")
-                info_frame.pack(side="left", fill="x", expand=True, padx=10, pady=8)
-
-                ctk.CTkLabel(info_frame, text=f"🎵 {file_name[:50]}...",
-                           font=ctk.CTkFont(size=11, weight="bold"),
-                           anchor="w").pack(anchor="w")
-
-                ctk.CTkLabel(info_frame, text=f"📦 {file_size:.1f} MB  |  📅 {file_date}",
-                           font=ctk.CTkFont(size=9),
-                           text_color="gray60",
-                           anchor="w").pack(anchor="w")
-
-                # Sağ taraf - Butonlar
-                btn_frame = ctk.CTkFrame(card, fg_color="transparent")
-                btn_frame.pack(side="right", padx=10)
+                if len(file_name) > 50:
+                    file_name = file_name[:50] + "..."
+                file_size = size / (1024*1024)  # MB
+                file_date = time.strftime('%d.%m.%Y %H:%M', time.localtime(mtime))
 
-                ctk.CTkButton(btn_frame, text="✅ Kullan", width=70, height=28,
-                            fg_color=("#10b981", "#059669"),
-                            hover_color=("#059669", "#047857"),
-                            command=lambda p=file_path: self.load_backing_track(p)).pack(side="left", padx=5)
+                card._name_label.configure(text=f"🎵 {file_name}")
+                card._info_label.configure(text=f"📦 {file_size:.1f} MB  |  📅 {file_date}")
+                if not card.winfo_manager():
+                    card.pack(fill="x", pady=5, padx=5)
 
-                ctk.CTkButton(btn_frame, text="🗑️ Sil", width=60, height=28,
-                            fg_color=("#ef4444", "#dc2626"),
-                            hover_color=("#dc2626", "#b91c1c"),
-                            command=lambda p=file_path, c=card: self.delete_backing_track(p, c)).pack(side="left")
+            # Fazla kartları gizle (sonraki yenilemelerde tekrar kullanılır)
+            for card in self._bt_card_pool[len(rows):]:
+                card._file_path = None
+                card.pack_forget()
 
         except Exception as e:
-            self.add_log(f"❌ Backing track taramas\u0131 hatas\u0131: {e}")
+            self.add_log(f"❌ Backing track listesi çizilemedi: {e}")
 
     def load_backing_track(self, file_path):
         """Seçilen backing track'i yükle"""
         self.karaoke_backing_track = file_path
-        self.save_config()  # Backing track yolunu kaydet
+        self.karaoke_lyrics_path = None
+        self.schedule_save_config()  # Backing track yolunu kaydet (ertelenmiş)
         self.add_log(f"✅ Backing track y\u00fcklendi: {Path(file_path).name}")
         messagebox.showinfo("Ba\u015far\u0131l\u0131", f"Backing track y\u00fcklendi!\n\n{Path(file_path).name}\n\nArt\u0131k 'KAYIT + M\u0130X' butonuna t\u0131klayabilirsin!")
 
-    def delete_backing_track(self, file_path, card_widget):
+    def delete_backing_track(self, file_path):
         """Backing track'i sil"""
         if messagebox.askyesno("Onay", f"{Path(file_path).name}\n\nBu dosyay\u0131 silmek istedi\u011finden emin misin?"):
             try:
                 os.remove(file_path)
-                card_widget.destroy()
+                # Kartı yok etmek yerine listeyi silinen satır olmadan yeniden çiz (kartlar havuzda kalır)
+                self._render_backing_tracks([row for row in self._backing_track_rows or () if row[0] != file_path])
                 self.add_log(f"🗑️ Silindi: {Path(file_path).name}")
 
                 # E\u011fer y\u00fckl\u00fc backing track silinirse, state'i temizle
                 if self.karaoke_backing_track == file_path:
                     self.karaoke_backing_track = None
+                    self.karaoke_lyrics_path = None
             except Exception as e:
                 messagebox.showerror("Hata", f"Dosya silinemedi:\n{e}")
 
@@ -2838,8 +3425,11 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
         """Kaydedilmiş ayarları yükle"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                if ORJSON_AVAILABLE:
+                    config = orjson.loads(self.config_file.read_bytes())
+                else:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        config = json.load(f)
 
                 # Karaoke ayarlarını yükle
                 self.saved_mic_device = config.get('karaoke', {}).get('microphone', None)
@@ -2863,26 +3453,49 @@ Sıra  Nota (TR/EN)    Başlangıç → Bitiş      Süre
             self.saved_speaker_device = None
             self.saved_output_folder = None
 
+    def schedule_save_config(self, delay_ms=500):
+        """Config yazımını ertele - art arda gelen değişiklikler tek yazımda birleşir"""
+        if self._save_config_after_id is None:
+            self._save_config_after_id = self.after(delay_ms, self.save_config)
+
     def save_config(self):
         """Mevcut ayarları kaydet"""
+        if self._save_config_after_id is not None:
+            self.after_cancel(self._save_config_after_id)
+            self._save_config_after_id = None
+
         try:
             config = {
                 'karaoke': {
-                    'microphone': self.karaoke_mic_var.get() if hasattr(self, 'karaoke_mic_var') else None,
-                    'speaker': self.karaoke_speaker_var.get() if hasattr(self, 'karaoke_speaker_var') else None,
+                    # Karaoke sekmesi hiç açılmadıysa kayıtlı cihazları koru
+                    'microphone': self.karaoke_mic_var.get() if hasattr(self, 'karaoke_mic_var') else self.saved_mic_device,
+                    'speaker': self.karaoke_speaker_var.get() if hasattr(self, 'karaoke_speaker_var') else self.saved_speaker_device,
                     'output_folder': self.karaoke_output_folder,
                     'backing_track': self.karaoke_backing_track
                 }
             }
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            # Geçici dosyaya yaz, sonra atomik olarak değiştir (yarım config kalmaz)
+            tmp_file = self.config_file.with_suffix('.tmp')
+            if ORJSON_AVAILABLE:
+                tmp_file.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(config, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.config_file)
 
             # No print - config saved silently
         except Exception as e:
             # No print - just pass
             pass
 
+    def on_closing(self):
+        """Pencere kapanırken bekleyen config yazımını uygula"""
+        if self._save_config_after_id is not None:
+            self.save_config()
+        self.stop_audio()
+        self.destroy()
+
 
 def main():
     """Ana fonksiyon"""
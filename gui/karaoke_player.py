@@ -5,8 +5,7 @@ Transport controls, waveform visualization, synchronized lyrics
 import customtkinter as ctk
 from tkinter import Canvas
 import numpy as np
-import threading
-import time
+import bisect
 
 
 class KaraokePlayer(ctk.CTkFrame):
@@ -22,8 +21,21 @@ class KaraokePlayer(ctk.CTkFrame):
         self.current_position = 0  # Current playback position in samples
         self.is_playing = False
 
+        # Waveform önbelleği: (genişlik, yükseklik), çubuk item'ları, boyanmış son piksel, playhead item
+        self._wave_size = None
+        self._wave_bars = []
+        self._wave_progress_px = 0
+        self._playhead = None
+
+        # Son çizilen değerler: değişmeyen kareler widget güncellemesi yapmaz
+        self._last_display_position = None
+        self._last_time_text = ""
+        self._last_lyric_state = None
+        self._label_texts = {}  # Söz etiketi -> son yazılan metin
+
         # Lyrics data (from Whisper)
         self.lyrics_data = lyrics_data or {"segments": []}
+        self._prepare_segments()
 
         # Colors
         self.colors = {
@@ -48,6 +60,7 @@ class KaraokePlayer(ctk.CTkFrame):
         self.on_play_pause_callback = None
         self.on_stop_callback = None
         self.on_fx_change_callback = None  # FX parameter değişikliği callback
+        self._fx_dispatch_id = None  # Bekleyen (debounce'lu) FX bildirimi
 
         # FX Parameters (kullanıcı kontrol edebilir)
         self.fx_params = {
@@ -63,6 +76,8 @@ class KaraokePlayer(ctk.CTkFrame):
             'eq_treble': 1.5
         }
 
+        self._after_id = None  # Ekran güncelleme döngüsünün bekleyen after() kimliği
+
         self.create_ui()
         self.start_update_loop()
 
@@ -108,8 +123,8 @@ class KaraokePlayer(ctk.CTkFrame):
         # Bind click to seek
         self.waveform_canvas.bind("<Button-1>", self.on_waveform_click)
 
-        # Draw waveform
-        self.draw_waveform()
+        # Waveform ilk yerleşimde ve her yeniden boyutlanmada çizilir
+        self.waveform_canvas.bind("<Configure>", self.on_waveform_configure)
 
         # === TRANSPORT CONTROLS ===
         controls_frame = ctk.CTkFrame(self, fg_color=self.colors['bg_medium'], height=120)
@@ -279,78 +294,87 @@ class KaraokePlayer(ctk.CTkFrame):
             slider.set(default_val)
             slider.pack(side="left", fill="x", expand=True, padx=(10, 0))
 
-            # Update callback
+            # Update callback: etiket anında, uygulama bildirimi sürükleme bitince (80 ms debounce)
             def on_slider_change(value, key=param_key, lbl=label, p_label=param_label):
                 self.fx_params[key] = value
                 lbl.configure(text=f"{p_label}: {value:.2f}")
-                # Notify parent app
-                if self.on_fx_change_callback:
-                    self.on_fx_change_callback(self.fx_params)
+                if self._fx_dispatch_id is not None:
+                    self.after_cancel(self._fx_dispatch_id)
+                self._fx_dispatch_id = self.after(80, self._flush_fx)
 
             slider.configure(command=on_slider_change)
 
-    def draw_waveform(self):
-        """Draw audio waveform"""
-        self.waveform_canvas.delete("all")
+    def _flush_fx(self):
+        """Birikmiş slider değişikliklerini uygulamaya tek seferde bildir"""
+        self._fx_dispatch_id = None
+        # Notify parent app
+        if self.on_fx_change_callback:
+            self.on_fx_change_callback(self.fx_params)
 
-        width = self.waveform_canvas.winfo_width()
-        height = self.waveform_canvas.winfo_height()
+    def draw_waveform(self):
+        """Draw audio waveform - çubuklar önbellekten, karede yalnızca ilerleme rengi ve playhead güncellenir"""
+        if self._wave_size is None:  # Canvas not ready yet (<Configure> çubukları oluşturur)
+            return
+        width, height = self._wave_size
 
-        if width < 10:  # Canvas not ready yet
-            self.after(100, self.draw_waveform)
+        progress_px = int(self.current_position / len(self.backing_audio) * width)
+        old_px = self._wave_progress_px
+        # Playhead bir piksel ilerlemediyse canvas'a dokunma
+        if progress_px == old_px:
             return
 
-        # Downsample waveform for visualization
-        # Use left channel if stereo
-        if self.backing_audio.ndim > 1:
-            waveform_data = self.backing_audio[:, 0]
+        # Progress coloring: yalnızca son kareden bu yana sınırı geçen çubuklar boyanır
+        if progress_px > old_px:
+            changed, color = self._wave_bars[old_px + 1:progress_px + 1], self.colors['waveform_progress']
         else:
-            waveform_data = self.backing_audio
+            changed, color = self._wave_bars[progress_px + 1:old_px + 1], self.colors['waveform']
+        for bar in changed:
+            self.waveform_canvas.itemconfigure(bar, fill=color)
+        self._wave_progress_px = progress_px
 
-        # Downsample to fit canvas width
-        samples_per_pixel = len(waveform_data) // width
-        if samples_per_pixel < 1:
-            samples_per_pixel = 1
+        # Draw playhead
+        self.waveform_canvas.coords(self._playhead, progress_px, 0, progress_px, height)
 
-        downsampled = []
-        for i in range(0, len(waveform_data), samples_per_pixel):
-            chunk = waveform_data[i:i+samples_per_pixel]
-            if len(chunk) > 0:
-                downsampled.append(np.max(np.abs(chunk)))
+    def on_waveform_configure(self, event):
+        """Canvas boyutu değişti - zarf ve çubuklar yalnızca burada yeniden oluşturulur"""
+        if event.width < 10:
+            return
+        if (event.width, event.height) != self._wave_size:
+            self._build_waveform_cache(event.width, event.height)
 
-        # Draw waveform bars
+    def _build_waveform_cache(self, width, height):
+        """Zarfı tek vektörel geçişte hesapla (piksel başına |max|) ve çubukları bir kez çiz"""
+        self.waveform_canvas.delete("all")
+        self._wave_size = (width, height)
+
+        # Downsample to fit canvas width: (piksel, örnek, kanal) görünümü - tüm kanallar hesaba katılır
+        audio = self.backing_audio
+        samples_per_pixel = max(1, len(audio) // width)
+        n_pixels = min(width, len(audio) // samples_per_pixel)
+        frames = audio[:n_pixels * samples_per_pixel].reshape(n_pixels, samples_per_pixel, -1)
+        # |x| ara dizisi yerine max ve -min: ses kadar geçici bellek ayrılmaz
+        envelope = np.maximum(frames.max(axis=(1, 2)), -frames.min(axis=(1, 2)))
+        max_amplitude = float(envelope.max()) if n_pixels else 0.0
+        if max_amplitude > 0:
+            envelope = envelope * (height * 0.4 / max_amplitude)
+
+        # Draw waveform bars (mevcut konuma göre renklendirilmiş)
         mid_y = height / 2
-        max_amplitude = max(downsampled) if downsampled else 1.0
-
-        for i, amplitude in enumerate(downsampled):
-            if i >= width:
-                break
-
-            # Normalize amplitude
-            normalized = (amplitude / max_amplitude) * (height * 0.4)
-
-            # Determine color (progress vs unplayed)
-            progress_ratio = self.current_position / len(self.backing_audio)
-            pixel_ratio = i / width
-
-            if pixel_ratio <= progress_ratio:
-                color = self.colors['waveform_progress']
-            else:
-                color = self.colors['waveform']
-
-            # Draw vertical bar
+        progress_px = int(self.current_position / len(self.backing_audio) * width)
+        self._wave_bars = [
             self.waveform_canvas.create_line(
-                i, mid_y - normalized,
-                i, mid_y + normalized,
-                fill=color,
+                i, mid_y - amplitude,
+                i, mid_y + amplitude,
+                fill=self.colors['waveform_progress'] if i <= progress_px else self.colors['waveform'],
                 width=1
             )
+            for i, amplitude in enumerate(envelope.tolist())
+        ]
+        self._wave_progress_px = progress_px
 
-        # Draw playhead
-        playhead_x = int((self.current_position / len(self.backing_audio)) * width)
-        self.waveform_canvas.create_line(
-            playhead_x, 0,
-            playhead_x, height,
+        self._playhead = self.waveform_canvas.create_line(
+            progress_px, 0,
+            progress_px, height,
             fill=self.colors['accent_bright'],
             width=3
         )
@@ -399,14 +423,17 @@ class KaraokePlayer(ctk.CTkFrame):
         self.current_position = position_samples
 
     def update_display(self):
-        """Update all display elements"""
-        # Update time
-        current_time = self.current_position / self.sample_rate
-        total_time = self.duration
+        """Update all display elements - konum değişmediyse (duraklatma/bitiş) hiçbir widget'a dokunulmaz"""
+        if self.current_position == self._last_display_position:
+            return
+        self._last_display_position = self.current_position
 
-        self.time_label.configure(
-            text=f"{self.format_time(current_time)} / {self.format_time(total_time)}"
-        )
+        # Update time (saniye değişince)
+        current_time = self.current_position / self.sample_rate
+        time_text = f"{self.format_time(current_time)} / {self.format_time(self.duration)}"
+        if time_text != self._last_time_text:
+            self._last_time_text = time_text
+            self.time_label.configure(text=time_text)
 
         # Update waveform
         self.draw_waveform()
@@ -414,75 +441,86 @@ class KaraokePlayer(ctk.CTkFrame):
         # Update lyrics
         self.update_lyrics()
 
-    def update_lyrics(self):
-        """Update lyrics based on current position"""
-        if not self.lyrics_data:
-            return
-
-        current_time = self.current_position / self.sample_rate
-
+    def _prepare_segments(self):
+        """Sözleri bir kez ayrı dizilere çevir (başlangıç, bitiş, metin) - karede bisect ile aranır"""
+        segments = None
         # Support both formats:
         # 1. Whisper API format: {"segments": [...]}
         # 2. MusicAnalyzer format: {"lyrics_timestamped": [...]}
-        segments = None
         if "segments" in self.lyrics_data:
-            segments = self.lyrics_data["segments"]
+            segments = [(seg["start"], seg["end"], seg["text"]) for seg in self.lyrics_data["segments"]]
         elif "lyrics_timestamped" in self.lyrics_data:
             # Convert MusicAnalyzer format to Whisper format
-            segments = []
-            for item in self.lyrics_data["lyrics_timestamped"]:
-                segments.append({
-                    "start": item.get("timestamp", 0.0),
-                    "end": item.get("timestamp", 0.0) + 3.0,  # Estimate 3 sec duration
-                    "text": item.get("text", "")
-                })
-
-        if not segments:
+            segments = [(item.get("timestamp", 0.0),
+                         item.get("timestamp", 0.0) + 3.0,  # Estimate 3 sec duration
+                         item.get("text", ""))
+                        for item in self.lyrics_data["lyrics_timestamped"]]
+
+        segments = segments or []
+        self._seg_starts = [start for start, _, _ in segments]
+        self._seg_ends = [end for _, end, _ in segments]
+        self._seg_texts = [text.strip() for _, _, text in segments]
+
+    def update_lyrics(self):
+        """Update lyrics based on current position"""
+        if not self._seg_starts:
             return
 
-        # Find current segment
-        current_idx = -1
-        for i, segment in enumerate(segments):
-            if segment["start"] <= current_time < segment["end"]:
-                current_idx = i
-                break
+        current_time = self.current_position / self.sample_rate
+
+        # Find current segment: başlangıcı geçilmiş son segment, bitişinden önceysek aktif
+        current_idx = bisect.bisect_right(self._seg_starts, current_time) - 1
+        if current_idx >= 0 and current_time >= self._seg_ends[current_idx]:
+            current_idx = -1
 
+        # Segment (veya intro/outro durumu) değişmediyse etiketleri yeniden yapılandırma
+        state = current_idx if current_idx >= 0 else ("intro" if current_time < self._seg_starts[0] else "outro")
+        if state == self._last_lyric_state:
+            return
+        self._last_lyric_state = state
+
+        texts = self._seg_texts
         if current_idx >= 0:
             # Current line
-            self.lyrics_current.configure(text=segments[current_idx]["text"].strip())
+            self._set_label(self.lyrics_current, texts[current_idx])
 
             # Previous line
-            if current_idx > 0:
-                self.lyrics_prev.configure(text=segments[current_idx - 1]["text"].strip())
-            else:
-                self.lyrics_prev.configure(text="")
+            self._set_label(self.lyrics_prev, texts[current_idx - 1] if current_idx > 0 else "")
 
             # Next line
-            if current_idx < len(segments) - 1:
-                self.lyrics_next.configure(text=segments[current_idx + 1]["text"].strip())
-            else:
-                self.lyrics_next.configure(text="")
-        else:
+            self._set_label(self.lyrics_next, texts[current_idx + 1] if current_idx < len(texts) - 1 else "")
+        elif state == "intro":
             # No current segment
-            if current_time < segments[0]["start"] if segments else 0:
-                self.lyrics_current.configure(text="♪ Music Intro ♪")
-            else:
-                self.lyrics_current.configure(text="♪ Music Outro ♪")
+            self._set_label(self.lyrics_current, "♪ Music Intro ♪")
+        else:
+            self._set_label(self.lyrics_current, "♪ Music Outro ♪")
+
+    def _set_label(self, label, text):
+        """Metin değiştiyse etiketi güncelle (aynı metinle configure yeniden yerleşim tetikler)"""
+        if self._label_texts.get(label) != text:
+            self._label_texts[label] = text
+            label.configure(text=text)
 
     def start_update_loop(self):
-        """Start update loop for display"""
-        def update_loop():
-            while True:
-                try:
-                    if self.winfo_exists():
-                        self.update_display()
-                        time.sleep(0.05)  # 20 FPS
-                    else:
-                        break
-                except:
-                    break
-
-        threading.Thread(target=update_loop, daemon=True).start()
+        """Start update loop for display (Tk thread'inde after() ile - widget'lara başka thread dokunmaz)"""
+        self._tick()
+
+    def _tick(self):
+        """Tek ekran karesi; sonraki kare 50 ms sonra (20 FPS)"""
+        try:
+            self.update_display()
+        finally:
+            self._after_id = self.after(50, self._tick)
+
+    def destroy(self):
+        """Bekleyen kareyi iptal et - yok edilmiş widget'lara geri çağrı gelmesin"""
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        if self._fx_dispatch_id is not None:
+            self.after_cancel(self._fx_dispatch_id)
+            self._fx_dispatch_id = None
+        super().destroy()
 
     def format_time(self, seconds):
         """Format time as MM:SS"""
@@ -7,6 +7,39 @@ from tkinter import Canvas
 import numpy as np
 import threading
 import time
+import math
+from array import array
+
+# Numba (opsiyonel) - yoksa seviye hesabı NumPy ile yapılır
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True, fastmath=True)
+    def rms_peak(x):
+        """Ses bloğunun (RMS, peak) değerleri - GIL'i bırakan native döngü"""
+        if x.size == 0:
+            return 0.0, 0.0
+        s = 0.0
+        p = 0.0
+        for i in range(x.size):
+            v = x[i]
+            s += v * v
+            a = abs(v)
+            if a > p:
+                p = a
+        return math.sqrt(s / x.size), p
+else:
+    def rms_peak(x):
+        """Ses bloğunun (RMS, peak) değerleri"""
+        if x.size == 0:
+            return 0.0, 0.0
+        # x @ x: kare dizisi ayırmadan BLAS dot
+        return math.sqrt(float(x @ x) / x.size), float(np.max(np.abs(x)))
 
 
 class VUMeter(ctk.CTkFrame):
@@ -37,8 +70,30 @@ class VUMeter(ctk.CTkFrame):
             'border': '#374151'
         }
 
+        # Seviye bölgeleri (başlangıç dB, bitiş dB, renk) - eşiklerin tek kaynağı
+        self._zones = ((-60, -18, self.colors['green']),
+                       (-18, -6, self.colors['yellow']),
+                       (-6, 0, self.colors['red']))
+
+        # dB (-60..0, 1 dB adım) -> bölge rengi tablosu; çizimde eşik karşılaştırması yapılmaz
+        self._db_colors = [color for db_start, db_end, color in self._zones
+                           for _ in range(db_start, db_end)] + [self._zones[-1][2]]
+
+        # Audio thread -> UI: son (sol, sağ) dB çifti tek indeks yazımlarıyla yayınlanır;
+        # peak hold hesabı tamamen UI thread'inde yapılır (audio thread kilit/ayırma yapmaz)
+        self._published = array('d', (-60.0, -60.0))
+        self._ui_thread = threading.get_ident()
+
+        # Çizim yalnızca yeni seviye geldiğinde (dirty) ya da peak düşerken yapılır
+        self._dirty = False
+        self._scheduled = False
+        self._after_id = None
+
+        # JIT derlemesini ilk ses bloğundan önce yap (audio callback'te takılma olmasın)
+        rms_peak(np.zeros(1024, dtype=np.float32))
+
         self.create_ui()
-        self.update_animation()
+        self._tick_decay()
 
     def create_ui(self):
         """Create VU meter UI"""
@@ -62,24 +117,27 @@ class VUMeter(ctk.CTkFrame):
                             highlightthickness=0)
         self.canvas.pack(padx=10, pady=(5, 10))
 
-        # Draw initial meters
+        # Statik öğeler bir kez çizilir; animasyon yalnızca dinamik öğeleri günceller
+        self._build_static_items()
         self.draw_meters()
 
-    def draw_meters(self):
-        """Draw stereo VU meters"""
-        self.canvas.delete("all")
-
+    def _build_static_items(self):
+        """Ölçek, etiketler ve arka planları bir kez çiz; dinamik öğelerin ID'lerini sakla"""
         # Dimensions
         meter_height = 25
         meter_y_left = 10
         meter_y_right = meter_y_left + meter_height + 15
         meter_width = self.width - 100  # Leave space for labels and dB marks
         meter_x = 50
+        self._meter_geom = (meter_x, meter_width, meter_height)
+
+        # dB -> x tablosu (0.1 dB adım, -60..0): çizimde bölme/dal yok, yalnızca indeksleme
+        self._db_lut = [meter_x + i / 600.0 * meter_width for i in range(601)]
 
         # Draw scale marks and dB labels
         db_marks = [-60, -40, -20, -10, -6, -3, 0]
         for db in db_marks:
-            x = self.db_to_x(db, meter_x, meter_width)
+            x = self.db_to_x(db)
 
             # Vertical line
             self.canvas.create_line(x, meter_y_left - 5,
@@ -88,98 +146,125 @@ class VUMeter(ctk.CTkFrame):
                                    width=1)
 
             # dB label
-            color = self.colors['red'] if db >= -6 else self.colors['yellow'] if db >= -18 else self.colors['green']
             self.canvas.create_text(x, meter_y_right + meter_height + 15,
                                    text=f"{db}",
-                                   fill=color,
+                                   fill=self.db_color(db),
                                    font=('Arial', 8, 'bold'))
 
-        # Draw LEFT channel
-        self.draw_channel("L", self.left_level, self.left_peak,
-                         meter_x, meter_y_left, meter_width, meter_height)
+        # Kanal başına: (y, bölge dikdörtgenleri, peak çizgisi, dB metni)
+        self._channel_items = {}
+        for channel, y in (("L", meter_y_left), ("R", meter_y_right)):
+            # Channel label
+            self.canvas.create_text(meter_x - 20, y + meter_height/2,
+                                   text=channel,
+                                   fill="white",
+                                   font=('Arial', 10, 'bold'))
 
-        # Draw RIGHT channel
-        self.draw_channel("R", self.right_level, self.right_peak,
-                         meter_x, meter_y_right, meter_width, meter_height)
+            # Background
+            self.canvas.create_rectangle(meter_x, y, meter_x + meter_width, y + meter_height,
+                                        fill=self.colors['bg'],
+                                        outline=self.colors['border'],
+                                        width=2)
 
-    def draw_channel(self, channel, level, peak, x, y, width, height):
-        """Draw a single channel meter"""
-        # Channel label
-        self.canvas.create_text(x - 20, y + height/2,
-                               text=channel,
-                               fill="white",
-                               font=('Arial', 10, 'bold'))
+            # Yeşil/sarı/kırmızı bölgeler - genişlikleri seviyeye göre coords ile ayarlanır
+            zones = [(self.db_to_x(db_start),
+                      self.db_to_x(db_end),
+                      self.canvas.create_rectangle(0, 0, 0, 0, fill=color, outline="", state="hidden"))
+                     for db_start, db_end, color in self._zones]
 
-        # Background
-        self.canvas.create_rectangle(x, y, x + width, y + height,
-                                    fill=self.colors['bg'],
-                                    outline=self.colors['border'],
-                                    width=2)
+            # Peak hold indicator
+            peak = self.canvas.create_line(0, y + 2, 0, y + meter_height - 2,
+                                          fill=self.colors['peak'], width=3, state="hidden")
+
+            # dB value text
+            text = self.canvas.create_text(meter_x + meter_width + 35, y + meter_height/2,
+                                          text="-∞ dB", fill=self.db_color(-60),
+                                          font=('Arial', 9, 'bold'))
+
+            self._channel_items[channel] = (y, zones, peak, text)
+
+        # Kanal başına son yazılan dB metni (0.1 dB adımında tamsayı)
+        self._last_text_q = {"L": -600, "R": -600}
+
+        self._last_drawn = None
+
+    def draw_meters(self):
+        """Draw stereo VU meters - değerler 0.1 dB'den az değiştiyse canvas'a dokunma"""
+        levels = (self.left_level, self.right_level, self.left_peak, self.right_peak)
+        last = self._last_drawn
+        if last is not None and all(abs(a - b) < 0.1 for a, b in zip(levels, last)):
+            return
+        self._last_drawn = levels
+        self._refresh_dynamic(*levels)
+
+    def _refresh_dynamic(self, left_db, right_db, left_peak, right_peak):
+        """Seviye çubuklarını, peak çizgilerini ve dB metinlerini yerinde güncelle"""
+        self.draw_channel("L", left_db, left_peak)
+        self.draw_channel("R", right_db, right_peak)
+
+    def draw_channel(self, channel, level, peak):
+        """Tek kanalın dinamik öğelerini güncelle (yeni öğe oluşturmaz)"""
+        y, zones, peak_item, text_item = self._channel_items[channel]
+        height = self._meter_geom[2]
+        canvas = self.canvas
 
         # Calculate level bar width
-        level_x = self.db_to_x(level, x, width)
-
-        # Draw colored segments (green, yellow, red zones)
-        zones = [
-            (-60, -18, self.colors['green']),
-            (-18, -6, self.colors['yellow']),
-            (-6, 0, self.colors['red'])
-        ]
-
-        for db_start, db_end, color in zones:
-            zone_x_start = self.db_to_x(db_start, x, width)
-            zone_x_end = self.db_to_x(db_end, x, width)
-
-            # Only draw if level reaches this zone
-            if level >= db_start:
-                actual_end = min(level_x, zone_x_end)
-                if actual_end > zone_x_start:
-                    # Gradient effect (simulate with overlapping rectangles)
-                    self.canvas.create_rectangle(zone_x_start, y + 2,
-                                                actual_end, y + height - 2,
-                                                fill=color,
-                                                outline="")
+        level_x = self.db_to_x(level)
+
+        # Bölge seviyeye ulaşmadıysa gizle, ulaştıysa seviyeye kadar kırp
+        for zone_x_start, zone_x_end, item in zones:
+            actual_end = min(level_x, zone_x_end)
+            if actual_end > zone_x_start:
+                canvas.coords(item, zone_x_start, y + 2, actual_end, y + height - 2)
+                canvas.itemconfigure(item, state="normal")
+            else:
+                canvas.itemconfigure(item, state="hidden")
 
         # Peak hold indicator
         if peak > -60:
-            peak_x = self.db_to_x(peak, x, width)
-            self.canvas.create_line(peak_x, y + 2,
-                                   peak_x, y + height - 2,
-                                   fill=self.colors['peak'],
-                                   width=3)
-
-        # dB value text
-        db_text = f"{level:.1f} dB" if level > -60 else "-∞ dB"
-        text_color = self.colors['red'] if level >= -6 else self.colors['yellow'] if level >= -18 else self.colors['green']
-        self.canvas.create_text(x + width + 35, y + height/2,
-                               text=db_text,
-                               fill=text_color,
-                               font=('Arial', 9, 'bold'))
-
-    def db_to_x(self, db, x_start, width):
-        """Convert dB value to x coordinate"""
-        # Map -60dB to 0dB -> 0 to width
-        if db <= -60:
-            return x_start
-        if db >= 0:
-            return x_start + width
-
-        # Logarithmic scale
-        normalized = (db + 60) / 60.0  # 0 to 1
-        return x_start + (normalized * width)
+            peak_x = self.db_to_x(peak)
+            canvas.coords(peak_item, peak_x, y + 2, peak_x, y + height - 2)
+            canvas.itemconfigure(peak_item, state="normal")
+        else:
+            canvas.itemconfigure(peak_item, state="hidden")
+
+        # dB value text - 0.1 dB'ye yuvarlanmış değer değişmediyse yeniden biçimlendirme
+        q = round(level * 10)
+        if q != self._last_text_q[channel]:
+            self._last_text_q[channel] = q
+            db = q / 10
+            db_text = f"{db:.1f} dB" if db > -60 else "-∞ dB"
+            canvas.itemconfigure(text_item, text=db_text, fill=self.db_color(db))
+
+    def db_color(self, db):
+        """dB değerinin bölge rengi (eşikler tam sayı, floor ile tablo indeksi)"""
+        return self._db_colors[min(60, max(0, math.floor(db) + 60))]
+
+    def db_to_x(self, db):
+        """dB değerini x koordinatına çevir (-60..0 dB -> ölçer genişliği, 0.1 dB çözünürlük)"""
+        return self._db_lut[min(600, max(0, int(round(db * 10)) + 600))]
 
     def set_levels(self, left_db, right_db):
         """
-        Update audio levels
+        Update audio levels (herhangi bir thread'den çağrılabilir - yalnızca yayınlar)
         Args:
             left_db: Left channel level in dB (-60 to 0)
             right_db: Right channel level in dB (-60 to 0)
         """
-        current_time = time.time()
+        published = self._published
+        published[0] = max(-60.0, min(0.0, left_db))
+        published[1] = max(-60.0, min(0.0, right_db))
+        self._dirty = True
 
-        # Clamp values
-        left_db = max(-60, min(0, left_db))
-        right_db = max(-60, min(0, right_db))
+        # Ana thread'den gelen ardışık çağrılar tek bir idle çizimde birleşir;
+        # audio thread'i Tk'ya dokunmaz, değişikliği _tick_decay alır
+        if not self._scheduled and threading.get_ident() == self._ui_thread:
+            self._scheduled = True
+            self.after_idle(self._flush)
+
+    def _apply_published(self, current_time):
+        """Yayınlanan seviyeleri al ve peak hold'u güncelle (UI thread)"""
+        left_db, right_db = self._published
 
         self.left_level = left_db
         self.right_level = right_db
@@ -193,12 +278,29 @@ class VUMeter(ctk.CTkFrame):
             self.right_peak = right_db
             self.last_peak_time["R"] = current_time
 
+    def _flush(self):
+        """Bekleyen seviye değişikliğini çiz"""
+        self._scheduled = False
+        if self._dirty:
+            self._dirty = False
+            self._apply_published(time.time())
+            self.draw_meters()
+
+    def _tick_decay(self):
+        """Peak hold düşüşü + audio thread'den gelen seviyeleri al (sessizken çizim yok)"""
+        current_time = time.time()
+
         # Decay peak hold after hold time
-        if current_time - self.last_peak_time["L"] > self.peak_hold_time:
+        if self.left_peak > -60 and current_time - self.last_peak_time["L"] > self.peak_hold_time:
             self.left_peak = max(self.left_peak - 0.5, -60)
+            self._dirty = True
 
-        if current_time - self.last_peak_time["R"] > self.peak_hold_time:
+        if self.right_peak > -60 and current_time - self.last_peak_time["R"] > self.peak_hold_time:
             self.right_peak = max(self.right_peak - 0.5, -60)
+            self._dirty = True
+
+        self._flush()
+        self._after_id = self.after(50, self._tick_decay)  # 20 FPS üst sınır
 
     def set_levels_from_amplitude(self, left_amp, right_amp):
         """
@@ -212,17 +314,34 @@ class VUMeter(ctk.CTkFrame):
         right_db = self.amplitude_to_db(right_amp)
         self.set_levels(left_db, right_db)
 
+    def set_levels_from_block(self, block, gain=1.0):
+        """
+        Mono ses bloğundan seviyeleri güncelle (audio callback'ten çağrılabilir)
+        Args:
+            block: 1D float32 örnek dizisi
+            gain: Seviye çarpanı (ör. mikrofon ses seviyesi)
+        """
+        rms, _ = rms_peak(block)
+        db = self.amplitude_to_db(rms * gain)
+        self.set_levels(db, db)
+
+    def set_levels_from_buffer(self, left, right, gain=1.0):
+        """
+        Stereo tampondan peak seviyelerini güncelle (indirgeme tek geçişte, native kodda)
+        Args:
+            left: Sol kanal 1D float32 örnek dizisi
+            right: Sağ kanal 1D float32 örnek dizisi
+            gain: Seviye çarpanı
+        """
+        _, left_peak = rms_peak(left)
+        _, right_peak = rms_peak(right)
+        self.set_levels(self.amplitude_to_db(left_peak * gain), self.amplitude_to_db(right_peak * gain))
+
     def amplitude_to_db(self, amplitude):
-        """Convert amplitude (0-1) to dB (-60 to 0)"""
-        if amplitude <= 0:
+        """Convert amplitude (0-1) to dB (-60 to 0) - skaler, ufunc yerine math.log10"""
+        if amplitude <= 0.001:  # -60 dB altı
             return -60.0
-        db = 20 * np.log10(amplitude)
-        return max(-60, min(0, db))
-
-    def update_animation(self):
-        """Smooth animation update"""
-        self.draw_meters()
-        self.after(50, self.update_animation)  # 20 FPS
+        return min(0.0, 20 * math.log10(amplitude))
 
     def reset(self):
         """Reset VU meter"""
@@ -230,6 +349,15 @@ class VUMeter(ctk.CTkFrame):
         self.right_level = -60.0
         self.left_peak = -60.0
         self.right_peak = -60.0
+        self._published[0] = self._published[1] = -60.0
+        self._dirty = True
+
+    def destroy(self):
+        """Bekleyen kareyi iptal et - yok edilmiş canvas'a geri çağrı gelmesin"""
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        super().destroy()
 
 
 if __name__ == "__main__":
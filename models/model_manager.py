@@ -2,7 +2,12 @@
 AI Model Yöneticisi - Otomatik model indirme ve yükleme
 """
 import os
+import gc
+import queue
+import threading
+import tempfile
 import torch
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 import logging
@@ -10,6 +15,13 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Demucs kalite kademeleri: shifts model geçiş sayısını, overlap pencere sayısını belirler
+DEMUCS_QUALITY = {
+    "fast": {"shifts": 1, "overlap": 0.25, "split": True},
+    "high": {"shifts": 2, "overlap": 0.25, "split": True},
+    "ultra": {"shifts": 10, "overlap": 0.5, "split": False},
+}
+
 
 class ModelManager:
     """AI modellerini yönetir ve yükler"""
@@ -21,8 +33,15 @@ class ModelManager:
         # CUDA kontrolü
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         if self.device == "cuda":
-            logger.info(f"CUDA {torch.version.cuda} tespit edildi")
-            logger.info(f"GPU: {torch.cuda.get_device_name(0)}")
+            # Cihaz özellikleri süreç ömrü boyunca değişmez - monitör her tikte sorgulamasın
+            props = torch.cuda.get_device_properties(0)
+            self.gpu_name = props.name
+            self.gpu_total_gb = props.total_memory / 1e9
+            self.cuda_version = torch.version.cuda
+            self.cudnn_version = torch.backends.cudnn.version()
+
+            logger.info(f"CUDA {self.cuda_version} tespit edildi")
+            logger.info(f"GPU: {self.gpu_name}")
             logger.info(f"PyTorch: {torch.__version__}")
 
             # RTX 5090 AGGRESSIVE MEMORY ALLOCATION
@@ -39,9 +58,14 @@ class ModelManager:
             logger.info("🚀 AGGRESSIVE MODE: %95 VRAM tahsis edildi")
         else:
             logger.warning("CUDA bulunamadı! CPU modunda çalışılıyor.")
+            self.gpu_total_gb = 0.0
 
         self.demucs_model = None
+        self.demucs_model_name = "htdemucs_6s"
+        self.demucs_compiled = False
         self.audiosr_model = None
+        self._super_resolution = None  # audiosr.super_resolution (yüklemede bir kez çözümlenir)
+        self._audiosr_warm = False
 
     def load_demucs(self, model_name: str = "htdemucs_6s") -> object:
         """
@@ -59,11 +83,14 @@ class ModelManager:
             from demucs.apply import apply_model
 
             logger.info(f"Demucs modeli yükleniyor: {model_name}")
+            self.demucs_model_name = model_name
 
             # Model indir ve yükle
             self.demucs_model = get_model(model_name)
             self.demucs_model.to(self.device)
             self.demucs_model.eval()
+            self.demucs_model.requires_grad_(False)  # Yalnızca çıkarım - parametre gradyanı hiç ayrılmaz
+            self._compile_demucs()
 
             logger.info(f"✓ Demucs başarıyla yüklendi ({self.device})")
             return self.demucs_model
@@ -72,6 +99,44 @@ class ModelManager:
             logger.error(f"Demucs yükleme hatası: {e}")
             return None
 
+    def _compile_demucs(self):
+        """
+        CUDA'da Demucs alt modellerini torch.compile ile derle (yükleme başına bir kez)
+        Derlenmiş modül modelde saklanır - her ayırmada yeniden derlenmez
+        """
+        self.demucs_compiled = False
+        if self.device != "cuda" or not hasattr(torch, "compile"):
+            return
+        try:
+            # BagOfModels: apply_model alt modelleri tek tek çalıştırır, derleme orada yapılır
+            models = getattr(self.demucs_model, "models", None)
+            if models is None:
+                return
+            for i, sub_model in enumerate(models):
+                models[i] = torch.compile(sub_model, fullgraph=False)
+            self.demucs_compiled = True
+            logger.info("⚡ Demucs torch.compile ile derlendi (ilk ayırmada derleme süresi eklenir)")
+        except Exception as e:
+            logger.warning(f"Demucs derlenemedi, eager modda devam: {e}")
+
+    def _uncompile_demucs(self):
+        """Derlenmiş alt modelleri orijinal (eager) modüllerle değiştir"""
+        models = self.demucs_model.models
+        for i, sub_model in enumerate(models):
+            models[i] = getattr(sub_model, "_orig_mod", sub_model)
+        self.demucs_compiled = False
+
+    def unload_demucs(self):
+        """Demucs modelini bellekten at - separate_vocals gerekirse yeniden yükler"""
+        self.demucs_model = None
+        self.free_gpu_memory()
+
+    def free_gpu_memory(self):
+        """Referansı bırakılan modellerin VRAM'ini allocator önbelleğinden de serbest bırak"""
+        gc.collect()
+        if self.device == "cuda":
+            torch.cuda.empty_cache()
+
     def load_audiosr(self) -> object:
         """
         AudioSR modelini yükler - AI tabanlı ses iyileştirme
@@ -85,8 +150,11 @@ class ModelManager:
             # Model otomatik indirilir
             # AudioSR'da sadece 'basic' ve 'speech' var, 'basic' en iyisi
             self.audiosr_model = build_model(model_name="basic", device=self.device)
+            self._super_resolution = super_resolution
 
             logger.info(f"✓ AudioSR başarıyla yüklendi ({self.device})")
+            # Yükleme zaten arka planda: ilk gerçek parçanın kernel seçimi beklemesin
+            self._warmup_audiosr()
             return self.audiosr_model
 
         except Exception as e:
@@ -94,16 +162,54 @@ class ModelManager:
             logger.info("AudioSR olmadan devam edilecek (opsiyonel)")
             return None
 
-    def separate_vocals(self, audio_path: str, output_dir: str = "temp") -> dict:
+    def _warmup_audiosr(self):
+        """
+        Kısa sessiz bir klipte birkaç adımlık super_resolution çalıştır
+        cudnn.benchmark kernel seçimi ve CUDA bağlamı ilk gerçek parçadan önce hazırlanır
+        """
+        if self._audiosr_warm or self.audiosr_model is None:
+            return
+        try:
+            import soundfile as sf
+            import numpy as np
+
+            # mkstemp: çalışma dizininden bağımsız, eşzamanlı süreçlerle çakışmayan benzersiz dosya
+            fd, tmp_name = tempfile.mkstemp(prefix="audiosr_warmup_", suffix=".wav")
+            os.close(fd)
+            warmup_path = Path(tmp_name)
+            try:
+                sf.write(str(warmup_path), np.zeros(24000, dtype=np.float32), 48000, subtype='FLOAT')
+                self._super_resolution(self.audiosr_model, str(warmup_path), seed=42,
+                                       guidance_scale=3.5, ddim_steps=2, latent_t_per_second=12.8)
+            finally:
+                warmup_path.unlink(missing_ok=True)
+            logger.info("✓ AudioSR ısındırıldı")
+        except Exception as e:
+            logger.warning(f"AudioSR ısındırma atlandı: {e}")
+        # Başarısız olsa da tekrar denenmez - gerçek çağrı zaten aynı yolu izler
+        self._audiosr_warm = True
+
+    def separate_vocals(self, audio_path: str, output_dir: str = "temp", quality: str = "fast") -> dict:
         """
         Vokal ve enstrümanları ayırır (Demucs ile)
         Daha temiz pitch shifting için
+        quality: "fast" (1 geçiş), "high" (2 geçiş) veya "ultra" (10 geçiş, bölmesiz)
         """
+        params = DEMUCS_QUALITY.get(quality, DEMUCS_QUALITY["fast"])
+
+        # CPU'da Demucs CLI'nin -j paralelliği in-process'ten ~2x hızlı
+        if self.device != "cuda":
+            output_paths = self._separate_vocals_cli(audio_path, output_dir, params)
+            if output_paths:
+                return output_paths
+            logger.info("Demucs CLI başarısız, in-process ayırmaya geçiliyor...")
+
         if self.demucs_model is None:
             self.load_demucs()
 
         try:
             import torchaudio
+            import soundfile as sf
             from demucs.apply import apply_model
             import librosa
             import numpy as np
@@ -113,8 +219,20 @@ class ModelManager:
             # Dosya yolunu normalize et (Windows için)
             audio_path_normalized = str(Path(audio_path).resolve())
 
-            # Audio yükle - librosa kullan (daha uyumlu)
+            # Audio yükle - torchaudio (native örnekleme hızı), yeniden örnekleme cihazda yapılır
             try:
+                wav, sr = torchaudio.load(audio_path_normalized)
+                if self.device == "cuda":
+                    # Pinned bellekten asenkron kopya: CPU hazırlığı GPU transferiyle örtüşür
+                    wav = wav.pin_memory()
+                wav = wav.to(self.device, non_blocking=True)
+                if sr != 44100:
+                    wav = torchaudio.functional.resample(wav, sr, 44100, lowpass_filter_width=64)
+                    sr = 44100
+
+            except Exception as e:
+                # torchaudio'nun çözemediği formatlar için librosa (CPU resample, daha yavaş)
+                logger.warning(f"torchaudio ile yükleme başarısız, librosa deneniyor: {e}")
                 wav_np, sr = librosa.load(audio_path_normalized, sr=44100, mono=False)
 
                 # Numpy'dan torch'a çevir
@@ -123,30 +241,39 @@ class ModelManager:
 
                 wav = torch.from_numpy(wav_np).float().to(self.device)
 
-            except Exception as e:
-                logger.error(f"Librosa ile yükleme başarısız, torchaudio deneniyor: {e}")
-                wav, sr = torchaudio.load(audio_path_normalized)
-                wav = wav.to(self.device)
-
             # Stereo'ya çevir (gerekirse)
             if wav.shape[0] == 1:
                 wav = wav.repeat(2, 1)
 
             # Model uygula - RTX 5090 AGGRESSIVE OPTIMIZATION
-            with torch.no_grad():
+            # BF16 destekleyen GPU'da bf16 autocast (FP16'dan geniş aralık, aynı tensor core hızı)
+            amp_dtype = torch.bfloat16 if self.device == "cuda" and torch.cuda.is_bf16_supported() else torch.float16
+
+            def run_model():
+                # inference_mode: no_grad'dan farklı olarak version counter/view takibi de yapılmaz
                 # Mixed precision için autocast
-                with torch.amp.autocast('cuda'):
-                    sources = apply_model(
+                with torch.inference_mode(), torch.amp.autocast('cuda', dtype=amp_dtype):
+                    return apply_model(
                         self.demucs_model,
                         wav.unsqueeze(0),
                         device=self.device,
-                        shifts=1,  # Shift sayısı (daha hızlı için 1, daha kaliteli için 2-5)
-                        split=True,  # Uzun dosyaları parçalara böl (bellek hatası önler)
-                        overlap=0.25,  # Parçalar arası overlap
+                        shifts=params["shifts"],  # Shift sayısı = model geçiş sayısı
+                        split=params["split"],  # Uzun dosyaları parçalara böl (bellek hatası önler)
+                        overlap=params["overlap"],  # Parçalar arası overlap
                         progress=True,
                         num_workers=8  # Paralel işlem sayısı
                     )[0]
 
+            try:
+                sources = run_model()
+            except Exception as e:
+                if not self.demucs_compiled:
+                    raise
+                # Derleme desteklenmeyen bir op'a takıldıysa eager modele dön ve tekrar dene
+                logger.warning(f"Derlenmiş Demucs başarısız, eager moda dönülüyor: {e}")
+                self._uncompile_demucs()
+                sources = run_model()
+
             # Kaynak isimleri - Demucs modelinin source sayısına göre
             # htdemucs_6s: drums, bass, other, vocals, guitar, piano (6 stem)
             # htdemucs_ft: drums, bass, other, vocals (4 stem)
@@ -170,15 +297,26 @@ class ModelManager:
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
 
-            for i, name in enumerate(source_names):
+            # Tüm stem'ler tek bir D2H kopyasıyla pinned belleğe (stem başına ayrı .cpu() yok)
+            if sources.is_cuda:
+                sources_cpu = torch.empty(sources.shape, dtype=sources.dtype, pin_memory=True)
+                sources_cpu.copy_(sources, non_blocking=True)
+                torch.cuda.current_stream().synchronize()
+                del sources
+            else:
+                sources_cpu = sources
+            stems = sources_cpu.float().numpy()  # [stem, kanal, örnek] - pinned tampon üzerinde görünüm
+
+            def save_stem(i, name):
                 output_file = output_path / f"{name}.wav"
-                torchaudio.save(
-                    str(output_file),
-                    sources[i].cpu(),
-                    sr
-                )
-                output_paths[name] = str(output_file)
+                # soundfile doğrudan libsndfile'a yazar ve kodlama sırasında GIL'i bırakır
+                sf.write(str(output_file), stems[i].T, sr, subtype='FLOAT')
                 logger.info(f"  ✓ {name} kaydedildi")
+                return name, str(output_file)
+
+            # Stem'ler paralel yazılır: WAV kodlamaları thread'ler arasında eşzamanlı çalışır
+            with ThreadPoolExecutor(max_workers=max(1, len(source_names))) as executor:
+                output_paths.update(executor.map(save_stem, range(len(source_names)), source_names))
 
             return output_paths
 
@@ -186,10 +324,60 @@ class ModelManager:
             logger.error(f"Vokal ayırma hatası: {e}")
             return {}
 
-    def enhance_audio(self, audio_path: str, output_path: str) -> bool:
+    def _separate_vocals_cli(self, audio_path: str, output_dir: str, params: dict) -> dict:
+        """
+        CPU fast-path: Demucs'u ayrı process'te `-j` ile çalıştır
+        Çıktılar in-process yol ile aynı yere taşınır: <output_dir>/<stem>.wav
+        """
+        import subprocess
+        import sys
+
+        jobs = max(1, (os.cpu_count() or 2) // 2)
+        logger.info(f"Ses ayrıştırılıyor (Demucs CLI, {jobs} iş): {audio_path}")
+
+        try:
+            subprocess.run(
+                [sys.executable, "-m", "demucs",
+                 "-n", self.demucs_model_name,
+                 "-j", str(jobs),
+                 "-d", "cpu",
+                 "--shifts", str(params["shifts"]),
+                 "--overlap", str(params["overlap"]),
+                 *(() if params["split"] else ("--no-split",)),
+                 "-o", str(output_dir),
+                 "--filename", "{stem}.{ext}",
+                 str(Path(audio_path).resolve())],
+                check=True,
+                capture_output=True,
+                text=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.error(f"Demucs CLI hatası: {getattr(e, 'stderr', None) or e}")
+            return {}
+
+        # CLI çıktısı <output_dir>/<model>/<stem>.wav - bir üst klasöre taşı
+        output_path = Path(output_dir)
+        cli_dir = output_path / self.demucs_model_name
+        output_paths = {}
+        for stem_file in sorted(cli_dir.glob("*.wav")):
+            target = output_path / stem_file.name
+            os.replace(stem_file, target)
+            output_paths[stem_file.stem] = str(target)
+            logger.info(f"  ✓ {stem_file.stem} kaydedildi")
+
+        try:
+            cli_dir.rmdir()
+        except OSError:
+            pass
+
+        return output_paths
+
+    def enhance_audio(self, audio_path: str, output_path: str,
+                      ddim_steps: int = 50, guidance_scale: float = 3.5) -> bool:
         """
         AudioSR ile ses kalitesini artırır
         Büyük dosyalar için parça parça işleme (chunk-based)
+        ddim_steps: Difüzyon adımı (50 = kütüphane varsayılanı, 200 = en yüksek kalite, ~4x yavaş)
         """
         if self.audiosr_model is None:
             logger.info("AudioSR yüklenmemiş, atlanıyor...")
@@ -199,20 +387,37 @@ class ModelManager:
             import soundfile as sf
             import librosa
             import numpy as np
-            from audiosr import super_resolution
+
+            super_resolution = self._super_resolution
+            self._warmup_audiosr()
 
             logger.info("Ses kalitesi artırılıyor (AI)...")
 
-            # Ses dosyasını yükle
-            audio, sr = librosa.load(audio_path, sr=None, mono=False)
+            # Ses dosyasını parça parça oku - tüm dosya belleğe alınmaz (yalnızca başlık okunur)
+            try:
+                source = sf.SoundFile(audio_path)
+            except RuntimeError:
+                # libsndfile'ın açamadığı formatlar için librosa (tüm dosya bellekte, zaman ekseni 0)
+                source = None
+                audio, sr = librosa.load(audio_path, sr=None, mono=False)
+                audio = audio.T
+                total_samples = len(audio)
+                channels = 1 if audio.ndim == 1 else audio.shape[1]
+            else:
+                sr = source.samplerate
+                channels = source.channels
+                total_samples = source.frames
+
+            def read_chunk(start_idx, end_idx):
+                """[start, end) aralığını (örnek,) veya (örnek, kanal) float32 olarak oku"""
+                if source is None:
+                    return audio[start_idx:end_idx]
+                source.seek(start_idx)
+                chunk = source.read(end_idx - start_idx, dtype='float32', always_2d=True)
+                return chunk[:, 0] if channels == 1 else chunk
 
             # Dosya uzunluğunu kontrol et (saniye)
-            if audio.ndim > 1:
-                duration = len(audio[0]) / sr
-                channels = audio.shape[0]
-            else:
-                duration = len(audio) / sr
-                channels = 1
+            duration = total_samples / sr
 
             logger.info(f"📊 Dosya süresi: {duration:.1f}s, {channels} kanal")
 
@@ -223,13 +428,15 @@ class ModelManager:
 
             # Kısa dosyalar direkt işle
             if duration <= chunk_duration:
+                if source is not None:
+                    source.close()
                 logger.info("Kısa dosya, tek seferde işleniyor (FULL KALITE)...")
                 enhanced = super_resolution(
                     self.audiosr_model,
                     audio_path,
                     seed=42,
-                    guidance_scale=3.5,  # Kalite kontrolü (varsayılan)
-                    ddim_steps=200,      # EN YÜKSEK KALITE (50 -> 200)
+                    guidance_scale=guidance_scale,  # Kalite kontrolü
+                    ddim_steps=ddim_steps,
                     latent_t_per_second=12.8
                 )
                 sf.write(output_path, enhanced, 48000)
@@ -244,24 +451,39 @@ class ModelManager:
             temp_dir.mkdir(parents=True, exist_ok=True)
 
             enhanced_chunks = []
-            total_samples = audio.shape[-1] if audio.ndim > 1 else len(audio)
 
-            chunk_count = 0
-            start_idx = 0
+            # super_resolution yalnızca dosya yolu kabul ediyor. Üretici thread sonraki parçaları
+            # döngüsel birkaç geçici dosyaya yazar, GPU bu sırada mevcut parçayı işler.
+            # Slot sayısı = kuyruk + işlenen + yazılan: yazılan dosya hiçbir zaman okunmakta olan değildir
+            chunk_queue = queue.Queue(maxsize=2)
+            chunk_slots = [temp_dir / f"chunk_{k}.wav" for k in range(chunk_queue.maxsize + 2)]
+            producer_error = []
 
-            while start_idx < total_samples:
-                end_idx = min(start_idx + chunk_samples, total_samples)
-                chunk_count += 1
+            def produce_chunks():
+                try:
+                    # Overlap ile ilerle (daha yumuşak geçişler için)
+                    for n, start_idx in enumerate(range(0, total_samples, chunk_samples - overlap_samples)):
+                        end_idx = min(start_idx + chunk_samples, total_samples)
+                        chunk = read_chunk(start_idx, end_idx)
+                        chunk_path = chunk_slots[n % len(chunk_slots)]
+                        # Chunk'ı geçici dosyaya kaydet (FLOAT: PCM kuantalama/dönüştürme yok)
+                        sf.write(str(chunk_path), chunk, sr, subtype='FLOAT')
+                        chunk_queue.put((chunk_path, chunk, start_idx, end_idx))
+                except Exception as e:
+                    producer_error.append(e)
+                finally:
+                    chunk_queue.put(None)
 
-                # Chunk'ı ayıkla
-                if audio.ndim > 1:
-                    chunk = audio[:, start_idx:end_idx]
-                else:
-                    chunk = audio[start_idx:end_idx]
+            producer = threading.Thread(target=produce_chunks, daemon=True)
+            producer.start()
 
-                # Chunk'ı geçici dosyaya kaydet
-                chunk_path = temp_dir / f"chunk_{chunk_count}.wav"
-                sf.write(str(chunk_path), chunk.T if audio.ndim > 1 else chunk, sr)
+            chunk_count = 0
+            while True:
+                item = chunk_queue.get()
+                if item is None:
+                    break
+                chunk_path, chunk, start_idx, end_idx = item
+                chunk_count += 1
 
                 logger.info(f"  🎵 Parça {chunk_count} işleniyor... ({start_idx/sr:.1f}s - {end_idx/sr:.1f}s)")
 
@@ -271,8 +493,8 @@ class ModelManager:
                         self.audiosr_model,
                         str(chunk_path),
                         seed=42,
-                        guidance_scale=3.5,
-                        ddim_steps=200,  # EN YÜKSEK KALITE (50 -> 200)
+                        guidance_scale=guidance_scale,
+                        ddim_steps=ddim_steps,
                         latent_t_per_second=12.8
                     )
 
@@ -283,61 +505,50 @@ class ModelManager:
                     logger.error(f"  ❌ Parça {chunk_count} hatası: {e}")
                     logger.info("  ⚠️ Bu parça orijinal kalitede bırakılacak")
                     # Hata durumunda orijinal chunk'ı kullan
-                    if audio.ndim > 1:
-                        enhanced_chunks.append(chunk.T)
-                    else:
-                        enhanced_chunks.append(chunk)
-
-                finally:
-                    # Temp chunk'ı sil
-                    if chunk_path.exists():
-                        chunk_path.unlink()
+                    enhanced_chunks.append(chunk)
 
-                # Overlap ile ilerle (daha yumuşak geçişler için)
-                start_idx += chunk_samples - overlap_samples
+            producer.join()
+            if source is not None:
+                source.close()
 
-                # CUDA belleğini temizle
-                if self.device == "cuda":
-                    torch.cuda.empty_cache()
+            # CUDA belleğini temizle - parça başına değil bir kez (allocator sonraki parçada aynı blokları kullanır)
+            if self.device == "cuda":
+                torch.cuda.empty_cache()
+            if producer_error:
+                raise producer_error[0]
 
             # Tüm chunk'ları birleştir
             logger.info("🔗 Parçalar birleştiriliyor...")
 
-            # Overlap bölgelerinde cross-fade uygula
-            final_audio = enhanced_chunks[0]
+            # Overlap bölgelerinde cross-fade uygula - çıktı tamponu bir kez ayrılır, parçalar yerinde yazılır
+            lengths = [len(c) for c in enhanced_chunks]
+            fades = [0] + [min(overlap_samples, lengths[i - 1], lengths[i]) for i in range(1, len(lengths))]
+            final_audio = np.empty((sum(lengths) - sum(fades),) + enhanced_chunks[0].shape[1:], dtype=np.float32)
 
-            for i in range(1, len(enhanced_chunks)):
-                # Cross-fade için overlap bölgesi
-                fade_samples = min(overlap_samples, len(final_audio), len(enhanced_chunks[i]))
+            # Fade eğrileri bir kez hesaplanır; zaman ekseni 0, kanallar için yayın şekli
+            bcast = (-1,) + (1,) * (final_audio.ndim - 1)
+            fade_in_full = np.linspace(0, 1, overlap_samples, dtype=np.float32).reshape(bcast)
 
+            pos = 0
+            for chunk, fade_samples in zip(enhanced_chunks, fades):
                 if fade_samples > 0:
-                    # Fade out (önceki chunk'ın sonu)
-                    fade_out = np.linspace(1, 0, fade_samples)
-                    # Fade in (yeni chunk'ın başı)
-                    fade_in = np.linspace(0, 1, fade_samples)
-
-                    # Son chunk'ı kısalt ve fade uygula
-                    final_audio = final_audio[:-fade_samples]
-
-                    # Overlap bölgesini karıştır
-                    overlap_part = (final_audio[-fade_samples:].T * fade_out +
-                                   enhanced_chunks[i][:fade_samples].T * fade_in).T
-
-                    # Birleştir
-                    final_audio = np.concatenate([
-                        final_audio,
-                        overlap_part,
-                        enhanced_chunks[i][fade_samples:]
-                    ], axis=0)
-                else:
-                    # Overlap yoksa direkt ekle
-                    final_audio = np.concatenate([final_audio, enhanced_chunks[i]], axis=0)
+                    if fade_samples == overlap_samples:
+                        fade_in = fade_in_full
+                    else:
+                        fade_in = np.linspace(0, 1, fade_samples, dtype=np.float32).reshape(bcast)
+                    # Önceki parçanın sonu (fade out) + yeni parçanın başı (fade in): a + (b - a) * t
+                    tail = final_audio[pos - fade_samples:pos]
+                    tail += (chunk[:fade_samples] - tail) * fade_in
+                np.copyto(final_audio[pos:pos + len(chunk) - fade_samples], chunk[fade_samples:])
+                pos += len(chunk) - fade_samples
 
             # Final audio'yu kaydet
             sf.write(output_path, final_audio, 48000)
 
             # Temp dizinini temizle
             try:
+                for chunk_path in chunk_slots:
+                    chunk_path.unlink(missing_ok=True)
                 temp_dir.rmdir()
             except:
                 pass
@@ -360,10 +571,10 @@ class ModelManager:
 
         if self.device == "cuda":
             info.update({
-                "cuda_version": torch.version.cuda,
-                "gpu_name": torch.cuda.get_device_name(0),
-                "gpu_memory": f"{torch.cuda.get_device_properties(0).total_memory / 1e9:.2f} GB",
-                "cudnn_version": torch.backends.cudnn.version(),
+                "cuda_version": self.cuda_version,
+                "gpu_name": self.gpu_name,
+                "gpu_memory": f"{self.gpu_total_gb:.2f} GB",
+                "cudnn_version": self.cudnn_version,
             })
 
         return info
@@ -374,10 +585,10 @@ class ModelManager:
             return {"available": False}
 
         try:
-            # GPU bellek kullanımı
+            # GPU bellek kullanımı (allocator sayaçları - sürücü çağrısı yok)
             allocated = torch.cuda.memory_allocated(0) / 1e9  # GB
             reserved = torch.cuda.memory_reserved(0) / 1e9  # GB
-            total = torch.cuda.get_device_properties(0).total_memory / 1e9  # GB
+            total = self.gpu_total_gb  # GB (önbellekten)
 
             usage_percent = (allocated / total) * 100
 
@@ -0,0 +1,134 @@
+"""
+English translations for Musicio ULTRA
+Language tarafından yalnızca bu dil seçildiğinde yüklenir
+"""
+
+TRANSLATIONS = {
+    # System messages
+    'system_starting': 'System starting...',
+    'system_ready': 'System ready!',
+    'gpu_detected': 'GPU detected',
+    'cuda_version': 'CUDA',
+    'ai_models_loading': 'AI models loading...',
+    'demucs_ready': 'Demucs model ready',
+    'audiosr_ready': 'AudioSR model ready',
+    'mic_restored': 'Microphone restored',
+    'speaker_restored': 'Speaker restored',
+    'devices_found': 'microphones, speakers found',
+    'backing_track_loaded': 'Backing track loaded',
+    'backing_tracks_found': 'backing tracks found',
+
+    # GUI - Main tabs
+    'tab_karaoke': 'KARAOKE',
+    'tab_vocal_sep': 'VOCAL SEPARATION',
+    'tab_analysis': 'ANALYSIS',
+    'tab_effects': 'EFFECTS',
+
+    # GUI - Karaoke section
+    'karaoke_title': 'PROFESSIONAL KARAOKE STUDIO',
+    'select_file': 'SELECT FILE',
+    'select_output': 'SELECT OUTPUT FOLDER',
+    'create_backing': 'CREATE BACKING TRACK',
+    'record_mix': 'RECORD + MIX',
+    'microphone': 'Microphone',
+    'speaker': 'Speaker',
+    'output_folder': 'Output Folder',
+    'volume': 'Volume',
+    'pitch_shift': 'Pitch Shift',
+    'tempo': 'Tempo',
+    'semitones': 'semitones',
+
+    # GUI - Buttons
+    'load_backing': 'LOAD BACKING TRACK',
+    'apply_pitch': 'APPLY PITCH SHIFT',
+    'apply_tempo': 'APPLY TEMPO',
+    'detect_bpm': 'DETECT BPM',
+    'detect_key': 'DETECT KEY',
+    'separate_vocals': 'SEPARATE VOCALS',
+
+    # GUI - Presets
+    'preset_radio': 'Radio Ready',
+    'preset_concert': 'Live Concert',
+    'preset_studio': 'Studio Vocal',
+    'preset_church': 'Church Reverb',
+    'preset_dry': 'Dry Vocal',
+
+    # Status messages
+    'processing': 'Processing...',
+    'completed': 'Completed',
+    'error': 'Error',
+    'warning': 'Warning',
+    'info': 'Info',
+    'success': 'Success',
+
+    # Karaoke messages
+    'karaoke_starting': 'Karaoke mode starting (PROFESSIONAL MODE)...',
+    'karaoke_active': 'Karaoke active! (PROFESSIONAL MODE)',
+    'karaoke_stopped': 'Karaoke stopped',
+    'karaoke_completed': 'Karaoke completed!',
+    'backing_track': 'Backing track',
+    'latency': 'Latency',
+    'fx_active': 'PROFESSIONAL FX + ULTRA LOW LATENCY!',
+    'stop_instruction': 'Click RECORD + MIX again to stop',
+
+    # File operations
+    'file_selected': 'File selected',
+    'folder_selected': 'Folder selected',
+    'file_saved': 'File saved',
+    'loading_file': 'Loading file...',
+
+    # Audio processing
+    'separating_vocals': 'Separating vocals...',
+    'vocals_separated': 'Vocals separated successfully!',
+    'creating_backing': 'Creating backing track...',
+    'backing_created': 'Backing track created!',
+    'applying_effects': 'Applying effects...',
+    'effects_applied': 'Effects applied!',
+
+    # Lyrics
+    'lyrics_loading': 'Loading lyrics',
+    'lyrics_loaded': 'Lyrics loaded',
+    'lyrics_not_found': 'Lyrics not found (karaoke player will show plain view)',
+    'lyrics_converting': 'Converting lyrics...',
+    'lyrics_converted': 'Lyrics JSON created!',
+    'lyrics_found': 'lyrics.txt files found!',
+
+    # Errors
+    'error_no_file': 'Please select a file first!',
+    'error_no_output': 'Please select output folder!',
+    'error_no_backing': 'Please click CREATE BACKING TRACK first!',
+    'error_backing_not_found': 'Backing track file not found!',
+    'error_no_mic': 'Please select microphone!',
+    'error_no_speaker': 'Please select speaker!',
+    'error_processing': 'Processing error',
+
+    # Player controls
+    'play': 'Play',
+    'pause': 'Pause',
+    'stop': 'Stop',
+    'seek': 'Seek',
+
+    # FX controls
+    'reverb': 'Reverb',
+    'compressor': 'Compressor',
+    'equalizer': 'Equalizer',
+    'echo': 'Echo',
+    'room_size': 'Room Size',
+    'wet_mix': 'Wet Mix',
+    'threshold': 'Threshold',
+    'ratio': 'Ratio',
+    'bass': 'Bass',
+    'mid': 'Mid',
+    'treble': 'Treble',
+    'delay': 'Delay',
+    'feedback': 'Feedback',
+    'mix': 'Mix',
+
+    # Analysis
+    'bpm_detected': 'BPM detected',
+    'key_detected': 'Key detected',
+    'analyzing': 'Analyzing...',
+
+    # Default
+    'default': 'Default',
+}
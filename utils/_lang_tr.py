@@ -0,0 +1,134 @@
+"""
+Turkish translations for Musicio ULTRA
+Language tarafından yalnızca bu dil seçildiğinde yüklenir
+"""
+
+TRANSLATIONS = {
+    # System messages
+    'system_starting': 'Sistem başlatılıyor...',
+    'system_ready': 'Sistem hazır!',
+    'gpu_detected': 'GPU tespit edildi',
+    'cuda_version': 'CUDA',
+    'ai_models_loading': 'AI modelleri yükleniyor...',
+    'demucs_ready': 'Demucs modeli hazır',
+    'audiosr_ready': 'AudioSR modeli hazır',
+    'mic_restored': 'Mikrofon geri yüklendi',
+    'speaker_restored': 'Hoparlör geri yüklendi',
+    'devices_found': 'mikrofon, hoparlör bulundu',
+    'backing_track_loaded': 'Backing track yüklendi',
+    'backing_tracks_found': 'backing track bulundu',
+
+    # GUI - Main tabs
+    'tab_karaoke': 'KARAOKE',
+    'tab_vocal_sep': 'VOKAL AYIRMA',
+    'tab_analysis': 'ANALİZ',
+    'tab_effects': 'EFEKTLER',
+
+    # GUI - Karaoke section
+    'karaoke_title': 'PROFESYONEL KARAOKE STÜDYOSU',
+    'select_file': 'DOSYA SEÇ',
+    'select_output': 'ÇIKTI KLASÖRÜ SEÇ',
+    'create_backing': 'BACKING TRACK OLUŞTUR',
+    'record_mix': 'KAYIT + MİX',
+    'microphone': 'Mikrofon',
+    'speaker': 'Hoparlör',
+    'output_folder': 'Çıktı Klasörü',
+    'volume': 'Ses Seviyesi',
+    'pitch_shift': 'Perde Kayması',
+    'tempo': 'Tempo',
+    'semitones': 'yarım ton',
+
+    # GUI - Buttons
+    'load_backing': 'BACKING TRACK YÜKLE',
+    'apply_pitch': 'PERDE UYGULA',
+    'apply_tempo': 'TEMPO UYGULA',
+    'detect_bpm': 'BPM ALGI',
+    'detect_key': 'ANAHTAR ALGI',
+    'separate_vocals': 'VOKAL AYIR',
+
+    # GUI - Presets
+    'preset_radio': 'Radyo Hazır',
+    'preset_concert': 'Canlı Konser',
+    'preset_studio': 'Stüdyo Vokal',
+    'preset_church': 'Kilise Yankısı',
+    'preset_dry': 'Kuru Vokal',
+
+    # Status messages
+    'processing': 'İşleniyor...',
+    'completed': 'Tamamlandı',
+    'error': 'Hata',
+    'warning': 'Uyarı',
+    'info': 'Bilgi',
+    'success': 'Başarılı',
+
+    # Karaoke messages
+    'karaoke_starting': 'Karaoke modu başlatılıyor (PROFESYONEL MODE)...',
+    'karaoke_active': 'Karaoke aktif! (PROFESYONEL MODE)',
+    'karaoke_stopped': 'Karaoke durduruldu',
+    'karaoke_completed': 'Karaoke tamamlandı!',
+    'backing_track': 'Backing track',
+    'latency': 'Gecikme',
+    'fx_active': 'PROFESYONEL FX + ULTRA DÜŞÜK GECİKME!',
+    'stop_instruction': 'Durdurmak için KAYIT + MİX butonuna tekrar tıkla',
+
+    # File operations
+    'file_selected': 'Dosya seçildi',
+    'folder_selected': 'Klasör seçildi',
+    'file_saved': 'Dosya kaydedildi',
+    'loading_file': 'Dosya yükleniyor...',
+
+    # Audio processing
+    'separating_vocals': 'Vokaller ayrılıyor...',
+    'vocals_separated': 'Vokaller başarıyla ayrıldı!',
+    'creating_backing': 'Backing track oluşturuluyor...',
+    'backing_created': 'Backing track oluşturuldu!',
+    'applying_effects': 'Efektler uygulanıyor...',
+    'effects_applied': 'Efektler uygulandı!',
+
+    # Lyrics
+    'lyrics_loading': 'Şarkı sözleri yükleniyor',
+    'lyrics_loaded': 'Şarkı sözleri yüklendi',
+    'lyrics_not_found': 'Şarkı sözleri bulunamadı (karaoke player sade görünecek)',
+    'lyrics_converting': 'Sözler dönüştürülüyor...',
+    'lyrics_converted': 'Lyrics JSON oluşturuldu!',
+    'lyrics_found': 'adet _lyrics.txt dosyası bulundu!',
+
+    # Errors
+    'error_no_file': 'Lütfen önce bir dosya seçin!',
+    'error_no_output': 'Lütfen çıktı klasörü seçin!',
+    'error_no_backing': 'Lütfen önce BACKING TRACK OLUŞTUR butonuna tıklayın!',
+    'error_backing_not_found': 'Backing track dosyası bulunamadı!',
+    'error_no_mic': 'Lütfen mikrofon seçin!',
+    'error_no_speaker': 'Lütfen hoparlör seçin!',
+    'error_processing': 'İşleme hatası',
+
+    # Player controls
+    'play': 'Oynat',
+    'pause': 'Duraklat',
+    'stop': 'Durdur',
+    'seek': 'Atla',
+
+    # FX controls
+    'reverb': 'Yankı',
+    'compressor': 'Sıkıştırıcı',
+    'equalizer': 'Ekolayzer',
+    'echo': 'Eko',
+    'room_size': 'Oda Boyutu',
+    'wet_mix': 'Islak Karışım',
+    'threshold': 'Eşik',
+    'ratio': 'Oran',
+    'bass': 'Bas',
+    'mid': 'Orta',
+    'treble': 'Tiz',
+    'delay': 'Gecikme',
+    'feedback': 'Geri Besleme',
+    'mix': 'Karışım',
+
+    # Analysis
+    'bpm_detected': 'BPM algılandı',
+    'key_detected': 'Anahtar algılandı',
+    'analyzing': 'Analiz ediliyor...',
+
+    # Default
+    'default': 'Varsayılan',
+}
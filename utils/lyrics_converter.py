@@ -2,14 +2,33 @@
 Automatic Lyrics Converter
 Converts [MM:SS] format lyrics to JSON for karaoke player
 """
+import os
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 
+# Hızlı JSON (opsiyonel) - yoksa stdlib json kullanılır
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# [MM:SS] / [MM:SS.ms] zaman damgası: dakika, saniye, kesir ayrı gruplar (satır döngüsünde derleme yok)
+_TIMESTAMP = r'(\d{2}):(\d{2})(?:\.(\d+))?'
+_TIMESTAMP_RE = re.compile(r'^\[?' + _TIMESTAMP + r'\]?$')
+# Ham bayt satırlarda eşleşir (zaman damgası ASCII - yalnızca metin kısmı UTF-8 çözülür)
+# Satır sonu (\n / \r\n) ve baştaki boşluk regex içinde tolere edilir; metin sonradan strip edilir
+_LRC_RE = re.compile(rb'^\s*\[' + _TIMESTAMP.encode() + rb'\]\s*(.*)$')
+
+# Şarkı sözü sayılmayan enstrümantal işaretleri (küçük harf)
+_SKIP_TEXTS = frozenset({'müzik'})
+
 
 def parse_timestamp(timestamp_str):
     """
@@ -19,36 +38,25 @@ def parse_timestamp(timestamp_str):
     Returns:
         Float seconds (e.g., 21.0 or 83.45)
     """
-    # Remove brackets and split
-    time_str = timestamp_str.strip('[]')
-
-    # Handle MM:SS or MM:SS.ms
-    parts = time_str.split(':')
-    if len(parts) != 2:
+    match = _TIMESTAMP_RE.match(timestamp_str.strip())
+    if not match:
         return None
-
-    minutes = int(parts[0])
-
-    # Handle seconds with optional milliseconds
-    if '.' in parts[1]:
-        seconds_parts = parts[1].split('.')
-        seconds = int(seconds_parts[0])
-        milliseconds = int(seconds_parts[1]) / 100.0  # Convert to fraction
-        total_seconds = minutes * 60 + seconds + milliseconds
-    else:
-        seconds = int(parts[1])
-        total_seconds = minutes * 60 + seconds
-
+    minutes, seconds, fraction = match.groups()
+    # Kesir basamak sayısına göre ölçeklenir: .5 -> 0.5, .45 -> 0.45
+    total_seconds = int(minutes) * 60 + int(seconds)
+    if fraction:
+        total_seconds += int(fraction) / 10 ** len(fraction)
     return total_seconds
 
 
-def convert_lyrics_txt_to_json(txt_path, output_json_path=None):
+def convert_lyrics_txt_to_json(txt_path, output_json_path=None, pretty=False):
     """
     Convert timestamped lyrics.txt to JSON format for karaoke player
 
     Args:
         txt_path: Path to lyrics.txt file (format: [MM:SS] text)
         output_json_path: Optional custom output path (default: same name with .lyrics.json)
+        pretty: Girintili (okunabilir) JSON yaz; varsayılan kompakt çıktı (C encoder yolu)
 
     Returns:
         Path to created JSON file or None if failed
@@ -60,49 +68,42 @@ def convert_lyrics_txt_to_json(txt_path, output_json_path=None):
             logger.error(f"Lyrics file not found: {txt_path}")
             return None
 
-        # Read lyrics file
-        with open(txt_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        # Parse timestamped lines
-        segments = []
-        pattern = r'^\[(\d{2}:\d{2}(?:\.\d+)?)\]\s*(.*)$'
-
-        for line in lines:
-            line = line.strip()
-            match = re.match(pattern, line)
+        # Parse timestamped lines (dosya satır satır okunur, liste ve strip kopyaları yok)
+        # Paralel listeler: segment başına sözlük yalnızca JSON yazılırken oluşturulur
+        starts = []
+        texts = []
+
+        with open(txt_path, 'rb') as f:
+            for line in f:
+                # '[' içermeyen satırlar (boş, başlık, yorum) regex motoruna girmeden elenir
+                match = _LRC_RE.match(line) if b'[' in line else None
+                if match is None:
+                    # Eşleşmeyen satırlar da katı çözülür: geçersiz UTF-8 dönüşümü eskisi gibi durdurur
+                    line.decode('utf-8')
+                    continue
 
-            if match:
-                timestamp_str = f"[{match.group(1)}]"
-                text = match.group(2).strip()
+                minutes, seconds, fraction, text = match.groups()
+                text = text.decode('utf-8').strip()
 
                 # Skip empty lines or "Müzik" markers
-                if not text or text.lower() == 'müzik':
+                if not text or text.lower() in _SKIP_TEXTS:
                     continue
 
-                start_time = parse_timestamp(timestamp_str)
-                if start_time is not None:
-                    segments.append({
-                        'start': start_time,
-                        'text': text
-                    })
+                # Zaman damgası satır içinde hesaplanır (satır başına ek fonksiyon çağrısı yok)
+                start_time = int(minutes) * 60 + int(seconds)
+                if fraction:
+                    start_time += int(fraction) / 10 ** len(fraction)
 
-        if not segments:
+                starts.append(start_time)
+                texts.append(text)
+
+        if not starts:
             logger.warning(f"No valid lyrics found in {txt_path}")
             return None
 
         # Calculate end times (next segment's start, or +3 seconds for last)
-        for i in range(len(segments)):
-            if i < len(segments) - 1:
-                segments[i]['end'] = segments[i + 1]['start']
-            else:
-                # Last segment: +3 seconds
-                segments[i]['end'] = segments[i]['start'] + 3.0
-
-        # Create JSON structure (Whisper API format)
-        lyrics_data = {
-            "segments": segments
-        }
+        ends = starts[1:]
+        ends.append(starts[-1] + 3.0)
 
         # Determine output path
         if output_json_path is None:
@@ -111,13 +112,31 @@ def convert_lyrics_txt_to_json(txt_path, output_json_path=None):
         else:
             output_json_path = Path(output_json_path)
 
-        # Save JSON
-        with open(output_json_path, 'w', encoding='utf-8') as f:
-            json.dump(lyrics_data, f, ensure_ascii=False, indent=2)
+        # Save JSON (Whisper API format: {"segments": [{start, text, end}, ...]})
+        # Önce geçici dosyaya yazılır, sonra tek rename ile yerine konur: okuyucular yarım JSON görmez
+        tmp_path = output_json_path.with_suffix(output_json_path.suffix + '.tmp')
+        try:
+            if pretty:
+                segments = [{'start': start, 'text': text, 'end': end}
+                            for start, text, end in zip(starts, texts, ends)]
+                lyrics_data = {
+                    "segments": segments
+                }
+                if ORJSON_AVAILABLE:
+                    tmp_path.write_bytes(orjson.dumps(lyrics_data, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        json.dump(lyrics_data, f, ensure_ascii=False, indent=2)
+            else:
+                _write_segments_compact(tmp_path, starts, texts, ends)
+            os.replace(tmp_path, output_json_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         logger.info(f"Lyrics converted successfully!")
-        logger.info(f"  Segments: {len(segments)}")
-        logger.info(f"  Duration: {segments[-1]['end']:.1f}s")
+        logger.info(f"  Segments: {len(starts)}")
+        logger.info(f"  Duration: {ends[-1]:.1f}s")
         logger.info(f"  Output: {output_json_path}")
 
         return output_json_path
@@ -127,21 +146,57 @@ def convert_lyrics_txt_to_json(txt_path, output_json_path=None):
         return None
 
 
-def auto_convert_lyrics_in_folder(folder_path):
+def _write_segments_compact(output_json_path, starts, texts, ends):
+    """Segmentleri tek tek kodlayıp dosyaya akıt - tüm segment listesi bellekte kurulmaz"""
+    if ORJSON_AVAILABLE:
+        with open(output_json_path, 'wb') as f:
+            f.write(b'{"segments":[')
+            for i, (start, text, end) in enumerate(zip(starts, texts, ends)):
+                if i:
+                    f.write(b',')
+                f.write(orjson.dumps({'start': start, 'text': text, 'end': end}))
+            f.write(b']}')
+    else:
+        # indent yok: json'un C hızlandırmalı encoder'ı kullanılır
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        with open(output_json_path, 'w', encoding='utf-8') as f:
+            f.write('{"segments":[')
+            for i, (start, text, end) in enumerate(zip(starts, texts, ends)):
+                if i:
+                    f.write(',')
+                f.write(encode({'start': start, 'text': text, 'end': end}))
+            f.write(']}')
+
+
+def _needs_rebuild(src_mtime, dst):
+    """Hedef yoksa ya da kaynaktan (src_mtime) eskiyse True"""
+    try:
+        return dst.stat().st_mtime < src_mtime
+    except FileNotFoundError:
+        return True
+
+
+def auto_convert_lyrics_in_folder(folder_path, force=False):
     """
     Automatically convert all *_lyrics.txt files in a folder to JSON
 
     Args:
         folder_path: Path to folder containing lyrics files
+        force: JSON güncel olsa bile yeniden dönüştür
 
     Returns:
-        List of created JSON file paths
+        List of created (or already up-to-date) JSON file paths
     """
     folder_path = Path(folder_path)
     created_files = []
 
-    # Find all *_lyrics.txt files
-    lyrics_files = list(folder_path.glob("*_lyrics.txt"))
+    # Find all *_lyrics.txt files - tek scandir geçişi, DirEntry stat'ı mtime karşılaştırmasında kullanılır
+    try:
+        with os.scandir(folder_path) as entries:
+            lyrics_files = [(Path(entry.path), entry.stat().st_mtime) for entry in entries
+                            if entry.name.endswith("_lyrics.txt") and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        lyrics_files = []
 
     if not lyrics_files:
         logger.info(f"No *_lyrics.txt files found in {folder_path}")
@@ -149,12 +204,24 @@ def auto_convert_lyrics_in_folder(folder_path):
 
     logger.info(f"Found {len(lyrics_files)} lyrics file(s)")
 
-    for txt_file in lyrics_files:
-        logger.info(f"\nConverting: {txt_file.name}")
-        json_path = convert_lyrics_txt_to_json(txt_file)
+    # Kaynaktan yeni JSON'u olan dosyalar yeniden dönüştürülmez (yine de kullanılabilir sayılır)
+    pending = []
+    for txt_file, txt_mtime in lyrics_files:
+        json_file = txt_file.parent / f"{txt_file.stem}.lyrics.json"
+        if force or _needs_rebuild(txt_mtime, json_file):
+            pending.append(txt_file)
+        else:
+            created_files.append(json_file)
+
+    if not pending:
+        logger.info("All lyrics JSON files are up to date")
+        return created_files
 
-        if json_path:
-            created_files.append(json_path)
+    # Dosyalar birbirinden bağımsız: okuma/yazma ve ayrıştırma thread'ler arasında örtüşür
+    with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+        for json_path in executor.map(convert_lyrics_txt_to_json, pending):
+            if json_path:
+                created_files.append(json_path)
 
     return created_files
 